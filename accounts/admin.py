@@ -1,8 +1,10 @@
 # accounts/admin.py
 from django.contrib import admin
 from django.contrib.auth.admin import UserAdmin
+from django.core.files.uploadedfile import UploadedFile
 from .models import User, Specialty
 from .forms import CustomUserCreationForm, CustomUserChangeForm
+from .images import existing_variants, schedule_variants, store_original
 
 
 @admin.register(User)
@@ -52,6 +54,19 @@ class CustomUserAdmin(UserAdmin):
     search_fields = ("username", "email", "first_name", "last_name", "code_personnel")
     list_filter = ("role", "departement", "is_active", "is_staff")
 
+    def save_model(self, request, obj, form, change):
+        # ✅ Même pipeline que l'API : original dédupliqué + avatars générés en fond
+        upload = form.cleaned_data.get("photo")
+        new_photo = "photo" in form.changed_data and isinstance(upload, UploadedFile)
+        if new_photo:
+            obj.photo = store_original(upload)
+            obj.photo_variants = existing_variants(obj.photo.name)
+        elif "photo" in form.changed_data:
+            obj.photo_variants = {}
+        super().save_model(request, obj, form, change)
+        if new_photo and not obj.photo_variants:
+            schedule_variants(obj)
+
 
 @admin.register(Specialty)
 class SpecialtyAdmin(admin.ModelAdmin):
@@ -0,0 +1,188 @@
+# accounts/images.py
+"""
+Pipeline des photos de profil.
+
+- l'original est stocké sous son hash SHA-256 : deux envois identiques
+  pointent vers le même fichier (déduplication) ;
+- les avatars carrés (tailles fixes) sont générés en JPEG + WebP dans un
+  thread de fond, après le commit, pour ne pas ralentir la requête d'upload ;
+- les noms des variantes sont mémorisés dans ``User.photo_variants`` afin que
+  les serializers construisent les URLs sans toucher au disque.
+"""
+import hashlib
+import io
+import logging
+from concurrent.futures import ThreadPoolExecutor
+
+from django.conf import settings
+from django.core.files.base import ContentFile
+from django.core.files.storage import default_storage
+from django.db import close_old_connections, transaction
+from django.utils import timezone
+from rest_framework import serializers
+
+logger = logging.getLogger(__name__)
+
+PHOTO_DIR = "profiles"
+THUMBS_DIR = f"{PHOTO_DIR}/thumbs"
+
+DEFAULT_SIZES = {"sm": 48, "md": 96, "lg": 256}
+
+# (format Pillow, extension, options d'encodage)
+VARIANT_FORMATS = (
+    ("WEBP", "webp", {"quality": 80, "method": 4}),
+    ("JPEG", "jpg", {"quality": 85, "optimize": True, "progressive": True}),
+)
+
+ORIGINAL_EXTENSIONS = {"JPEG": "jpg", "PNG": "png", "WEBP": "webp", "GIF": "gif"}
+
+_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="profile-photos")
+
+
+def avatar_sizes():
+    return getattr(settings, "PROFILE_PHOTO_SIZES", DEFAULT_SIZES)
+
+
+# -----------------------
+# Original (dédupliqué)
+# -----------------------
+def store_original(upload):
+    """Enregistre l'upload sous ``profiles/<sha256>.<ext>`` et renvoie son nom."""
+    digest = hashlib.sha256()
+    for chunk in upload.chunks():
+        digest.update(chunk)
+    upload.seek(0)
+
+    # Pillow importé au premier upload, pas au démarrage des workers
+    from PIL import Image, UnidentifiedImageError
+
+    try:
+        with Image.open(upload) as img:
+            fmt = img.format
+    except UnidentifiedImageError:
+        raise serializers.ValidationError({"photo": "Image invalide."})
+    upload.seek(0)
+
+    ext = ORIGINAL_EXTENSIONS.get(fmt, "jpg")
+    name = f"{PHOTO_DIR}/{digest.hexdigest()}.{ext}"
+    if not default_storage.exists(name):
+        name = default_storage.save(name, upload)
+    return name
+
+
+# -----------------------
+# Variantes (avatars)
+# -----------------------
+def _variant_name(digest, px, ext):
+    return f"{THUMBS_DIR}/{digest}-{px}.{ext}"
+
+
+def _digest_of(name):
+    return name.rsplit("/", 1)[-1].split(".", 1)[0]
+
+
+def _flatten(img, fmt):
+    """JPEG ne gère pas la transparence : on aplatit sur fond blanc."""
+    if fmt != "JPEG":
+        return img if img.mode in ("RGB", "RGBA") else img.convert("RGBA")
+    if img.mode in ("RGBA", "LA", "P"):
+        from PIL import Image
+
+        rgba = img.convert("RGBA")
+        background = Image.new("RGB", rgba.size, (255, 255, 255))
+        background.paste(rgba, mask=rgba.getchannel("A"))
+        return background
+    return img.convert("RGB")
+
+
+def existing_variants(name):
+    """Variantes déjà présentes pour ce fichier (upload dédupliqué), sinon {}."""
+    digest = _digest_of(name)
+    variants = {}
+    for label, px in avatar_sizes().items():
+        entry = {ext: _variant_name(digest, px, ext) for _, ext, _ in VARIANT_FORMATS}
+        if not all(default_storage.exists(v) for v in entry.values()):
+            return {}
+        variants[label] = entry
+    return variants
+
+
+def generate_variants(name):
+    """Génère les avatars carrés de ``name`` et renvoie ``{label: {ext: nom}}``."""
+    from PIL import Image, ImageOps
+
+    digest = _digest_of(name)
+    with default_storage.open(name, "rb") as fh:
+        with Image.open(fh) as src:
+            img = ImageOps.exif_transpose(src)
+            img.load()
+
+    variants = {}
+    for label, px in avatar_sizes().items():
+        thumb = ImageOps.fit(img, (px, px), Image.Resampling.LANCZOS)
+        entry = {}
+        for fmt, ext, options in VARIANT_FORMATS:
+            vname = _variant_name(digest, px, ext)
+            if not default_storage.exists(vname):
+                buf = io.BytesIO()
+                _flatten(thumb, fmt).save(buf, fmt, **options)
+                vname = default_storage.save(vname, ContentFile(buf.getvalue()))
+            entry[ext] = vname
+        variants[label] = entry
+    return variants
+
+
+def _build_variants(user_id, name):
+    from .models import User
+
+    close_old_connections()
+    try:
+        variants = generate_variants(name)
+        # on ne met à jour que si la photo n'a pas changé entre-temps ;
+        # updated_at : fait avancer l'ETag de /api/bootstrap/ (vignettes des médecins)
+        User.objects.filter(pk=user_id, photo=name).update(photo_variants=variants, updated_at=timezone.now())
+    except Exception:
+        logger.exception("Échec de génération des avatars pour %s", name)
+    finally:
+        close_old_connections()
+
+
+def schedule_variants(user):
+    name = user.photo.name
+    if getattr(settings, "PROFILE_PHOTO_ASYNC", True):
+        transaction.on_commit(lambda: _executor.submit(_build_variants, user.pk, name))
+    else:
+        transaction.on_commit(lambda: _build_variants(user.pk, name))
+
+
+# -----------------------
+# Point d'entrée
+# -----------------------
+def set_profile_photo(user, upload):
+    """Remplace (ou retire si ``upload`` est vide) la photo de ``user``."""
+    if not upload:
+        user.photo = None
+        user.photo_variants = {}
+        user.save(update_fields=["photo", "photo_variants", "updated_at"])
+        return user
+
+    name = store_original(upload)
+    user.photo = name
+    user.photo_variants = existing_variants(name)
+    user.save(update_fields=["photo", "photo_variants", "updated_at"])
+    if not user.photo_variants:
+        schedule_variants(user)
+    return user
+
+
+def photo_thumbs(user, request=None):
+    """URLs par taille (``{"sm": {"webp": url, "jpg": url}, ...}``) ou None."""
+    variants = getattr(user, "photo_variants", None)
+    if not variants or not user.photo:
+        return None
+
+    def _url(vname):
+        url = default_storage.url(vname)
+        return request.build_absolute_uri(url) if request else url
+
+    return {label: {ext: _url(v) for ext, v in entry.items()} for label, entry in variants.items()}
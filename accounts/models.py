@@ -56,10 +56,15 @@ class User(AbstractUser):
 
     # ---------- Médias ----------
     photo = models.ImageField(upload_to="profiles/", blank=True, null=True)
+    # Noms des avatars générés ({"sm": {"webp": ..., "jpg": ...}, ...}), cf. accounts/images.py
+    photo_variants = models.JSONField(default=dict, blank=True, editable=False)
 
     # ---------- Notifications ----------
     notifications = models.JSONField(default=dict, blank=True)
 
+    # nom / spécialité affichés dans les rendez-vous : entre dans leur ETag (core/conditional.py)
+    updated_at = models.DateTimeField(auto_now=True)
+
     def save(self, *args, **kwargs):
         # Normalisation rôle (sécurité)
         if self.role:
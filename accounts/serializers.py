@@ -3,26 +3,37 @@ from django.contrib.auth import authenticate
 from rest_framework import serializers
 from rest_framework_simplejwt.tokens import RefreshToken
 from .models import User, Specialty  # Ajout de Specialty import
+from .images import photo_thumbs, set_profile_photo
+from core.i18n import BilingualField, bilingual
+from core.refdata import get_snapshot
+from core.sparse import SparseFieldsMixin
+
+
+def _specialite_payload(specialite_id):
+    spec = get_snapshot().get("specialties", specialite_id) if specialite_id else None
+    if not spec:
+        return None
+    return {
+        "id": spec.id,
+        "name": bilingual(spec, fallback=False),
+        "name_fr": spec.name_fr,
+        "name_en": spec.name_en,
+    }
+
 
 # ---------- Auth / Me ----------
-class SpecialtySerializer(serializers.ModelSerializer):
-    name = serializers.SerializerMethodField()
+class SpecialtySerializer(SparseFieldsMixin, serializers.ModelSerializer):
+    name = BilingualField(fallback=False)
 
     class Meta:
         model = Specialty
         fields = ["id", "name_fr", "name_en", "name"]
 
-    def get_name(self, obj):
-        request = self.context.get("request")
-        lang = "fr"
-        if request:
-            lang = request.headers.get("Accept-Language", "fr").lower()
-        return obj.name_en if lang.startswith("en") else obj.name_fr
-
 class MeSerializer(serializers.ModelSerializer):
     full_name = serializers.SerializerMethodField()
     role = serializers.SerializerMethodField()
     photo_url = serializers.SerializerMethodField()
+    photo_thumbs = serializers.SerializerMethodField()
     specialite = serializers.SerializerMethodField()
 
     class Meta:
@@ -32,10 +43,19 @@ class MeSerializer(serializers.ModelSerializer):
             "role", "full_name", "langue", "theme",
             "telephone", "specialite", "departement",
             "licence_medicale", "date_adhesion", "poste",
-            "photo", "photo_url", "is_active",
+            "photo", "photo_url", "photo_thumbs", "is_active",
             "notifications",
         )
 
+    def update(self, instance, validated_data):
+        # La photo passe par le pipeline (hash + avatars), pas par l'écriture directe du FileField
+        has_photo = "photo" in validated_data
+        photo = validated_data.pop("photo", None)
+        instance = super().update(instance, validated_data)
+        if has_photo:
+            set_profile_photo(instance, photo)
+        return instance
+
     def get_full_name(self, obj):
         return f"{obj.first_name} {obj.last_name}".strip()
 
@@ -48,22 +68,11 @@ class MeSerializer(serializers.ModelSerializer):
             return request.build_absolute_uri(obj.photo.url) if request else obj.photo.url
         return None
 
-    def get_specialite(self, obj):
-        if not obj.specialite:
-            return None
-
-        request = self.context.get("request")
-        lang = "fr"
-        if request:
-            lang = request.headers.get("Accept-Language", "fr").lower()
+    def get_photo_thumbs(self, obj):
+        return photo_thumbs(obj, self.context.get("request"))
 
-        spec = obj.specialite
-        return {
-            "id": spec.id,
-            "name": spec.name_en if lang.startswith("en") else spec.name_fr,
-            "name_fr": spec.name_fr,
-            "name_en": spec.name_en,
-        }
+    def get_specialite(self, obj):
+        return _specialite_payload(obj.specialite_id)
 
 
 # ---------- Token (Login) ----------
@@ -106,17 +115,19 @@ class TokenObtainWithRoleSerializer(serializers.Serializer):
 
 # ---------- Users CRUD ----------
 # ---------- Users CRUD ----------
-class UserListSerializer(serializers.ModelSerializer):
+class UserListSerializer(SparseFieldsMixin, serializers.ModelSerializer):
     role = serializers.SerializerMethodField()
     full_name = serializers.SerializerMethodField()
     specialite = serializers.SerializerMethodField()
+    photo_thumbs = serializers.SerializerMethodField()
 
     class Meta:
         model = User
         fields = (
             "id", "username", "email", "first_name", "last_name",
-            "role", "full_name", "specialite", "departement", "photo"
+            "role", "full_name", "specialite", "departement", "photo", "photo_thumbs"
         )
+        expandable = {"specialite": "specialite_id"}
 
     def get_role(self, obj):
         return (obj.role or "").upper()
@@ -124,22 +135,11 @@ class UserListSerializer(serializers.ModelSerializer):
     def get_full_name(self, obj):
         return f"{obj.first_name} {obj.last_name}".strip()
 
-    def get_specialite(self, obj):
-        if not obj.specialite:
-            return None
-
-        request = self.context.get("request")
-        lang = "fr"
-        if request:
-            lang = request.headers.get("Accept-Language", "fr").lower()
+    def get_photo_thumbs(self, obj):
+        return photo_thumbs(obj, self.context.get("request"))
 
-        spec = obj.specialite
-        return {
-            "id": spec.id,
-            "name": spec.name_en if lang.startswith("en") else spec.name_fr,
-            "name_fr": spec.name_fr,
-            "name_en": spec.name_en,
-        }
+    def get_specialite(self, obj):
+        return _specialite_payload(obj.specialite_id)
 
 
 
@@ -152,7 +152,7 @@ class UserCreateSerializer(serializers.ModelSerializer):
         fields = (
             "username", "email", "first_name", "last_name",
             "role", "code_personnel",
-            "departement", "specialite_fr", "specialite_en",
+            "departement", "specialite",
             "password",
         )
 
@@ -189,43 +189,34 @@ class UserUpdateSerializer(serializers.ModelSerializer):
         model = User
         fields = (
             "email", "first_name", "last_name",
-            "telephone", "specialite_fr", "specialite_en", "departement",
+            "telephone", "specialite", "departement",
             "licence_medicale", "date_adhesion", "poste",
             "langue", "theme", "notifications", "is_active",
         )
 
 
 # ---------- Lookups (Médecins pour calendrier / notifs) ----------
-class PhysicianLookupSerializer(serializers.ModelSerializer):
+class PhysicianLookupSerializer(SparseFieldsMixin, serializers.ModelSerializer):
     full_name = serializers.SerializerMethodField()
     specialite = serializers.SerializerMethodField()
+    photo_thumbs = serializers.SerializerMethodField()
 
     class Meta:
         model = User
         fields = (
             "id", "email", "first_name", "last_name",
-            "full_name", "specialite", "departement", "photo"
+            "full_name", "specialite", "departement", "photo", "photo_thumbs"
         )
+        expandable = {"specialite": "specialite_id"}
 
     def get_full_name(self, obj):
         return f"{obj.first_name} {obj.last_name}".strip()
 
-    def get_specialite(self, obj):
-        if not obj.specialite:
-            return None
-
-        request = self.context.get("request")
-        lang = "fr"
-        if request:
-            lang = request.headers.get("Accept-Language", "fr").lower()
+    def get_photo_thumbs(self, obj):
+        return photo_thumbs(obj, self.context.get("request"))
 
-        spec = obj.specialite
-        return {
-            "id": spec.id,
-            "name": spec.name_en if lang.startswith("en") else spec.name_fr,
-            "name_fr": spec.name_fr,
-            "name_en": spec.name_en,
-        }
+    def get_specialite(self, obj):
+        return _specialite_payload(obj.specialite_id)
 
 
 # ---------- Upload photo ----------
@@ -0,0 +1,46 @@
+# accounts/tests/test_profile_photos.py
+import io
+
+import pytest
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.urls import reverse
+from PIL import Image
+
+from accounts.models import User
+
+
+def _png(color="red", size=(400, 300)):
+    buf = io.BytesIO()
+    Image.new("RGBA", size, color).save(buf, "PNG")
+    return SimpleUploadedFile("avatar.png", buf.getvalue(), content_type="image/png")
+
+
+@pytest.fixture(autouse=True)
+def media(settings, tmp_path):
+    settings.MEDIA_ROOT = tmp_path
+    settings.PROFILE_PHOTO_ASYNC = False
+
+
+@pytest.mark.django_db(transaction=True)
+def test_photo_upload_is_deduplicated_and_thumbnailed(api, tmp_path):
+    doc = User.objects.create_user(username="dr", role="medecin", code_personnel="M1")
+
+    url = reverse("users-photo", args=[doc.id])
+    assert api.post(url, {"photo": _png()}, format="multipart").status_code == 200
+    first = User.objects.get(pk=doc.pk)
+    assert api.post(url, {"photo": _png()}, format="multipart").status_code == 200
+    second = User.objects.get(pk=doc.pk)
+
+    # même contenu → même fichier
+    assert first.photo.name == second.photo.name
+    assert len(list((tmp_path / "profiles").glob("*.png"))) == 1
+
+    assert set(second.photo_variants) == {"sm", "md", "lg"}
+    with Image.open(tmp_path / second.photo_variants["sm"]["webp"]) as img:
+        assert img.size == (48, 48)
+        assert img.format == "WEBP"
+
+    res = api.get(reverse("physicians"))
+    thumbs = res.data[0]["photo_thumbs"]
+    assert thumbs["md"]["jpg"].endswith("-96.jpg")
+    assert thumbs["md"]["webp"].endswith("-96.webp")
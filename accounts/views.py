@@ -17,6 +17,7 @@ from .serializers import (
     PhotoUploadSerializer,
 )
 from .permissions import IsDirection, IsDirectionOrSecretaire, IsMedecin
+from .images import photo_thumbs, set_profile_photo
 from .models import User, Specialty
 from .serializers import (
     TokenObtainWithRoleSerializer, MeSerializer, UserListSerializer,
@@ -25,11 +26,18 @@ from .serializers import (
 )
 
 from rest_framework import viewsets, permissions
+from core.eager import AutoEagerLoadMixin
+from core.refdata import RefDataListMixin
+from core.sparse import sparse_spec
 
-class SpecialtyViewSet(viewsets.ModelViewSet):
+class SpecialtyViewSet(RefDataListMixin, viewsets.ModelViewSet):
     queryset = Specialty.objects.filter(is_active=True).order_by("name_fr")
     serializer_class = SpecialtySerializer
     permission_classes = [permissions.IsAuthenticated]
+    refdata_table = "specialties"
+
+    def filter_refdata(self, rows):
+        return [r for r in rows if r.is_active]
 # ---------- Auth ----------
 class LoginView(APIView):
     permission_classes = [permissions.AllowAny]
@@ -101,27 +109,34 @@ class MeUpdateView(generics.UpdateAPIView):
         return ctx
 
 # ---------- Physicians lookup ----------
+def physician_queryset(user):
+    """Médecins visibles par ``user`` (un médecin ne voit que lui-même)."""
+    qs = User.objects.filter(role="medecin").order_by("last_name", "first_name")
+    if user.role == "medecin":
+        qs = qs.filter(id=user.id)
+    # la spécialité est lue dans le cache des données de référence (core.refdata)
+    return qs.only(
+        "id",
+        "first_name",
+        "last_name",
+        "email",
+        "departement",
+        "photo",
+        "photo_variants",
+        "specialite",
+    )
+
+
 class PhysicianListView(generics.ListAPIView):
     permission_classes = [permissions.IsAuthenticated]
     serializer_class = PhysicianLookupSerializer
 
     def get_queryset(self):
-        qs = User.objects.filter(role="medecin").order_by("last_name", "first_name")
-        if self.request.user.role == "medecin":
-            qs = qs.filter(id=self.request.user.id)
-        return qs.select_related("specialite").only(
-    "id",
-    "first_name",
-    "last_name",
-    "email",
-    "departement",
-    "specialite__name_fr",
-    "specialite__name_en",
-)
+        return physician_queryset(self.request.user)
 
 
 # ---------- Users CRUD ----------
-class UserViewSet(viewsets.ModelViewSet):
+class UserViewSet(AutoEagerLoadMixin, viewsets.ModelViewSet):
     queryset = User.objects.all().order_by("last_name", "first_name")
     permission_classes = [permissions.IsAuthenticated]
 
@@ -146,13 +161,13 @@ class UserViewSet(viewsets.ModelViewSet):
         qs = self.get_queryset()
         if request.user.role == "medecin":
             qs = qs.filter(id=request.user.id)
-        return Response(UserListSerializer(qs, many=True).data)
+        return Response(UserListSerializer(qs, many=True, context={"sparse": sparse_spec(request)}).data)
 
     def retrieve(self, request, *args, **kwargs):
         obj = self.get_object()
         if request.user.role == "medecin" and obj.id != request.user.id:
             return Response({"detail": "Accès refusé."}, status=403)
-        return Response(UserListSerializer(obj).data)
+        return Response(UserListSerializer(obj, context={"sparse": sparse_spec(request)}).data)
 
     def perform_create(self, serializer):
         # Auto-username si non fourni (prenom.nom unique)
@@ -178,6 +193,9 @@ class UserViewSet(viewsets.ModelViewSet):
 
         ser = PhotoUploadSerializer(data=request.data)
         ser.is_valid(raise_exception=True)
-        user.photo = ser.validated_data["photo"]
-        user.save()
-        return Response({"detail": "Photo mise à jour.", "photo": user.photo.url if user.photo else None})
+        set_profile_photo(user, ser.validated_data["photo"])
+        return Response({
+            "detail": "Photo mise à jour.",
+            "photo": user.photo.url if user.photo else None,
+            "photo_thumbs": photo_thumbs(user, request),
+        })
@@ -1,5 +1,6 @@
 # appointments/admin.py
 from django.contrib import admin
+from core.refdata import admin_label
 from .models import Room, AppointmentType, Appointment
 
 @admin.register(Room)
@@ -17,8 +18,11 @@ class AppointmentTypeAdmin(admin.ModelAdmin):
 class AppointmentAdmin(admin.ModelAdmin):
     list_display = (
         "id", "patient_name", "date", "time", "status",
-        "room", "type", "doctor",
+        admin_label("rooms", "room_id", "Salle"),
+        admin_label("appointment_types", "type_id", "Type"),
+        "doctor",
     )
+    list_select_related = ("doctor",)
     list_filter = ("status", "date", "room", "type")
     search_fields = ("patient_name", "phone", "notes")
 
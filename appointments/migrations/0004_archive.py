@@ -0,0 +1,28 @@
+# Generated by Django 5.2.18 on 2026-10-19 16:54
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('appointments', '0003_remove_appointmenttype_name_appointmenttype_name_en_and_more'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ArchivedAppointment',
+            fields=[
+                ('id', models.BigIntegerField(primary_key=True, serialize=False)),
+                ('year', models.PositiveSmallIntegerField(db_index=True)),
+                ('data', models.JSONField()),
+                ('archived_at', models.DateTimeField(auto_now_add=True)),
+                ('patient_id', models.IntegerField(db_index=True, null=True)),
+                ('patient_name', models.CharField(db_index=True, max_length=120)),
+                ('doctor_id', models.IntegerField(db_index=True, null=True)),
+            ],
+            options={
+                'abstract': False,
+            },
+        ),
+    ]
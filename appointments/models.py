@@ -2,6 +2,8 @@ from django.db import models
 from django.utils import timezone
 from django.conf import settings
 
+from core.archive import ArchiveRecord
+
 
 from django.utils.translation import gettext_lazy as _
 
@@ -39,6 +41,7 @@ class Patient(models.Model):
     email = models.EmailField(blank=True, null=True)
     insurance = models.CharField(max_length=100, blank=True, null=True)
     birth_date = models.DateField(blank=True, null=True)
+    updated_at = models.DateTimeField(auto_now=True)
 
     def __str__(self):
         return f"{self.first_name} {self.last_name}".strip()
@@ -111,3 +114,21 @@ class Appointment(models.Model):
 
     def __str__(self):
         return f"{self.patient_name} - {self.date} {self.time}"
+
+
+class ArchivedAppointment(ArchiveRecord):
+    """Rendez-vous passé archivé avec sa notification d'arrivée, cf. core/archive.py."""
+    source = "appointments.Appointment"
+    date_field = "date"
+    key_fields = ("patient_id", "patient_name", "doctor_id")
+    lookups = {"patient": "patient_id", "patient_name": "patient_name__iexact", "doctor": "doctor_id"}
+
+    patient_id = models.IntegerField(null=True, db_index=True)
+    patient_name = models.CharField(max_length=120, db_index=True)
+    doctor_id = models.IntegerField(null=True, db_index=True)
+
+    @classmethod
+    def projections(cls, objs):
+        from notifications.models import ArchivedArrivalNotification
+
+        return [(ArchivedArrivalNotification, ArchivedArrivalNotification.projected_from(objs))]
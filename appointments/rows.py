@@ -0,0 +1,70 @@
+# appointments/rows.py
+"""Listes rapides (cf. core/rows.py) — parité avec ``AppointmentSerializer``."""
+from core.rows import RowSerializer, fmt_date, fmt_datetime, fmt_time, ref_labels, related_columns
+
+PATIENT_FIELDS = ("id", "first_name", "last_name", "phone", "email", "insurance", "birth_date")
+
+
+class AppointmentRows(RowSerializer):
+    columns = (
+        "id", "patient_id", *related_columns("patient", PATIENT_FIELDS[1:]),
+        "patient_name", "date", "time", "duration_minutes", "status",
+        "room_id", "type_id",
+        "doctor_id", "doctor__first_name", "doctor__last_name", "doctor__username", "physician",
+        "phone", "email", "reason", "notes", "created_at", "updated_at",
+    )
+
+    def prepare(self):
+        self.room_name = ref_labels("rooms", empty=None)
+        self.room_label = ref_labels("rooms", fallback=False, empty="-")
+        self.type_name = ref_labels("appointment_types", empty=None)
+        self.type_label = ref_labels("appointment_types", fallback=False, empty="-")
+
+    def to_row(self, v):
+        patient_id = v["patient_id"]
+        patient = None
+        if patient_id is not None:
+            patient = {
+                "id": patient_id,
+                "first_name": v["patient__first_name"],
+                "last_name": v["patient__last_name"],
+                "phone": v["patient__phone"],
+                "email": v["patient__email"],
+                "insurance": v["patient__insurance"],
+                "birth_date": fmt_date(v["patient__birth_date"]),
+            }
+
+        if v["doctor_id"]:
+            full_name = f"{v['doctor__first_name']} {v['doctor__last_name']}".strip() or v["doctor__username"]
+        else:
+            full_name = v["physician"] or None
+        # AppointmentSerializer._get_user_specialty lit user.specialty / user.profile,
+        # absents du modèle User : la spécialité sort toujours à null
+        specialty = None
+
+        room_id, type_id = v["room_id"], v["type_id"]
+        return {
+            "id": v["id"],
+            "patient": patient,
+            "patient_name": v["patient_name"],
+            "date": fmt_date(v["date"]),
+            "time": fmt_time(v["time"]),
+            "duration_minutes": v["duration_minutes"],
+            "status": v["status"],
+            "room": room_id,
+            "room_name": self.room_name(room_id),
+            "room_label": self.room_label(room_id),
+            "type": type_id,
+            "type_name": self.type_name(type_id),
+            "type_label": self.type_label(type_id),
+            "doctor": v["doctor_id"],
+            "doctor_full_name": full_name,
+            "doctor_specialty": specialty,
+            "physician_display": f"{full_name or ''} — {specialty or ''}".strip(" —") or "-",
+            "phone": v["phone"],
+            "email": v["email"],
+            "reason": v["reason"],
+            "notes": v["notes"],
+            "created_at": fmt_datetime(v["created_at"]),
+            "updated_at": fmt_datetime(v["updated_at"]),
+        }
@@ -1,85 +1,71 @@
+import logging
+
 from rest_framework import serializers
 from .models import Room, AppointmentType, Appointment, Patient
 from django.db import models
-from django.utils.translation import get_language
+from core.i18n import BilingualField, ChoiceLabelField, LabelTable
+from core.refdata import RefLabelField
+from core.sparse import SparseFieldsMixin
+
+logger = logging.getLogger(__name__)
+
+
+ROOM_STATUS_LABELS = LabelTable({
+    "available": ("Disponible", "Available"),
+    "occupied": ("Occupée", "Occupied"),
+    "cleaning": ("Nettoyage", "Cleaning"),
+    "maintenance": ("Maintenance", "Maintenance"),
+})
 
 
 # ----------------------------
 # 🔹 Room
 # ----------------------------
-class RoomSerializer(serializers.ModelSerializer):
-    name = serializers.SerializerMethodField()
-    status_label = serializers.SerializerMethodField()
+class RoomSerializer(SparseFieldsMixin, serializers.ModelSerializer):
+    name = BilingualField(fallback=False)
+    status_label = ChoiceLabelField(ROOM_STATUS_LABELS, source="status")
 
     class Meta:
         model = Room
         fields = ["id", "name", "status", "status_label"]
 
-    def get_name(self, obj):
-        request = self.context.get("request")
-        lang = "fr"
-        if request:
-            lang = request.headers.get("Accept-Language", "fr").lower()
-
-        return obj.name_en if lang.startswith("en") else obj.name_fr
-
-    def get_status_label(self, obj):
-        request = self.context.get("request")
-        lang = "fr"
-        if request:
-            lang = request.headers.get("Accept-Language", "fr").lower()
-
-        translations = {
-            "available": {"fr": "Disponible", "en": "Available"},
-            "occupied": {"fr": "Occupée", "en": "Occupied"},
-            "cleaning": {"fr": "Nettoyage", "en": "Cleaning"},
-            "maintenance": {"fr": "Maintenance", "en": "Maintenance"},
-        }
-        return translations.get(obj.status, {}).get(lang[:2], obj.status)
-
 
 # ----------------------------
 # 🔹 Appointment Type
 # ----------------------------
-class AppointmentTypeSerializer(serializers.ModelSerializer):
-    name = serializers.SerializerMethodField()
+class AppointmentTypeSerializer(SparseFieldsMixin, serializers.ModelSerializer):
+    name = BilingualField(fallback=False)
 
     class Meta:
         model = AppointmentType
         fields = ["id", "name"]
 
-    def get_name(self, obj):
-        request = self.context.get("request")
-        lang = "fr"
-        if request:
-            lang = request.headers.get("Accept-Language", "fr").lower()
-        return obj.name_en if lang.startswith("en") else obj.name_fr
-
 
 # ----------------------------
 # 🔹 Patient
 # ----------------------------
-class PatientSerializer(serializers.ModelSerializer):
+class PatientSerializer(SparseFieldsMixin, serializers.ModelSerializer):
     class Meta:
         model = Patient
-        fields = "__all__"
+        fields = ["id", "first_name", "last_name", "phone", "email", "insurance", "birth_date"]
 
 
 # ----------------------------
 # 🔹 Appointment
 # ----------------------------
-class AppointmentSerializer(serializers.ModelSerializer):
+class AppointmentSerializer(SparseFieldsMixin, serializers.ModelSerializer):
     # champs additionnels pour le front
-    room_name = serializers.CharField(source="room.name", read_only=True)
-    type_name = serializers.CharField(source="type.name", read_only=True)
+    # (Room / AppointmentType n'ont plus de champ ``name`` depuis la migration 0002)
+    room_name = RefLabelField("rooms", source="room_id", empty=None)
+    type_name = RefLabelField("appointment_types", source="type_id", empty=None)
     doctor_full_name = serializers.SerializerMethodField()
     doctor_specialty = serializers.SerializerMethodField()
     physician_display = serializers.SerializerMethodField()
     patient = PatientSerializer(read_only=True)
 
     # ✅ Champs multilingues pour export / mobile
-    room_label = serializers.SerializerMethodField()
-    type_label = serializers.SerializerMethodField()
+    room_label = RefLabelField("rooms", source="room_id", fallback=False, empty="-")
+    type_label = RefLabelField("appointment_types", source="type_id", fallback=False, empty="-")
 
     class Meta:
         model = Appointment
@@ -102,6 +88,9 @@ class AppointmentSerializer(serializers.ModelSerializer):
             "doctor_specialty",
             "physician_display",
         ]
+        # lu par les SerializerMethodField doctor_* (cf. core/eager.py)
+        select_related = {"doctor": ("doctor_full_name", "doctor_specialty", "physician_display")}
+        expandable = {"patient": "patient_id"}
 
     # -----------------------
     # Méthodes utilitaires
@@ -141,22 +130,6 @@ class AppointmentSerializer(serializers.ModelSerializer):
         spec = self.get_doctor_specialty(obj) or ""
         return f"{full} — {spec}".strip(" —") or "-"
 
-    # ✅ Label multilingue salle
-    def get_room_label(self, obj):
-        if not obj.room:
-            return "-"
-        request = self.context.get("request")
-        lang = request.headers.get("Accept-Language", "fr").lower() if request else "fr"
-        return obj.room.name_en if lang.startswith("en") else obj.room.name_fr
-
-    # ✅ Label multilingue type d’intervention
-    def get_type_label(self, obj):
-        if not obj.type:
-            return "-"
-        request = self.context.get("request")
-        lang = request.headers.get("Accept-Language", "fr").lower() if request else "fr"
-        return obj.type.name_en if lang.startswith("en") else obj.type.name_fr
-
     # -----------------------
     # Création avec mappage automatique
     # -----------------------
@@ -170,8 +143,8 @@ class AppointmentSerializer(serializers.ModelSerializer):
             ).first()
             if doctor:
                 validated_data["doctor"] = doctor
-                print(f"✅ Docteur associé automatiquement : {doctor}")
+                logger.debug("Médecin %s associé automatiquement au RDV", doctor.pk)
 
         instance = super().create(validated_data)
-        print(f"📅 RDV créé pour {instance.patient_name} ({instance.type}) → médecin={instance.doctor}")
+        logger.info("RDV %s créé (type=%s, médecin=%s)", instance.pk, instance.type_id, instance.doctor_id)
         return instance
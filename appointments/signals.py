@@ -1,3 +1,5 @@
+import logging
+
 from django.db.models.signals import post_save
 from django.dispatch import receiver
 from django.utils import timezone
@@ -6,7 +8,7 @@ from django.contrib.auth import get_user_model
 from .models import Appointment
 from notifications.models import ArrivalNotification
 
-print("📡 Signal Appointment → ArrivalNotification bien importé ✅")
+logger = logging.getLogger(__name__)
 
 User = get_user_model()
 
@@ -26,8 +28,6 @@ def _combine_date_time(d, t):
 
 @receiver(post_save, sender=Appointment)
 def appointment_to_arrival(sender, instance: Appointment, created, **kwargs):
-    print(f"🚀 Signal déclenché → created={created}, doctor={instance.doctor}")
-
     if not created or not instance.doctor:
         return
 
@@ -45,4 +45,4 @@ def appointment_to_arrival(sender, instance: Appointment, created, **kwargs):
         created_by=None,
     )
 
-    print(f"✅ Notification créée pour {instance.doctor.email} ({instance.patient_name})")
+    logger.info("Notification d'arrivée créée pour le RDV %s (médecin %s)", instance.pk, instance.doctor_id)
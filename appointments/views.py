@@ -3,7 +3,16 @@ from rest_framework import viewsets, filters
 from rest_framework.permissions import AllowAny  # ou IsAuthenticatedOrReadOnly
 from django_filters.rest_framework import DjangoFilterBackend
 
-from .models import Room, AppointmentType, Appointment
+from core.archive import ArchiveReadMixin
+from core.asyncviews import AsyncListMixin
+from core.conditional import ConditionalGetMixin
+from core.eager import AutoEagerLoadMixin
+from core.refdata import RefDataListMixin, get_snapshot
+from core.routing import ReplicaReadMixin
+from core.rows import FastListMixin
+from core.streaming import StreamingListMixin
+from .models import Room, AppointmentType, Appointment, ArchivedAppointment
+from .rows import AppointmentRows
 from .serializers import (
     RoomSerializer,
     AppointmentTypeSerializer,
@@ -14,15 +23,11 @@ from .serializers import (
 # ---------------------------
 # 🔹 Salles
 # ---------------------------
-class RoomViewSet(viewsets.ModelViewSet):
+class RoomViewSet(RefDataListMixin, viewsets.ModelViewSet):
     queryset = Room.objects.all().order_by("id")
     serializer_class = RoomSerializer
     permission_classes = [AllowAny]
-
-    def get_serializer_context(self):
-        ctx = super().get_serializer_context()
-        ctx["request"] = self.request  # ✅ indispensable pour détecter Accept-Language
-        return ctx
+    refdata_table = "rooms"
 
 from .models import Patient
 from .serializers import PatientSerializer
@@ -31,17 +36,13 @@ from rest_framework.permissions import AllowAny
 # ---------------------------
 # 🔹 Types de rendez-vous
 # ---------------------------
-class AppointmentTypeViewSet(viewsets.ModelViewSet):
+class AppointmentTypeViewSet(RefDataListMixin, viewsets.ModelViewSet):
     queryset = AppointmentType.objects.all().order_by("id")
     serializer_class = AppointmentTypeSerializer
     permission_classes = [AllowAny]
+    refdata_table = "appointment_types"
 
-    def get_serializer_context(self):
-        ctx = super().get_serializer_context()
-        ctx["request"] = self.request  # ✅ pour lire Accept-Language
-        return ctx
-
-class PatientViewSet(viewsets.ModelViewSet):
+class PatientViewSet(StreamingListMixin, viewsets.ModelViewSet):
     queryset = Patient.objects.all().order_by("last_name")
     serializer_class = PatientSerializer
     permission_classes = [AllowAny]
@@ -49,10 +50,14 @@ class PatientViewSet(viewsets.ModelViewSet):
 # ---------------------------
 # 🔹 Rendez-vous
 # ---------------------------
-from django.db.models import Q
-
-class AppointmentViewSet(viewsets.ModelViewSet):
+class AppointmentViewSet(
+    ReplicaReadMixin, ArchiveReadMixin, AsyncListMixin, ConditionalGetMixin, AutoEagerLoadMixin,
+    StreamingListMixin, FastListMixin, viewsets.ModelViewSet,
+):
     serializer_class = AppointmentSerializer
+    row_serializer_class = AppointmentRows
+    archive_model = ArchivedAppointment
+    validator_relations = ("patient", "doctor")
     permission_classes = [AllowAny]
 
     filter_backends = [DjangoFilterBackend, filters.OrderingFilter]
@@ -67,11 +72,9 @@ class AppointmentViewSet(viewsets.ModelViewSet):
     ordering = ["-date", "-time", "-id"]
 
     def get_queryset(self):
-        qs = (
-            Appointment.objects
-            .select_related("room", "type", "doctor")
-            .order_by("-date", "-time", "-id")
-        )
+        # salle / type : libellés lus dans le cache des données de référence ;
+        # patient / médecin : jointures ajoutées par AutoEagerLoadMixin
+        qs = Appointment.objects.order_by("-date", "-time", "-id")
 
         params = self.request.query_params
         date_after = params.get("date_after")
@@ -88,10 +91,7 @@ class AppointmentViewSet(viewsets.ModelViewSet):
             if intervention.isdigit():
                 qs = qs.filter(type_id=intervention)
             else:
-                qs = qs.filter(
-                    Q(type__name_fr__icontains=intervention)
-                    | Q(type__name_en__icontains=intervention)
-                )
+                qs = qs.filter(type_id__in=get_snapshot().find_ids("appointment_types", intervention))
 
         return qs
 
@@ -12,5 +12,13 @@ import os
 from django.core.asgi import get_asgi_application
 
 os.environ.setdefault("DJANGO_SETTINGS_MODULE", "clinic_backend.settings")
+# lu par core.db.database_config (pas de connexions persistantes sous ASGI)
+os.environ.setdefault("DJANGO_ASGI", "1")
 
 application = get_asgi_application()
+
+# catalogues, URL, données de référence… chargés avant la première requête
+# (dans le master gunicorn avec preload_app, cf. core/startup.py)
+from core.startup import warm_up  # noqa: E402
+
+warm_up()
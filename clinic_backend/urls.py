@@ -1,19 +1,21 @@
 # clinic_backend/urls.py
 from django.contrib import admin
 from django.urls import path, include, re_path
-from drf_spectacular.views import SpectacularAPIView, SpectacularSwaggerView
-from django.views.generic import TemplateView
 from django.conf import settings
-from django.conf.urls.static import static
+from core.media import serve_media
+from core.spa import SPAView
+from core.views import BootstrapView, DocsView, PerfStatsView, SchemaView
 
 urlpatterns = [
     path("admin/", admin.site.urls),
 
-    # OpenAPI + Swagger
-    path("api/schema/", SpectacularAPIView.as_view(), name="schema"),
-    path("api/docs/", SpectacularSwaggerView.as_view(url_name="schema"), name="docs"),
+    # OpenAPI + Swagger (schéma précalculé : python manage.py build_schema)
+    path("api/schema/", SchemaView.as_view(), name="schema"),
+    path("api/docs/", DocsView.as_view(url_name="schema"), name="docs"),
 
     # === API ===
+    path("api/bootstrap/", BootstrapView.as_view(), name="bootstrap"),
+    path("api/_perf/", PerfStatsView.as_view(), name="perf-stats"),
     path("api/accounts/", include("accounts.urls")),
     path("api/", include("appointments.urls")),
     path("api/", include("referrals.urls")),
@@ -21,12 +23,13 @@ urlpatterns = [
     path("api/whatsapp/", include("whatsapp.urls")),
 ]
 
-# ✅ Servir les fichiers MEDIA en mode développement
-if settings.DEBUG:
-    urlpatterns += static(settings.MEDIA_URL, document_root=settings.MEDIA_ROOT)
+# ✅ Fichiers MEDIA (photos de profil…) : ETag, Range, sendfile (cf. core/media.py)
+urlpatterns += [
+    re_path(rf"^{settings.MEDIA_URL.lstrip('/')}(?P<path>.+)$", serve_media, name="media"),
+]
 
-# ✅ Catch-all SPA (React)
+# ✅ Catch-all SPA (React) : index.html gardé en mémoire (cf. core/spa.py)
 # ⚠️ toujours à la fin !
 urlpatterns += [
-    re_path(r"^(?!api/).*$", TemplateView.as_view(template_name="index.html")),
+    re_path(r"^(?!api/).*$", SPAView.as_view(), name="spa"),
 ]
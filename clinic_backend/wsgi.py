@@ -14,3 +14,8 @@ from django.core.wsgi import get_wsgi_application
 os.environ.setdefault("DJANGO_SETTINGS_MODULE", "clinic_backend.settings")
 
 application = get_wsgi_application()
+
+# catalogues, URL, données de référence… chargés avant la première requête (cf. core/startup.py)
+from core.startup import warm_up  # noqa: E402
+
+warm_up()
@@ -1,5 +1,6 @@
 // src/api/lookups.ts
 import http from "./http";
+import i18n from "../i18n";
 
 export type ApiRoom = { id: number; name: string; status?: string | null };
 export type ApiType = { id: number; name: string };
@@ -28,24 +29,55 @@ function unwrap<T>(data: any): T[] {
   return Array.isArray(data) ? data : (data?.results ?? []);
 }
 
+/* ----- BOOTSTRAP : toutes les listes en un seul appel ----- */
+export type ApiBootstrap = {
+  version: number;
+  language: string;
+  rooms: ApiRoom[];
+  appointment_types: ApiType[];
+  physicians: ApiDoctorRaw[];
+  interventions: { id: number; name: string; description: string }[];
+  urgencies: { id: number; name: string; color: string; priority: number }[];
+  specialties: { id: number; name: string; name_fr: string; name_en: string }[];
+};
+
+// Une seule requête par langue et par session (vidé à la connexion / déconnexion,
+// cf. AuthContext) ; le navigateur revalide via ETag (304)
+const bootstrapByLang = new Map<string, Promise<ApiBootstrap>>();
+
+export function loadBootstrap(): Promise<ApiBootstrap> {
+  const lang = i18n.language || "fr";
+  let pending = bootstrapByLang.get(lang);
+  if (!pending) {
+    pending = http.get<ApiBootstrap>("bootstrap/").then((res) => res.data);
+    pending.catch(() => bootstrapByLang.delete(lang));
+    bootstrapByLang.set(lang, pending);
+  }
+  return pending;
+}
+
+export function resetBootstrap() {
+  bootstrapByLang.clear();
+}
+
 /* ----- ROOMS ----- */
 export async function listRooms() {
-  const { data } = await http.get("rooms/");
-  return unwrap<ApiRoom>(data);
+  const data = await loadBootstrap();
+  return unwrap<ApiRoom>(data.rooms);
 }
 
 /* ----- TYPES DE RDV ----- */
 export async function listTypes() {
-  const { data } = await http.get("appointment-types/");
-  return unwrap<ApiType>(data);
+  const data = await loadBootstrap();
+  return unwrap<ApiType>(data.appointment_types);
 }
 
 /* ----- MEDECINS ----- */
 export async function listPhysicians() {
-  // Endpoint côté backend: /api/accounts/physicians/
-  const { data } = await http.get("/accounts/physicians/");
+  // Servi par /api/bootstrap/ (même contenu que /api/accounts/physicians/)
+  const data = await loadBootstrap();
 
-  const rows = unwrap<ApiDoctorRaw>(data);
+  const rows = unwrap<ApiDoctorRaw>(data.physicians);
 
   // Normalisation: full_name et specialty
   return rows.map<ApiDoctor>((x) => {
@@ -75,8 +107,9 @@ export type ApiInsurance = {
 };
 
 export async function listInsurances() {
-  const { data } = await http.get<ApiInsurance[]>("insurances/");
-  return data.map((i) => ({
+  // hors bootstrap (données personnelles) : endpoint dédié
+  const { data } = await http.get("insurances/");
+  return unwrap<ApiInsurance>(data).map((i) => ({
     id: i.id,
     name: i.insurance_provider.toUpperCase(), // ✅ on affiche le nom clair CNSS / AXA / CNOPS ...
   }));
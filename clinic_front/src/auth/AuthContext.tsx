@@ -6,6 +6,7 @@ import React, {
   useState,
 } from "react";
 import axios from "axios";
+import { resetBootstrap } from "../api/lookups";
 
 /* =====================================
    🔹 Types
@@ -127,6 +128,9 @@ export const AuthProvider: React.FC<{ children: React.ReactNode }> = ({
         }
       );
 
+      // listes de référence propres à l'utilisateur (médecins visibles…) : à recharger
+      resetBootstrap();
+
       if (data.access) {
         localStorage.setItem("access", data.access);
         setAccess(data.access);
@@ -160,6 +164,7 @@ export const AuthProvider: React.FC<{ children: React.ReactNode }> = ({
      🚪 LOGOUT
   ===================================== */
   const logout = () => {
+    resetBootstrap();
     setAccess(null);
     setRole(null);
     setUsername(null);
@@ -0,0 +1,29 @@
+# conftest.py
+"""Fixtures partagées des tests (core/tests, accounts/tests…)."""
+import pytest
+from rest_framework.test import APIClient
+
+
+@pytest.fixture(autouse=True)
+def no_ssl_redirect(settings):
+    # le client de test parle HTTP : pas de redirection vers HTTPS (réglage de production)
+    settings.SECURE_SSL_REDIRECT = False
+
+
+@pytest.fixture
+def anon_api():
+    return APIClient()
+
+
+@pytest.fixture
+def boss(db):
+    from accounts.models import User
+
+    return User.objects.create_user(username="boss", role="direction", is_staff=True)
+
+
+@pytest.fixture
+def api(anon_api, boss):
+    """Client API authentifié en direction (``boss``)."""
+    anon_api.force_authenticate(user=boss)
+    return anon_api
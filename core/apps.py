@@ -0,0 +1,21 @@
+# core/apps.py
+from django.apps import AppConfig
+
+
+class CoreConfig(AppConfig):
+    default_auto_field = "django.db.models.BigAutoField"
+    name = "core"
+
+    def ready(self):
+        from django.db.backends.signals import connection_created
+        from django.db.models.signals import post_delete, post_migrate, post_save
+        from .db import configure_sqlite
+        from .partitions import after_migrate
+        from .refdata import bump_version, reference_models
+
+        connection_created.connect(configure_sqlite, dispatch_uid="core-sqlite-pragmas")
+        post_migrate.connect(after_migrate, sender=self, dispatch_uid="core-partitions")
+
+        for model in reference_models():
+            post_save.connect(bump_version, sender=model, dispatch_uid=f"refdata-save-{model._meta.label}")
+            post_delete.connect(bump_version, sender=model, dispatch_uid=f"refdata-delete-{model._meta.label}")
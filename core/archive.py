@@ -0,0 +1,187 @@
+# core/archive.py
+"""
+Archivage par année des lignes closes (références, rendez-vous…).
+
+Chaque table chaude a sa table d'archive (``ArchiveRecord``) : clé primaire
+d'origine, année, colonnes de recherche indexées et ligne complète dans
+``data``. ``archive_batch`` déplace un paquet dans une transaction (copie
+puis suppression) avec ses projections (``SecretaryReferral`` d'une
+référence, notification d'arrivée d'un rendez-vous) : un arrêt en cours de
+route perd au plus le paquet en cours, relancer reprend là où on en était.
+
+Lecture : ``ArchiveReadMixin`` retrouve une ligne archivée par id (retrieve)
+ou par patient / année (``GET …/archive/``), dans le format de l'API.
+
+    python manage.py archive --until-year 2023
+"""
+import datetime
+from contextvars import ContextVar
+
+from django.apps import apps
+from django.db import DEFAULT_DB_ALIAS, models, transaction
+from django.db.models import prefetch_related_objects
+from django.http import Http404
+from django.utils import timezone
+from django.utils.translation import gettext as _
+from rest_framework.decorators import action
+from rest_framework.generics import get_object_or_404
+from rest_framework import status
+from rest_framework.response import Response
+
+from .eager import eager_paths
+from .sparse import sparse_spec
+
+_archiving = ContextVar("archiving", default=False)
+
+
+def in_progress():
+    """Vrai pendant un ``archive_batch`` (les signaux de synchro n'ont rien à faire)."""
+    return _archiving.get()
+
+
+def horizon(days=None, until_year=None):
+    """1er janvier de la première année conservée (années complètes uniquement)."""
+    if until_year is None:
+        until_year = (timezone.localdate() - datetime.timedelta(days=days)).year - 1
+    return datetime.date(until_year + 1, 1, 1)
+
+
+def _dump(obj):
+    # value_to_string : sans perte (datetime à la microseconde, décimaux…)
+    return {
+        f.attname: None if f.value_from_object(obj) is None else f.value_to_string(obj)
+        for f in obj._meta.concrete_fields
+    }
+
+
+class ArchiveRecord(models.Model):
+    """Ligne archivée : ``data`` (colonnes d'origine) + clés de recherche indexées."""
+
+    id = models.BigIntegerField(primary_key=True)  # pk d'origine
+    year = models.PositiveSmallIntegerField(db_index=True)
+    data = models.JSONField()
+    archived_at = models.DateTimeField(auto_now_add=True)
+
+    source = None  # "app.Modèle" archivé
+    date_field = None  # date qui fixe l'année et l'horizon
+    archive_when = {}  # filtre des lignes closes
+    key_fields = ()  # colonnes d'origine recopiées (indexées)
+    lookups = {}  # paramètre de ``GET …/archive/`` → colonne
+
+    class Meta:
+        abstract = True
+
+    @classmethod
+    def source_model(cls):
+        return apps.get_model(cls.source)
+
+    @classmethod
+    def candidates(cls, cutoff):
+        """Lignes chaudes à archiver avant ``cutoff`` (date)."""
+        model = cls.source_model()
+        if isinstance(model._meta.get_field(cls.date_field), models.DateTimeField):
+            cutoff = timezone.make_aware(datetime.datetime.combine(cutoff, datetime.time.min))
+        return model._base_manager.filter(**{f"{cls.date_field}__lt": cutoff}, **cls.archive_when)
+
+    @classmethod
+    def projections(cls, objs):
+        """Lignes dérivées de ``objs`` à archiver avec eux : ``[(modèle d'archive, [objets])]``."""
+        return []
+
+    @classmethod
+    def from_instance(cls, obj):
+        value = getattr(obj, cls.date_field)
+        if isinstance(value, datetime.datetime) and timezone.is_aware(value):
+            value = timezone.localtime(value)
+        return cls(
+            id=obj.pk, year=value.year, data=_dump(obj),
+            **{name: getattr(obj, name) for name in cls.key_fields},
+        )
+
+    def to_instance(self):
+        """Instance du modèle d'origine (non enregistrée en base chaude), pour les serializers."""
+        model = self.source_model()
+        obj = model(**{
+            f.attname: None if self.data.get(f.attname) is None else f.to_python(self.data[f.attname])
+            for f in model._meta.concrete_fields if f.attname in self.data
+        })
+        obj._state.adding = False
+        obj._state.db = self._state.db
+        return obj
+
+    @classmethod
+    def search(cls, params):
+        qs = cls.objects.order_by("-id")
+        for param, column in {"year": "year", **cls.lookups}.items():
+            if params.get(param):
+                qs = qs.filter(**{column: params[param]})
+        return qs
+
+
+def _move(archive_model, objs, using):
+    archive_model.objects.using(using).bulk_create(
+        [archive_model.from_instance(obj) for obj in objs], ignore_conflicts=True,
+    )
+    type(objs[0])._base_manager.using(using).filter(pk__in=[obj.pk for obj in objs]).delete()
+
+
+def archive_batch(archive_model, cutoff, batch_size=500, using=DEFAULT_DB_ALIAS):
+    """Archive un paquet (avec ses projections) ; nombre de lignes déplacées, 0 quand c'est fini."""
+    token = _archiving.set(True)
+    try:
+        with transaction.atomic(using=using):
+            candidates = archive_model.candidates(cutoff).using(using)
+            ids = list(candidates.order_by("pk").select_for_update().values_list("pk", flat=True)[:batch_size])
+            if not ids:
+                return 0
+            objs = list(candidates.filter(pk__in=ids).order_by("pk"))
+            for projection_model, rows in archive_model.projections(objs):
+                if rows:
+                    _move(projection_model, rows, using)
+            _move(archive_model, objs, using)
+            return len(objs)
+    finally:
+        _archiving.reset(token)
+
+
+class ArchiveReadMixin:
+    """
+    Viewsets : lecture des lignes archivées (``archive_model``) au format de l'API.
+
+    - ``retrieve`` d'un id absent de la table chaude : ligne archivée
+      (lecture seule, en-tête ``X-Archived``) ;
+    - ``GET …/archive/?patient=…&year=…`` : lignes archivées (un filtre au moins).
+    """
+    archive_model = None
+
+    def get_object(self):
+        try:
+            return super().get_object()
+        except Http404:
+            if self.action != "retrieve" or self.archive_model is None:
+                raise
+            pk = self.kwargs[self.lookup_url_kwarg or self.lookup_field]
+            record = get_object_or_404(self.archive_model.objects.all(), pk=pk)
+            self.archived = True
+            return record.to_instance()
+
+    def finalize_response(self, request, response, *args, **kwargs):
+        if getattr(self, "archived", False):
+            response["X-Archived"] = "1"
+        return super().finalize_response(request, response, *args, **kwargs)
+
+    @action(detail=False, methods=["get"], url_path="archive")
+    def archive(self, request, *args, **kwargs):
+        params = ("year", *self.archive_model.lookups)
+        if not any(request.query_params.get(param) for param in params):
+            return Response(
+                {"detail": _("Filtre requis : %s") % ", ".join(params)}, status=status.HTTP_400_BAD_REQUEST,
+            )
+        records = self.archive_model.search(request.query_params)
+        page = self.paginate_queryset(records)
+        objs = [record.to_instance() for record in (records if page is None else page)]
+        serializer_class = self.get_serializer_class()
+        select, prefetch = eager_paths(serializer_class, self.archive_model.source_model(), sparse_spec(request))
+        prefetch_related_objects(objs, *select, *prefetch)
+        data = self.get_serializer(objs, many=True).data
+        return self.get_paginated_response(data) if page is not None else Response(data)
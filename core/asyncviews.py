@@ -0,0 +1,173 @@
+# core/asyncviews.py
+"""
+Vues de lecture asynchrones (ASGI).
+
+Sous ASGI, Django exécute les vues synchrones dans un thread par requête,
+et une requête lente (statistiques, long-poll des notifications) garde
+son thread et sa connexion pendant toute l'attente. Les vues
+``AsyncDispatchMixin`` tournent sur la boucle : authentification et
+permissions DRF (synchrones) passent par ``sync_to_async``, les handlers
+``async def`` utilisent l'ORM async (``aaggregate``, ``async for``…) et
+l'attente d'un long-poll n'occupe ni thread ni connexion.
+
+Les actions restées synchrones (écritures, détail…) sont appelées via
+``sync_to_async`` : comportement inchangé. Sous WSGI, Django appelle la
+vue par ``async_to_sync``.
+"""
+import asyncio
+import functools
+import time
+
+from asgiref.sync import iscoroutinefunction, sync_to_async
+from django.conf import settings
+from django.db.models import Count, Max
+from rest_framework.response import Response
+
+from . import refdata
+from .conditional import etag_matches
+from .streaming import is_asgi, stream_format
+
+
+async def snapshot():
+    """Snapshot des données de référence de la requête (version vérifiée hors de la boucle)."""
+    return await sync_to_async(refdata.get_snapshot)()
+
+
+class TableWatch:
+    """
+    État global d'une table (``Max(last_modified)``, ``Count``) partagé par
+    tous les long-polls du process : une seule requête par intervalle, quel
+    que soit le nombre de clients en attente. Un client ne recalcule son
+    propre validateur que lorsque cet état change.
+    """
+
+    def __init__(self, model, field):
+        self.model = model
+        self.field = field
+        self._state = None
+        self._checked_at = 0.0
+        self._pending = None
+
+    async def _fetch(self):
+        state = await self.model._default_manager.order_by().aaggregate(last=Max(self.field), count=Count("pk"))
+        self._state, self._checked_at = state, time.monotonic()
+        return state
+
+    async def state(self, max_age):
+        if self._state is not None and time.monotonic() - self._checked_at < max_age:
+            return self._state
+        pending = self._pending
+        # une requête en cours est partagée (future liée à sa boucle)
+        if pending is None or pending.done() or pending.get_loop() is not asyncio.get_running_loop():
+            pending = self._pending = asyncio.ensure_future(self._fetch())
+        return await asyncio.shield(pending)
+
+
+_watches = {}
+
+
+def table_watch(model, field):
+    key = (model, field)
+    if key not in _watches:
+        _watches[key] = TableWatch(model, field)
+    return _watches[key]
+
+
+class AsyncDispatchMixin:
+    """``APIView.dispatch`` asynchrone ; à placer avant la vue / le viewset DRF."""
+    view_is_async = True
+
+    @classmethod
+    def as_view(cls, *args, **initkwargs):
+        view = super().as_view(*args, **initkwargs)
+        if iscoroutinefunction(view):
+            return view
+
+        # ViewSetMixin.as_view ne consulte pas view_is_async
+        async def async_view(request, *view_args, **view_kwargs):
+            return await view(request, *view_args, **view_kwargs)
+        return functools.update_wrapper(async_view, view)
+
+    async def dispatch(self, request, *args, **kwargs):
+        self.args = args
+        self.kwargs = kwargs
+        request = self.initialize_request(request, *args, **kwargs)
+        self.request = request
+        self.headers = self.default_response_headers
+
+        try:
+            await sync_to_async(self.initial)(request, *args, **kwargs)
+            if request.method.lower() in self.http_method_names:
+                handler = getattr(self, request.method.lower(), self.http_method_not_allowed)
+            else:
+                handler = self.http_method_not_allowed
+            if not iscoroutinefunction(handler):
+                handler = sync_to_async(handler)
+            response = await handler(request, *args, **kwargs)
+        except Exception as exc:
+            response = self.handle_exception(exc)
+
+        self.response = self.finalize_response(request, response, *args, **kwargs)
+        return self.response
+
+
+class AsyncListMixin(AsyncDispatchMixin):
+    """
+    ``list()`` asynchrone des viewsets ``ConditionalGetMixin`` + ``FastListMixin`` :
+    agrégat validateur par ``aaggregate``, lignes par ``RowSerializer.adata()``.
+    Streaming, ``?fields=`` / ``?expand=`` et pagination repassent par la
+    liste synchrone.
+
+    ``long_poll`` : avec ``If-None-Match`` et ``?wait=<s>``, la requête reste
+    ouverte (au plus ``LONG_POLL_MAX_WAIT`` s) jusqu'à ce que la liste change,
+    table surveillée toutes les ``LONG_POLL_INTERVAL`` s (``TableWatch``) ;
+    304 à l'échéance. Sous ASGI uniquement (en WSGI, l'attente bloquerait un
+    worker).
+    """
+    long_poll = False
+    etag_ignored_params = ("wait",)
+
+    def get_wait(self, request):
+        if not self.long_poll or not is_asgi(request) or "If-None-Match" not in request.headers:
+            return 0
+        try:
+            wait = float(request.query_params.get("wait", 0))
+        except ValueError:
+            return 0
+        return max(0.0, min(wait, getattr(settings, "LONG_POLL_MAX_WAIT", 30)))
+
+    async def alist_validators(self, request, queryset):
+        relations = self.rendered_relations(request, queryset.model)
+        state = await queryset.order_by().aaggregate(**self.list_aggregates(relations))
+        return self.list_validators(request, state, relations)
+
+    async def list(self, request, *args, **kwargs):
+        streaming = self.paginator is None and stream_format(request) is not None
+        if request.method not in ("GET", "HEAD") or streaming or not self.use_fast_list():
+            return await sync_to_async(super().list)(request, *args, **kwargs)
+
+        await snapshot()
+        # filtres django-filter : validation des ModelChoiceFilter en base
+        queryset = await sync_to_async(lambda: self.filter_queryset(self.get_queryset()))()
+        wait = self.get_wait(request)
+        if wait:
+            interval = getattr(settings, "LONG_POLL_INTERVAL", 2)
+            watch = table_watch(queryset.model, self.last_modified_field)
+            seen = await watch.state(interval)  # lu avant le validateur : aucun changement manqué
+        etag, last_modified = await self.alist_validators(request, queryset)
+
+        if wait:
+            deadline = time.monotonic() + wait
+            while (
+                etag_matches(etag, request.headers.get("If-None-Match"))
+                and (remaining := deadline - time.monotonic()) > 0
+            ):
+                await asyncio.sleep(min(interval, remaining))
+                if (state := await watch.state(interval)) != seen:
+                    seen = state
+                    etag, last_modified = await self.alist_validators(request, queryset)
+
+        rows = None
+        if not etag_matches(etag, request.headers.get("If-None-Match")):
+            rows = await self.row_serializer_class(queryset, context=self.get_serializer_context()).adata()
+        return self._conditional(request, etag, last_modified, False, lambda: Response(rows))
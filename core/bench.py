@@ -0,0 +1,77 @@
+# core/bench.py
+"""
+Outils communs aux commandes ``bench_*`` : chronométrage, percentiles et
+sortie JSON (comparables d'un run à l'autre).
+"""
+import json
+import math
+import platform
+import time
+from contextlib import contextmanager
+
+import django
+
+
+def percentile(sorted_values, pct):
+    """Percentile (interpolation linéaire) d'une liste déjà triée."""
+    if not sorted_values:
+        return None
+    k = (len(sorted_values) - 1) * pct / 100
+    lo, hi = math.floor(k), math.ceil(k)
+    if lo == hi:
+        return sorted_values[lo]
+    return sorted_values[lo] + (sorted_values[hi] - sorted_values[lo]) * (k - lo)
+
+
+def summarize(latencies, elapsed=None):
+    """Résumé d'une série de durées (secondes) en millisecondes."""
+    values = sorted(latencies)
+    ms = lambda v: None if v is None else round(v * 1000, 3)  # noqa: E731
+    summary = {
+        "count": len(values),
+        "mean_ms": ms(sum(values) / len(values)) if values else None,
+        "p50_ms": ms(percentile(values, 50)),
+        "p95_ms": ms(percentile(values, 95)),
+        "p99_ms": ms(percentile(values, 99)),
+        "max_ms": ms(values[-1]) if values else None,
+    }
+    if elapsed:
+        summary["throughput_per_s"] = round(len(values) / elapsed, 1)
+    return summary
+
+
+@contextmanager
+def timed(bucket):
+    """Ajoute la durée du bloc à la liste ``bucket``."""
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        bucket.append(time.perf_counter() - start)
+
+
+def environment():
+    return {
+        "python": platform.python_version(),
+        "django": django.get_version(),
+        "machine": platform.machine(),
+        "system": platform.system(),
+    }
+
+
+def write_results(command, name, params, results, output=None):
+    """Écrit le rapport JSON sur ``output`` (chemin) ou sur la sortie de la commande."""
+    report = {
+        "benchmark": name,
+        "params": params,
+        "environment": environment(),
+        "results": results,
+    }
+    text = json.dumps(report, indent=2, ensure_ascii=False, default=str)
+    if output:
+        with open(output, "w", encoding="utf-8") as fh:
+            fh.write(text + "\n")
+        command.stdout.write(f"Résultats écrits dans {output}")
+    else:
+        command.stdout.write(text)
+    return report
@@ -0,0 +1,95 @@
+# core/compression.py
+"""
+Compression des réponses de l'API : négociation ``Accept-Encoding`` et
+compresseurs gzip / Brotli (Brotli optionnel : paquet ``Brotli``).
+
+Utilisé par ``core.middleware.CompressionMiddleware`` et par la commande
+``bench_compression``.
+"""
+import zlib
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover - dépendance optionnelle
+    brotli = None
+
+# types compressibles (hors texte) : JSON, NDJSON, schéma OpenAPI, JS
+_COMPRESSIBLE_SUFFIXES = ("json", "javascript", "openapi", "xml", "yaml")
+
+
+def available_encodings():
+    """Encodages proposés, par ordre de préférence à qualité égale."""
+    return ("br", "gzip") if brotli is not None else ("gzip",)
+
+
+def negotiate(accept_encoding, available=None):
+    """Meilleur encodage de ``available`` accepté par le client (q > 0), sinon None."""
+    available = available or available_encodings()
+    prefs = {}
+    for part in (accept_encoding or "").split(","):
+        coding, _, params = part.partition(";")
+        coding = coding.strip().lower()
+        if not coding:
+            continue
+        q = 1.0
+        for param in params.split(";"):
+            name, _, value = param.partition("=")
+            if name.strip().lower() == "q":
+                try:
+                    q = float(value)
+                except ValueError:
+                    q = 0.0
+        prefs[coding] = q
+    best, best_q = None, 0.0
+    for coding in available:
+        q = prefs.get(coding, prefs.get("*", 0.0))
+        if q > best_q:
+            best, best_q = coding, q
+    return best
+
+
+def is_compressible(content_type):
+    ctype = (content_type or "").split(";", 1)[0].strip().lower()
+    return ctype.startswith("text/") or ctype.endswith(_COMPRESSIBLE_SUFFIXES) or ctype.endswith("ndjson")
+
+
+def compress(data, encoding, level):
+    if encoding == "br":
+        return brotli.compress(data, quality=level)
+    return zlib.compress(data, level, wbits=31)  # 16 + MAX_WBITS : en-tête gzip
+
+
+def compress_stream(chunks, encoding, level):
+    """Compression au fil de l'eau ; chaque paquet est vidé tel quel (pas d'attente du suivant)."""
+    if encoding == "br":
+        compressor = brotli.Compressor(quality=level)
+        for chunk in chunks:
+            out = compressor.process(chunk) + compressor.flush()
+            if out:
+                yield out
+        yield compressor.finish()
+        return
+    compressor = zlib.compressobj(level, zlib.DEFLATED, 31)
+    for chunk in chunks:
+        out = compressor.compress(chunk) + compressor.flush(zlib.Z_SYNC_FLUSH)
+        if out:
+            yield out
+    yield compressor.flush()
+
+
+async def acompress_stream(chunks, encoding, level):
+    """Variante de ``compress_stream`` pour les réponses en streaming asynchrones."""
+    if encoding == "br":
+        compressor = brotli.Compressor(quality=level)
+        async for chunk in chunks:
+            out = compressor.process(chunk) + compressor.flush()
+            if out:
+                yield out
+        yield compressor.finish()
+        return
+    compressor = zlib.compressobj(level, zlib.DEFLATED, 31)
+    async for chunk in chunks:
+        out = compressor.compress(chunk) + compressor.flush(zlib.Z_SYNC_FLUSH)
+        if out:
+            yield out
+    yield compressor.flush()
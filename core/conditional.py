@@ -0,0 +1,152 @@
+# core/conditional.py
+"""
+GET conditionnels (ETag / Last-Modified) pour les listes et les détails.
+
+Liste : une seule requête d'agrégat (``Max(updated_at)`` + ``Count``) sur le
+queryset filtré, et sur les objets imbriqués (``validator_relations`` :
+patient, médecin…), donne le validateur ; l'ETag (faible) est le hash de cet
+agrégat, de l'URL complète (filtres, ``?fields=``…), de la langue, de la
+version des données de référence (libellés) et de l'utilisateur. Si le
+client l'a déjà (``If-None-Match``) : 304 sans sérialiser.
+
+Détail : validateur tiré de l'objet chargé par ``get_object()`` et de ses
+objets imbriqués, ETag et ``If-Modified-Since``.
+
+Pour une liste, ``Last-Modified`` est informatif : une suppression ne
+l'avance pas, seul l'ETag (qui inclut le nombre de lignes) fait foi.
+"""
+import hashlib
+
+from django.db.models import Count, Max
+from django.http import HttpResponseNotModified
+from django.utils.cache import patch_vary_headers
+from django.utils.http import http_date, parse_http_date_safe, quote_etag
+from rest_framework.response import Response
+
+from .eager import eager_paths
+from .i18n import get_language
+from .refdata import get_snapshot
+from .sparse import sparse_spec
+
+
+def weak_etag(*parts):
+    digest = hashlib.sha1("|".join(str(p) for p in parts).encode()).hexdigest()
+    return "W/" + quote_etag(digest)
+
+
+def etag_matches(etag, header):
+    """Comparaison faible (RFC 9110 §13.1.2) d'``If-None-Match``."""
+    if not header:
+        return False
+    if header.strip() == "*":
+        return True
+    opaque = etag.removeprefix("W/")
+    return any(tag.strip().removeprefix("W/") == opaque for tag in header.split(","))
+
+
+class ConditionalGetMixin:
+    """
+    ``list()`` / ``retrieve()`` conditionnels sur ``last_modified_field``.
+
+    À placer avant ``FastListMixin`` : un 304 évite aussi la liste rapide.
+    """
+    last_modified_field = "updated_at"
+    # FK rendues dans la réponse : leur ``last_modified_field`` entre dans le validateur
+    validator_relations = ()
+    # paramètres sans effet sur le contenu (ex. ``?wait=`` du long-poll)
+    etag_ignored_params = ()
+
+    def _validator_path(self, request):
+        if not self.etag_ignored_params:
+            return request.get_full_path()
+        params = request.GET.copy()
+        for name in self.etag_ignored_params:
+            params.pop(name, None)
+        return f"{request.path}?{params.urlencode()}"
+
+    def _validator_parts(self, request):
+        user = request.user
+        return (
+            self.basename if hasattr(self, "basename") else type(self).__name__,
+            self._validator_path(request),
+            get_language(),
+            get_snapshot().version,
+            user.pk if user.is_authenticated else "-",
+        )
+
+    def _conditional(self, request, etag, last_modified, check_modified_since, render):
+        if etag_matches(etag, request.headers.get("If-None-Match")):
+            response = HttpResponseNotModified()
+        elif (
+            check_modified_since
+            and last_modified is not None
+            and "If-None-Match" not in request.headers
+            and (since := parse_http_date_safe(request.headers.get("If-Modified-Since", ""))) is not None
+            and int(last_modified.timestamp()) <= since
+        ):
+            response = HttpResponseNotModified()
+        else:
+            response = render()
+        response["ETag"] = etag
+        if last_modified is not None:
+            response["Last-Modified"] = http_date(last_modified.timestamp())
+        # propre à l'utilisateur : cache navigateur uniquement, revalidé à chaque chargement
+        response["Cache-Control"] = "private, no-cache"
+        patch_vary_headers(response, ("Accept-Language", "Authorization"))
+        return response
+
+    def rendered_relations(self, request, model):
+        """Relations de ``validator_relations`` que la réponse rend (élaguées par ``?fields=`` / ``?expand=``)."""
+        if not self.validator_relations:
+            return ()
+        select, _ = eager_paths(self.get_serializer_class(), model, sparse_spec(request))
+        return tuple(
+            name for name in self.validator_relations
+            if any(path == name or path.startswith(name + "__") for path in select)
+        )
+
+    def list_aggregates(self, relations=()):
+        """Agrégat validateur d'une liste (``last_modified``, ``count``, puis par relation rendue)."""
+        field = self.last_modified_field
+        aggregates = {"last_modified": Max(field), "count": Count("pk")}
+        for name in relations:
+            aggregates[f"{name}_last_modified"] = Max(f"{name}__{field}")
+            aggregates[f"{name}_count"] = Count(name)
+        return aggregates
+
+    def list_validators(self, request, state, relations=()):
+        """``(etag, last_modified)`` d'une liste à partir de son agrégat."""
+        stamps = [state["last_modified"], *(state[f"{name}_last_modified"] for name in relations)]
+        last_modified = max((s for s in stamps if s is not None), default=None)
+        etag = weak_etag(
+            *self._validator_parts(request), state["count"],
+            *(state[f"{name}_count"] for name in relations),
+            *(s.isoformat() if s else "-" for s in stamps),
+        )
+        return etag, last_modified
+
+    def list(self, request, *args, **kwargs):
+        if request.method not in ("GET", "HEAD"):
+            return super().list(request, *args, **kwargs)
+        queryset = self.filter_queryset(self.get_queryset())
+        relations = self.rendered_relations(request, queryset.model)
+        state = queryset.order_by().aggregate(**self.list_aggregates(relations))
+        etag, last_modified = self.list_validators(request, state, relations)
+        return self._conditional(
+            request, etag, last_modified, False, lambda: super(ConditionalGetMixin, self).list(request, *args, **kwargs),
+        )
+
+    def retrieve(self, request, *args, **kwargs):
+        instance = self.get_object()
+        field = self.last_modified_field
+        related = [getattr(instance, name) for name in self.rendered_relations(request, type(instance))]
+        stamps = [getattr(instance, field), *(getattr(obj, field) for obj in related if obj is not None)]
+        last_modified = max(stamps)
+        etag = weak_etag(
+            *self._validator_parts(request), instance.pk,
+            *(obj.pk if obj is not None else "-" for obj in related),
+            *(s.isoformat() for s in stamps),
+        )
+        return self._conditional(
+            request, etag, last_modified, True, lambda: Response(self.get_serializer(instance).data),
+        )
@@ -0,0 +1,106 @@
+# core/db.py
+"""
+Construction des réglages de connexion à partir d'une URL (``DATABASE_URL``)
+et réglages SQLite appliqués à l'ouverture de chaque connexion.
+
+Importé depuis ``settings.py`` : ne dépend d'aucune app Django.
+"""
+import os
+
+import dj_database_url
+import django
+from django.core.exceptions import ImproperlyConfigured
+
+# Valeurs par défaut de ``settings.SQLITE_PRAGMAS`` (ordre d'application)
+SQLITE_PRAGMAS = {
+    "busy_timeout": 5000,         # ms d'attente d'un verrou avant « database is locked »
+    "journal_mode": "wal",        # lecteurs et écrivain ne se bloquent plus
+    "synchronous": "normal",      # sûr en WAL, un fsync par checkpoint
+    "mmap_size": 128 * 1024 * 1024,
+    "cache_size": -20000,         # négatif = Kio (~20 Mo)
+    "temp_store": "memory",
+}
+
+
+def _env_int(name, default):
+    return int(os.getenv(name, default))
+
+
+def database_config(url=None, default=None, conn_max_age=None, pool=None, asgi=None):
+    """
+    Dict ``DATABASES[...]`` pour ``url`` (ou ``default`` si vide).
+
+    - connexions persistantes (``DB_CONN_MAX_AGE`` s, 0 = une par requête)
+      avec vérification de santé avant réutilisation ;
+    - PostgreSQL : ``statement_timeout`` (``DB_STATEMENT_TIMEOUT_MS``) et
+      pool psycopg 3 optionnel (``DB_POOL=1``), qui remplace alors les
+      connexions persistantes ;
+    - ASGI (``DJANGO_ASGI=1``, posé par ``clinic_backend/asgi.py``) : pas de
+      connexion persistante (chaque requête a son propre thread, les
+      connexions s'y accumuleraient), utiliser le pool pour les réutiliser ;
+    - SQLite : transactions ``BEGIN IMMEDIATE`` (``SQLITE_TRANSACTION_MODE``),
+      l'écrivain prend le verrou dès le début au lieu d'échouer à l'upgrade.
+    """
+    if conn_max_age is None:
+        conn_max_age = _env_int("DB_CONN_MAX_AGE", "60")
+    if pool is None:
+        pool = os.getenv("DB_POOL", "0") == "1"
+    if asgi is None:
+        asgi = os.getenv("DJANGO_ASGI", "0") == "1"
+    if asgi:
+        conn_max_age = 0
+
+    config = dj_database_url.parse(
+        url or default,
+        conn_max_age=conn_max_age,
+        conn_health_checks=True,
+    )
+    if config["ENGINE"] == "django.db.backends.postgresql":
+        options = config.setdefault("OPTIONS", {})
+        options.setdefault("connect_timeout", _env_int("DB_CONNECT_TIMEOUT", "5"))
+        options["options"] = f"-c statement_timeout={_env_int('DB_STATEMENT_TIMEOUT_MS', '15000')}"
+        if pool:
+            if django.VERSION < (5, 1):
+                raise ImproperlyConfigured("DB_POOL=1 demande Django 5.1 ou plus (pool psycopg natif).")
+            options["pool"] = {
+                "min_size": _env_int("DB_POOL_MIN", "2"),
+                "max_size": _env_int("DB_POOL_MAX", "10"),
+                "timeout": _env_int("DB_POOL_TIMEOUT", "10"),
+            }
+            config["CONN_MAX_AGE"] = 0
+    elif config["ENGINE"] == "django.db.backends.sqlite3":
+        mode = os.getenv("SQLITE_TRANSACTION_MODE", "IMMEDIATE")
+        if mode:
+            config.setdefault("OPTIONS", {})["transaction_mode"] = mode.upper()
+    return config
+
+
+def sqlite_pragmas(overrides=None):
+    """PRAGMA SQLite : défauts + variables ``SQLITE_<NOM>`` + ``overrides``."""
+    pragmas = {}
+    for name, default in SQLITE_PRAGMAS.items():
+        raw = os.getenv(f"SQLITE_{name.upper()}")
+        pragmas[name] = default if raw is None else type(default)(raw)
+    pragmas.update(overrides or {})
+    return pragmas
+
+
+def configure_sqlite(sender, connection, **kwargs):
+    """
+    Receiver ``connection_created`` : applique les PRAGMA à chaque nouvelle
+    connexion SQLite. ``DATABASES[alias]["PRAGMAS"]`` surcharge
+    ``settings.SQLITE_PRAGMAS`` pour un alias donné.
+    """
+    if connection.vendor != "sqlite":
+        return
+    from django.conf import settings
+
+    pragmas = connection.settings_dict.get("PRAGMAS")
+    if pragmas is None:
+        pragmas = getattr(settings, "SQLITE_PRAGMAS", SQLITE_PRAGMAS)
+    in_memory = connection.is_in_memory_db()
+    raw = connection.connection
+    for name, value in pragmas.items():
+        if value is None or (in_memory and name in ("journal_mode", "mmap_size")):
+            continue
+        raw.execute(f"PRAGMA {name} = {value}")
@@ -0,0 +1,181 @@
+# core/eager.py
+"""
+Chargement anticipé (select_related / prefetch_related) déduit des serializers.
+
+``eager_paths(serializer_class, model)`` parcourt les champs que le serializer
+va rendre : serializers imbriqués, ``source="a.b.c"`` pointés, champs de
+relation (hors clé primaire seule, lue sans requête). Chaque relation
+traversée donne un chemin ``select_related`` (FK / OneToOne) ou
+``prefetch_related`` (inverse / M2M, et tout ce qui est en dessous).
+
+Les accès invisibles depuis les déclarations (``SerializerMethodField``…)
+se déclarent dans le ``Meta`` du serializer ::
+
+    class Meta:
+        select_related = ("doctor",)
+        prefetch_related = ()
+
+ou, pour ne joindre que si l'un des champs qui s'en servent est rendu
+(cf. ``?fields=``, core/sparse.py) ::
+
+        select_related = {"doctor": ("doctor_full_name", "physician_display")}
+
+``AutoEagerLoadMixin`` applique ces chemins au queryset du viewset. Avec
+``EAGER_LOAD_REPORT`` (actif en DEBUG), les chemins absents du queryset écrit
+à la main sont signalés une fois par vue dans le logger ``core.eager``.
+"""
+import logging
+from functools import lru_cache
+
+from django.conf import settings
+from django.core.exceptions import FieldDoesNotExist
+from django.db.models import QuerySet
+from rest_framework import serializers
+from rest_framework.relations import ManyRelatedField, RelatedField
+
+from .sparse import sparse_spec
+
+logger = logging.getLogger(__name__)
+
+_reported = set()
+
+
+def _join(prefix, name):
+    return f"{prefix}__{name}" if prefix else name
+
+
+def _relation(model, name):
+    """Champ de relation ``name`` de ``model`` (accesseur inverse compris), sinon None."""
+    try:
+        field = model._meta.get_field(name)
+    except FieldDoesNotExist:
+        field = next(
+            (rel for rel in model._meta.related_objects if rel.get_accessor_name() == name), None
+        )
+    if field is None or not field.is_relation:
+        return None
+    # ``patient_id`` : la colonne elle-même, pas de jointure
+    if getattr(field, "attname", None) == name and field.name != name:
+        return None
+    return field
+
+
+def _hints(serializer, name):
+    """Chemins ``Meta.<name>`` à appliquer vu les champs effectivement rendus."""
+    hints = getattr(getattr(serializer, "Meta", None), name, ())
+    if isinstance(hints, dict):
+        return [path for path, used_by in hints.items() if any(f in serializer.fields for f in used_by)]
+    return list(hints)
+
+
+def _collect(serializer, model, prefix, many, select, prefetch):
+    for path in _hints(serializer, "select_related"):
+        (prefetch if many else select).add(_join(prefix, path))
+    for path in _hints(serializer, "prefetch_related"):
+        prefetch.add(_join(prefix, path))
+
+    for field in serializer.fields.values():
+        if field.write_only:
+            continue
+        if field.source == "*":
+            if isinstance(field, serializers.BaseSerializer):
+                _collect(field, model, prefix, many, select, prefetch)
+            continue
+
+        bits = field.source.split(".")
+        current, path, nested_many = model, prefix, many
+        for i, bit in enumerate(bits):
+            rel = _relation(current, bit)
+            if rel is None:
+                break
+            last = i == len(bits) - 1
+            # PrimaryKeyRelatedField : DRF lit ``<fk>_id`` sans charger l'objet
+            if last and isinstance(field, RelatedField) and field.use_pk_only_optimization():
+                break
+            path = _join(path, bit)
+            nested_many = nested_many or rel.many_to_many or rel.one_to_many
+            (prefetch if nested_many else select).add(path)
+            current = rel.related_model
+        else:
+            nested = field.child if isinstance(field, serializers.ListSerializer) else field
+            if isinstance(field, ManyRelatedField):
+                nested = field.child_relation
+            if isinstance(nested, serializers.BaseSerializer):
+                _collect(nested, current, path, nested_many, select, prefetch)
+
+
+@lru_cache(maxsize=1024)
+def eager_paths(serializer_class, model, sparse=None):
+    """
+    ``(select_related, prefetch_related)`` nécessaires pour rendre ``model``
+    avec ce serializer (élagué selon ``sparse``, cf. core/sparse.py).
+    """
+    select, prefetch = set(), set()
+    _collect(serializer_class(context={"sparse": sparse}), model, "", False, select, prefetch)
+    # ``a`` est implicite dès que ``a__b`` est demandé
+    select = {p for p in select if not any(o.startswith(p + "__") for o in select)}
+    prefetch = {p for p in prefetch if not any(o.startswith(p + "__") for o in prefetch)}
+    return tuple(sorted(select)), tuple(sorted(prefetch))
+
+
+def _is_selected(queryset, path):
+    node = queryset.query.select_related
+    if node is True:
+        return True
+    for bit in path.split("__"):
+        if not isinstance(node, dict) or bit not in node:
+            return False
+        node = node[bit]
+    return True
+
+
+def _is_prefetched(queryset, path):
+    lookups = {getattr(lookup, "prefetch_to", lookup) for lookup in queryset._prefetch_related_lookups}
+    return any(lookup == path or lookup.startswith(path + "__") for lookup in lookups)
+
+
+def eager_load(queryset, serializer_class, view=None, sparse=None):
+    """``queryset`` complété des jointures / prefetch que ``serializer_class`` va utiliser."""
+    if not isinstance(queryset, QuerySet):
+        return queryset
+    # serializers d'écriture (Serializer simple) ou d'un autre modèle : rien à déduire
+    model = getattr(getattr(serializer_class, "Meta", None), "model", None)
+    if model is None or not issubclass(queryset.model, model):
+        return queryset
+    select, prefetch = eager_paths(serializer_class, queryset.model, sparse)
+    missing_select = [p for p in select if not _is_selected(queryset, p)]
+    missing_prefetch = [p for p in prefetch if not _is_prefetched(queryset, p)]
+
+    if (missing_select or missing_prefetch) and getattr(settings, "EAGER_LOAD_REPORT", settings.DEBUG):
+        name = type(view).__name__ if view is not None else serializer_class.__name__
+        key = (name, serializer_class, tuple(missing_select), tuple(missing_prefetch))
+        if key not in _reported:
+            _reported.add(key)
+            logger.warning(
+                "%s (%s) : select_related manquant %s, prefetch_related manquant %s — ajoutés automatiquement",
+                name, serializer_class.__name__, missing_select or "-", missing_prefetch or "-",
+            )
+
+    if missing_select:
+        queryset = queryset.select_related(*missing_select)
+    if missing_prefetch:
+        queryset = queryset.prefetch_related(*missing_prefetch)
+    return queryset
+
+
+class AutoEagerLoadMixin:
+    """
+    Queryset complété d'après le serializer de l'action courante.
+
+    Appliqué dans ``get_queryset()`` et, pour les vues qui le redéfinissent,
+    dans ``filter_queryset()`` (list / retrieve) — ``eager_load`` est idempotent.
+    """
+
+    def eager_load(self, queryset):
+        return eager_load(queryset, self.get_serializer_class(), view=self, sparse=sparse_spec(self.request))
+
+    def get_queryset(self):
+        return self.eager_load(super().get_queryset())
+
+    def filter_queryset(self, queryset):
+        return self.eager_load(super().filter_queryset(queryset))
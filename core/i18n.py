@@ -0,0 +1,134 @@
+# core/i18n.py
+"""
+Langue de la requête et libellés bilingues.
+
+La langue est résolue une seule fois par ``RequestLanguageMiddleware`` ; les
+serializers la lisent ici (simple lecture d'une ContextVar) au lieu de
+re-parser ``Accept-Language`` pour chaque champ de chaque ligne.
+"""
+from contextvars import ContextVar
+from functools import lru_cache
+
+from django.conf import settings
+from django.utils import translation
+from django.utils.translation.trans_real import parse_accept_lang_header
+from rest_framework import serializers
+
+_current_language = ContextVar("request_language", default=None)
+
+
+def supported_languages():
+    return tuple(code for code, _ in settings.LANGUAGES)
+
+
+@lru_cache(maxsize=256)
+def normalize_language(raw):
+    """``"en-US,en;q=0.9"`` → ``"en"`` ; langue par défaut si rien ne correspond."""
+    supported = supported_languages()
+    for tag, _q in parse_accept_lang_header((raw or "").lower()):
+        code = tag.split("-", 1)[0]
+        if code in supported:
+            return code
+    return settings.LANGUAGE_CODE
+
+
+def resolve_language(request):
+    """``?lang=`` prioritaire, sinon l'en-tête ``Accept-Language``."""
+    return normalize_language(request.GET.get("lang") or request.headers.get("Accept-Language", ""))
+
+
+def get_language():
+    """Langue de la requête courante (ou langue Django active hors requête)."""
+    return _current_language.get() or normalize_language(translation.get_language())
+
+
+def set_language(lang):
+    return _current_language.set(lang)
+
+
+def reset_language(token):
+    _current_language.reset(token)
+
+
+# ============================================================
+# 🔹 Tables de libellés précompilées
+# ============================================================
+class LabelTable:
+    """
+    Table ``{code: (fr, en)}`` compilée en un dict par langue, pour que la
+    lecture d'un libellé se résume à ``table[lang][code]``.
+    """
+
+    def __init__(self, labels, default=None):
+        self.default = default
+        self.by_language = {
+            "fr": {code: fr for code, (fr, _en) in labels.items()},
+            "en": {code: en for code, (_fr, en) in labels.items()},
+        }
+
+    def get(self, code, lang=None):
+        table = self.by_language.get(lang or get_language(), self.by_language["fr"])
+        return table.get(code, code if self.default is None else self.default)
+
+
+# Ordre de lecture des colonnes ``*_fr`` / ``*_en``, précalculé par langue
+_COLUMN_ORDER = {"fr": ("fr", "en"), "en": ("en", "fr")}
+
+
+@lru_cache(maxsize=None)
+def bilingual_columns(field):
+    return {lang: tuple(f"{field}_{suffix}" for suffix in order) for lang, order in _COLUMN_ORDER.items()}
+
+
+def bilingual(obj, field="name", lang=None, fallback=True, empty=""):
+    """``obj.<field>_<lang>`` avec repli éventuel sur l'autre langue."""
+    if obj is None:
+        return empty
+    primary, other = bilingual_columns(field)[lang or get_language()]
+    value = getattr(obj, primary, None)
+    if fallback:
+        value = value or getattr(obj, other, None) or empty
+    return value
+
+
+# ============================================================
+# 🔹 Champs DRF
+# ============================================================
+class BilingualField(serializers.Field):
+    """
+    Champ lecture seule qui choisit ``name_fr`` / ``name_en`` selon la langue.
+
+    ``relation`` permet de lire le libellé d'un objet lié (ex. ``"room"``) et
+    ``empty`` la valeur renvoyée quand l'objet ou le libellé manque.
+    """
+
+    def __init__(self, field="name", relation=None, fallback=True, empty="", **kwargs):
+        kwargs["source"] = "*"
+        kwargs["read_only"] = True
+        super().__init__(**kwargs)
+        self.relation = relation
+        self.fallback = fallback
+        self.empty = empty
+        self.columns = bilingual_columns(field)
+
+    def to_representation(self, instance):
+        obj = getattr(instance, self.relation) if self.relation else instance
+        if obj is None:
+            return self.empty
+        primary, other = self.columns[get_language()]
+        value = getattr(obj, primary, None)
+        if self.fallback:
+            value = value or getattr(obj, other, None) or self.empty
+        return value
+
+
+class ChoiceLabelField(serializers.Field):
+    """Libellé d'un code (statut, genre…) lu dans une ``LabelTable``."""
+
+    def __init__(self, table, **kwargs):
+        kwargs["read_only"] = True
+        super().__init__(**kwargs)
+        self.table = table
+
+    def to_representation(self, value):
+        return self.table.get(value)
@@ -0,0 +1,55 @@
+# core/management/commands/archive.py
+"""
+Archivage par année des références closes et des rendez-vous passés
+(avec leurs projections), cf. core/archive.py :
+
+    python manage.py archive                    # années antérieures à ARCHIVE_HORIZON_DAYS
+    python manage.py archive --until-year 2023 --batch-size 1000
+    python manage.py archive --dry-run
+
+Chaque paquet est déplacé dans sa propre transaction : la commande peut être
+interrompue puis relancée, elle reprend avec les lignes restantes.
+"""
+import time
+
+from django.apps import apps
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from core.archive import archive_batch, horizon
+
+ARCHIVES = {
+    "referrals": "referrals.ArchivedReferral",
+    "secretary": "referrals.ArchivedSecretaryReferral",
+    "appointments": "appointments.ArchivedAppointment",
+}
+
+
+class Command(BaseCommand):
+    help = "Déplace par paquets les lignes closes des années passées vers les tables d'archive"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--until-year", type=int, help="dernière année archivée (défaut : d'après --days)")
+        parser.add_argument("--days", type=int, default=settings.ARCHIVE_HORIZON_DAYS, help="horizon conservé")
+        parser.add_argument("--batch-size", type=int, default=500)
+        parser.add_argument("--pause", type=float, default=0, help="secondes entre deux paquets")
+        parser.add_argument("--only", nargs="+", choices=list(ARCHIVES), default=list(ARCHIVES))
+        parser.add_argument("--dry-run", action="store_true", help="compte sans rien déplacer")
+
+    def handle(self, *args, **opts):
+        cutoff = horizon(opts["days"], opts["until_year"])
+        self.stdout.write(f"Archivage des lignes antérieures au {cutoff.isoformat()}")
+        for name in opts["only"]:
+            archive_model = apps.get_model(ARCHIVES[name])
+            if opts["dry_run"]:
+                self.stdout.write(f"  {name}: {archive_model.candidates(cutoff).count()} à archiver")
+                continue
+            started, total = time.perf_counter(), 0
+            while moved := archive_batch(archive_model, cutoff, opts["batch_size"]):
+                total += moved
+                if opts["verbosity"] > 1:
+                    self.stdout.write(f"  {name}: {total}…")
+                if opts["pause"]:
+                    time.sleep(opts["pause"])
+            self.stdout.write(f"  {name}: {total} archivé(s) en {time.perf_counter() - started:.1f}s")
+        self.stdout.write(self.style.SUCCESS("Archivage terminé"))
@@ -0,0 +1,189 @@
+# core/management/commands/bench_api.py
+"""
+Benchmark des endpoints chauds, en process (pile Django complète : middlewares,
+auth JWT, sérialisation, rendu), sur les données de ``seed_load`` :
+
+    python manage.py seed_load
+    python manage.py bench_api --repeat 20 --output bench_api.json
+    python manage.py bench_api --baseline bench_api.json --fail-on-regression 20
+
+Pour chaque scénario : latences (p50/p95/p99), nombre de requêtes SQL,
+taille de réponse et codes HTTP, au format JSON (cf. ``core.bench``).
+"""
+import json
+import time
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from django.test import Client
+from django.test.utils import setup_test_environment
+from django.urls import reverse
+from django.utils import timezone
+
+from accounts.models import User
+from core.bench import summarize, write_results
+
+from .seed_load import SEED_TAG, USER_PREFIX
+
+BENCH_PASSWORD = "bench-password"
+
+
+class Command(BaseCommand):
+    help = "Mesure les endpoints chauds de l'API (sortie JSON comparable entre deux runs)"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--repeat", type=int, default=10, help="mesures par scénario")
+        parser.add_argument("--warmup", type=int, default=1, help="appels ignorés avant mesure")
+        parser.add_argument("--only", help="scénarios à lancer, séparés par des virgules")
+        parser.add_argument("--output", help="fichier JSON de sortie")
+        parser.add_argument("--baseline", help="résultats précédents (JSON) à comparer")
+        parser.add_argument("--fail-on-regression", type=float, metavar="PCT",
+                            help="code de sortie 1 si un p95 se dégrade de plus de PCT %%")
+
+    def handle(self, *args, **opts):
+        setup_test_environment()  # ALLOWED_HOSTS += testserver
+        scenarios = self.scenarios()
+        if opts["only"]:
+            wanted = [s.strip() for s in opts["only"].split(",") if s.strip()]
+            unknown = set(wanted) - set(scenarios)
+            if unknown:
+                raise CommandError(f"Scénarios inconnus : {', '.join(sorted(unknown))} (dispo : {', '.join(scenarios)})")
+            scenarios = {name: scenarios[name] for name in wanted}
+
+        results = {}
+        for name, (role, call) in scenarios.items():
+            client = self.client_for(role)
+            results[name] = self.measure(client, call, opts["warmup"], opts["repeat"])
+            self.stderr.write(
+                f"  {name}: p50 {results[name]['p50_ms']} ms, p95 {results[name]['p95_ms']} ms, "
+                f"{results[name]['queries']} requêtes SQL"
+            )
+
+        regressions = self.compare(results, opts["baseline"]) if opts["baseline"] else {}
+        params = {k: opts[k] for k in ("repeat", "warmup", "only")}
+        params["vendor"] = connection.vendor
+        write_results(self, "bench_api", params, results, opts["output"])
+
+        limit = opts["fail_on_regression"]
+        if limit is not None:
+            worst = {k: v for k, v in regressions.items() if v > limit}
+            if worst:
+                raise CommandError(f"Régression p95 > {limit} % : {worst}")
+
+    # -----------------------
+    # Scénarios
+    # -----------------------
+    def scenarios(self):
+        """nom → (rôle de l'utilisateur, fonction(client) → réponse)."""
+        today = timezone.localdate()
+        now = timezone.now()
+        api = {"secure": True}
+
+        def get(name, **query):
+            return lambda c: c.get(reverse(name), query, **api)
+
+        return {
+            "login": (None, lambda c: c.post(
+                reverse("auth-login"),
+                {"username": "bench-direction", "password": BENCH_PASSWORD, "role": "direction"},
+                content_type="application/json", **api,
+            )),
+            "referrals_list": ("direction", get("referrals-list")),
+            "referral_stats": ("direction", get(
+                "referral-stats", **{"from": (now - timedelta(days=30)).isoformat(), "to": now.isoformat()}
+            )),
+            "referral_create": ("direction", lambda c: c.post(
+                reverse("referrals-list"),
+                {
+                    "first_name": "Bench", "last_name": f"Create {time.perf_counter_ns()}",
+                    "intervention_type": "Consultation", "urgency_level": "Normale",
+                    "consultation_reason": "Benchmark", "establishment": SEED_TAG,
+                    "insurance_provider": "cnss", "insurance_notes": SEED_TAG,
+                },
+                content_type="application/json", **api,
+            )),
+            "appointments_range": ("direction", get(
+                "appointments-list", date_after=today.isoformat(), date_before=(today + timedelta(days=7)).isoformat()
+            )),
+            "appointments_list": ("direction", get("appointments-list")),
+            "notifications_list": ("medecin", get("arrival-notifs-list")),
+        }
+
+    def client_for(self, role):
+        client = Client()
+        if role is None:
+            self._direction()  # compte utilisé par le scénario de login
+            return client
+        user = self._direction() if role == "direction" else self._doctor()
+        res = client.post(
+            reverse("auth-login"),
+            {"username": user.username, "password": BENCH_PASSWORD, "code_personnel": user.code_personnel or "",
+             "role": role},
+            content_type="application/json", secure=True,
+        )
+        if res.status_code != 200:
+            raise CommandError(f"Connexion {role} impossible : {res.status_code} {res.content[:200]!r}")
+        client.defaults["HTTP_AUTHORIZATION"] = f"Bearer {res.json()['access']}"
+        return client
+
+    def _direction(self):
+        user, created = User.objects.get_or_create(username="bench-direction", defaults={"role": "direction"})
+        if created or not user.check_password(BENCH_PASSWORD):
+            user.set_password(BENCH_PASSWORD)
+            user.save()
+        return user
+
+    def _doctor(self):
+        doctor = User.objects.filter(role="medecin", username__startswith=USER_PREFIX).order_by("username").first()
+        if doctor is None:
+            doctor, _ = User.objects.get_or_create(
+                username="bench-medecin", defaults={"role": "medecin", "code_personnel": "BENCH-DR"}
+            )
+        return doctor
+
+    # -----------------------
+    # Mesure
+    # -----------------------
+    def measure(self, client, call, warmup, repeat):
+        for _ in range(warmup):
+            call(client)
+
+        latencies, statuses, sizes, queries = [], {}, [], []
+        counter = {"n": 0}
+
+        def count(execute, sql, params, many, context):
+            counter["n"] += 1
+            return execute(sql, params, many, context)
+
+        started = time.perf_counter()
+        for _ in range(repeat):
+            counter["n"] = 0
+            with connection.execute_wrapper(count):
+                t0 = time.perf_counter()
+                response = call(client)
+                body = b"".join(response.streaming_content) if response.streaming else response.content
+                latencies.append(time.perf_counter() - t0)
+            statuses[response.status_code] = statuses.get(response.status_code, 0) + 1
+            sizes.append(len(body))
+            queries.append(counter["n"])
+        elapsed = time.perf_counter() - started
+
+        return {
+            **summarize(latencies, elapsed),
+            "queries": max(queries) if queries else 0,
+            "bytes": round(sum(sizes) / len(sizes)) if sizes else 0,
+            "status": {str(k): v for k, v in sorted(statuses.items())},
+        }
+
+    def compare(self, results, path):
+        """Écart de p95 (%) par rapport à ``path``, ajouté aux résultats."""
+        with open(path, encoding="utf-8") as fh:
+            baseline = json.load(fh).get("results", {})
+        changes = {}
+        for name, row in results.items():
+            before = (baseline.get(name) or {}).get("p95_ms")
+            if before and row["p95_ms"] is not None:
+                changes[name] = round((row["p95_ms"] - before) / before * 100, 1)
+                row["p95_change_pct"] = changes[name]
+        return changes
@@ -0,0 +1,80 @@
+# core/management/commands/bench_compression.py
+"""
+Gain et coût CPU de la compression des réponses de l'API, endpoint par
+endpoint (scénarios GET de ``bench_api``, données de ``seed_load``) :
+
+    python manage.py seed_load
+    python manage.py bench_compression --levels gzip:1,6,9 br:1,4,6 --output bench_compression.json
+
+Pour chaque endpoint et chaque encodage / niveau : taille compressée, octets
+économisés, ratio et temps de compression (p50 / p95).
+"""
+from django.core.management.base import CommandError
+from django.test.utils import setup_test_environment
+
+from core.bench import summarize, timed, write_results
+from core.compression import available_encodings, compress
+
+from .bench_api import Command as ApiBenchCommand
+
+# scénarios de bench_api sans corps de réponse intéressant (POST, jetons)
+SKIPPED = {"login", "referral_create"}
+
+
+def _levels(specs):
+    """``["gzip:1,6", "br:4"]`` → ``[("gzip", 1), ("gzip", 6), ("br", 4)]``."""
+    levels = []
+    for spec in specs:
+        encoding, _, values = spec.partition(":")
+        if encoding not in ("gzip", "br"):
+            raise CommandError(f"Encodage inconnu : {encoding}")
+        levels += [(encoding, int(v)) for v in values.split(",") if v]
+    return levels
+
+
+class Command(ApiBenchCommand):
+    help = "Mesure octets économisés et coût CPU de gzip / Brotli par endpoint de l'API"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--levels", nargs="+", default=["gzip:1,6,9", "br:1,4,6"])
+        parser.add_argument("--repeat", type=int, default=20, help="compressions mesurées par niveau")
+        parser.add_argument("--only", help="scénarios à lancer, séparés par des virgules")
+        parser.add_argument("--output", help="fichier JSON de sortie")
+
+    def handle(self, *args, **opts):
+        setup_test_environment()
+        levels = _levels(opts["levels"])
+        missing = {e for e, _ in levels} - set(available_encodings())
+        if missing:
+            raise CommandError(f"Encodage indisponible (paquet manquant) : {', '.join(sorted(missing))}")
+
+        scenarios = {k: v for k, v in self.scenarios().items() if k not in SKIPPED}
+        if opts["only"]:
+            wanted = {s.strip() for s in opts["only"].split(",")}
+            scenarios = {k: v for k, v in scenarios.items() if k in wanted}
+
+        results = {}
+        for name, (role, call) in scenarios.items():
+            response = call(self.client_for(role))  # sans Accept-Encoding : corps d'origine
+            body = b"".join(response.streaming_content) if response.streaming else response.content
+            row = {"status": response.status_code, "bytes": len(body), "encodings": {}}
+            for encoding, level in levels:
+                durations = []
+                for _ in range(opts["repeat"]):
+                    with timed(durations):
+                        out = compress(body, encoding, level)
+                stats = summarize(durations)
+                row["encodings"][f"{encoding}:{level}"] = {
+                    "bytes": len(out),
+                    "saved_bytes": len(body) - len(out),
+                    "ratio": round(len(body) / len(out), 2) if out else None,
+                    "p50_ms": stats["p50_ms"],
+                    "p95_ms": stats["p95_ms"],
+                    "mb_per_s": round(len(body) / 2 ** 20 / (stats["p50_ms"] / 1000), 1) if stats["p50_ms"] else None,
+                }
+            results[name] = row
+            best = ", ".join(f"{k} x{v['ratio']} {v['p50_ms']} ms" for k, v in row["encodings"].items())
+            self.stderr.write(f"  {name} ({len(body)} o) : {best}")
+
+        params = {"levels": opts["levels"], "repeat": opts["repeat"], "only": opts["only"]}
+        write_results(self, "bench_compression", params, results, opts["output"])
@@ -0,0 +1,125 @@
+# core/management/commands/bench_json.py
+"""
+Micro-benchmark du rendu / de la lecture JSON : ``JSONRenderer`` /
+``JSONParser`` de DRF (stdlib) contre ``core.renderers`` (orjson), sur des
+payloads typiques ``AppointmentSerializer`` et ``ReferralSerializer`` et sur
+des lignes brutes (datetime, date, Decimal non encore formatés).
+
+    python manage.py bench_json --rows 1000 --repeat 50 --output bench_json.json
+
+Vérifie au passage que les deux rendus sont identiques octet pour octet.
+"""
+import io
+import random
+from datetime import date, datetime, time, timedelta
+from decimal import Decimal
+
+from django.core.management.base import BaseCommand, CommandError
+from django.utils import timezone
+from rest_framework.parsers import JSONParser
+from rest_framework.renderers import JSONRenderer
+
+from accounts.models import User
+from appointments.models import Appointment, Patient as AppointmentPatient
+from appointments.serializers import AppointmentSerializer
+from core.bench import summarize, timed, write_results
+from core.renderers import FastJSONParser, FastJSONRenderer, orjson
+from referrals.models import Insurance, Patient, Referral
+from referrals.serializers import ReferralSerializer
+
+
+class Command(BaseCommand):
+    help = "Compare le rendu / la lecture JSON stdlib (DRF) et orjson sur des payloads de l'API"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--rows", type=int, default=1000, help="lignes par payload")
+        parser.add_argument("--repeat", type=int, default=50)
+        parser.add_argument("--random-seed", type=int, default=42)
+        parser.add_argument("--output", help="fichier JSON de sortie")
+
+    # -----------------------
+    # Payloads (objets non sauvegardés, aucune écriture en base)
+    # -----------------------
+    def _appointments(self, rng, n):
+        doctor = User(id=1, username="dr", first_name="Ana", last_name="Roy", role="medecin")
+        now = timezone.now()
+        return AppointmentSerializer([
+            Appointment(
+                id=i, patient=AppointmentPatient(id=i, first_name="Lina", last_name=f"Ben Salah {i}",
+                                                 phone="+216 20 000 000", birth_date=date(1990, 1, 1)),
+                patient_name=f"Lina Ben Salah {i}", date=date.today() + timedelta(days=rng.randint(0, 60)),
+                time=time(rng.randint(8, 17), rng.choice([0, 15, 30, 45])), duration_minutes=30,
+                status="scheduled", doctor=doctor, reason="Contrôle post-opératoire", notes="",
+                created_at=now, updated_at=now,
+            )
+            for i in range(n)
+        ], many=True).data
+
+    def _referrals(self, rng, n):
+        now = timezone.now()
+        return ReferralSerializer([
+            Referral(
+                id=i, status=rng.choice(["new", "sent", "accepted"]), created_at=now, updated_at=now,
+                patient=Patient(id=i, first_name="Omar", last_name=f"Trabelsi {i}", gender="male",
+                                birth_date=date(1980, 5, 17), city="Sfax", email="omar@example.org"),
+                insurance=Insurance(id=i, insurance_provider="CNAM", insurance_policy_number=f"P-{i:06d}",
+                                    expiration_date=date(2027, 12, 31)),
+                consultation_reason="Douleurs thoraciques à l'effort", medical_history="HTA, diabète de type 2",
+            )
+            for i in range(n)
+        ], many=True).data
+
+    def _raw(self, rng, n):
+        now = timezone.now()
+        return [
+            {"day": date.today() - timedelta(days=i % 30), "at": now - timedelta(minutes=i),
+             "slot": time(9, 30), "amount": Decimal("125.50"), "count": rng.randint(0, 50)}
+            for i in range(n)
+        ]
+
+    # -----------------------
+    def _measure(self, fn, repeat):
+        durations = []
+        for _ in range(repeat):
+            with timed(durations):
+                fn()
+        return summarize(durations)
+
+    def handle(self, *args, **opts):
+        if orjson is None:
+            raise CommandError("orjson n'est pas installé : rien à comparer")
+        rng = random.Random(opts["random_seed"])
+        payloads = {
+            "appointments": self._appointments(rng, opts["rows"]),
+            "referrals": self._referrals(rng, opts["rows"]),
+            "raw_values": self._raw(rng, opts["rows"]),
+        }
+        stdlib_renderer, fast_renderer = JSONRenderer(), FastJSONRenderer()
+        stdlib_parser, fast_parser = JSONParser(), FastJSONParser()
+
+        results = {}
+        for name, data in payloads.items():
+            body = stdlib_renderer.render(data)
+            if fast_renderer.render(data) != body:
+                raise CommandError(f"{name} : rendu orjson différent du rendu DRF")
+            render = {
+                "stdlib": self._measure(lambda: stdlib_renderer.render(data), opts["repeat"]),
+                "orjson": self._measure(lambda: fast_renderer.render(data), opts["repeat"]),
+            }
+            parse = {
+                "stdlib": self._measure(lambda: stdlib_parser.parse(io.BytesIO(body)), opts["repeat"]),
+                "orjson": self._measure(lambda: fast_parser.parse(io.BytesIO(body)), opts["repeat"]),
+            }
+            results[name] = {
+                "bytes": len(body),
+                "render": render,
+                "parse": parse,
+                "render_speedup": round(render["stdlib"]["p50_ms"] / render["orjson"]["p50_ms"], 2),
+                "parse_speedup": round(parse["stdlib"]["p50_ms"] / parse["orjson"]["p50_ms"], 2),
+            }
+            self.stderr.write(
+                f"{name}: rendu x{results[name]['render_speedup']}, lecture x{results[name]['parse_speedup']}"
+            )
+
+        params = {k: opts[k] for k in ("rows", "repeat", "random_seed")}
+        write_results(self, "bench_json", params, results, opts["output"])
@@ -0,0 +1,87 @@
+# core/management/commands/bench_middleware.py
+"""
+Surcoût par requête de la pile de middlewares, pile Django d'origine
+(session / CSRF / auth / messages sur tous les chemins) contre la pile
+actuelle (``STATELESS_PATH_PREFIXES`` sans état) :
+
+    python manage.py bench_middleware --repeat 5000 --output bench_middleware.json
+
+La vue appelée ne fait rien : seul le coût des middlewares est mesuré, avec
+un cookie de session présent (navigateur connecté à l'admin sur le même
+domaine que la SPA).
+"""
+from django.conf import settings
+from django.http import HttpResponse
+from django.test import Client, override_settings
+from django.test.utils import setup_test_environment
+from django.urls import path
+
+from core.bench import summarize, timed, write_results
+
+from .bench_api import Command as ApiBenchCommand
+
+STOCK = {
+    "core.middleware.SessionMiddleware": "django.contrib.sessions.middleware.SessionMiddleware",
+    "core.middleware.CsrfViewMiddleware": "django.middleware.csrf.CsrfViewMiddleware",
+    "core.middleware.AuthenticationMiddleware": "django.contrib.auth.middleware.AuthenticationMiddleware",
+    "core.middleware.MessageMiddleware": "django.contrib.messages.middleware.MessageMiddleware",
+}
+
+
+def noop(request):
+    return HttpResponse(b"{}", content_type="application/json")
+
+
+# urlconf de la commande (ROOT_URLCONF surchargé pendant la mesure)
+urlpatterns = [
+    path("api/_noop/", noop),
+    path("_noop/", noop),
+]
+
+
+class Command(ApiBenchCommand):
+    help = "Mesure le surcoût des middlewares par requête, pile Django d'origine contre pile sans état pour /api/"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--repeat", type=int, default=2000, help="requêtes mesurées par scénario")
+        parser.add_argument("--warmup", type=int, default=50)
+        parser.add_argument("--output", help="fichier JSON de sortie")
+
+    def handle(self, *args, **opts):
+        setup_test_environment()
+        stacks = {
+            "stock": [STOCK.get(mw, mw) for mw in settings.MIDDLEWARE],
+            "lean": list(settings.MIDDLEWARE),
+        }
+        scenarios = {
+            "api_with_session_cookie": ("/api/_noop/", True),
+            "api_anonymous": ("/api/_noop/", False),
+            "spa_with_session_cookie": ("/_noop/", True),  # témoin : pile complète des deux côtés
+        }
+        user = self._direction()
+
+        results = {}
+        with override_settings(ROOT_URLCONF=__name__, SECURE_SSL_REDIRECT=False):
+            for name, (url, logged_in) in scenarios.items():
+                clients = {}
+                for stack, middleware in stacks.items():
+                    # la pile est chargée à la première requête du client, puis figée
+                    with override_settings(MIDDLEWARE=middleware):
+                        clients[stack] = client = Client()
+                        if logged_in:
+                            client.force_login(user)
+                        for _ in range(opts["warmup"]):
+                            client.get(url)
+                # mesures alternées : même bruit de fond pour les deux piles
+                durations = {stack: [] for stack in clients}
+                for _ in range(opts["repeat"]):
+                    for stack, client in clients.items():
+                        with timed(durations[stack]):
+                            client.get(url)
+                results[name] = {stack: summarize(values) for stack, values in durations.items()}
+                stock, lean = results[name]["stock"]["p50_ms"], results[name]["lean"]["p50_ms"]
+                results[name]["saved_p50_us"] = round((stock - lean) * 1000, 1)
+                self.stderr.write(f"  {name}: p50 {stock} ms → {lean} ms")
+
+        params = {"repeat": opts["repeat"], "warmup": opts["warmup"]}
+        write_results(self, "bench_middleware", params, results, opts["output"])
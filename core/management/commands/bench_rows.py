@@ -0,0 +1,95 @@
+# core/management/commands/bench_rows.py
+"""
+Sérialisation des listes : serializer DRF (jointures d'``eager_load``)
+contre ``RowSerializer`` (core/rows.py), sur les données de ``seed_load`` :
+
+    python manage.py seed_load
+    python manage.py bench_rows --limit 1000 --repeat 20 --output bench_rows.json
+
+Pour chaque liste (rendez-vous, références, notifications) : latences,
+lignes par seconde (au p50) et nombre de requêtes SQL, requête comprise.
+Vérifie au passage que les deux sorties sont identiques au JSON près.
+"""
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from rest_framework.renderers import JSONRenderer
+
+from appointments.models import Appointment
+from appointments.rows import AppointmentRows
+from appointments.serializers import AppointmentSerializer
+from core.bench import summarize, timed, write_results
+from core.eager import eager_load
+from notifications.models import ArrivalNotification
+from notifications.rows import ArrivalNotificationRows
+from notifications.serializers import ArrivalNotificationSerializer
+from referrals.models import Referral
+from referrals.rows import ReferralRows
+from referrals.serializers import ReferralSerializer
+
+from .seed_load import SEED_TAG
+
+# liste → (lignes de seed_load dans l'ordre des vues, serializer DRF, RowSerializer)
+LISTS = {
+    "appointments": (
+        lambda: Appointment.objects.filter(notes=SEED_TAG).order_by("-date", "-time", "-id"),
+        AppointmentSerializer, AppointmentRows,
+    ),
+    "referrals": (
+        lambda: Referral.objects.filter(establishment=SEED_TAG).order_by("-id"),
+        ReferralSerializer, ReferralRows,
+    ),
+    "notifications": (
+        lambda: ArrivalNotification.objects.filter(notes=SEED_TAG).order_by("-created_at"),
+        ArrivalNotificationSerializer, ArrivalNotificationRows,
+    ),
+}
+
+
+class Command(BaseCommand):
+    help = "Compare serializers DRF et RowSerializer (lignes/s, requêtes SQL) sur les listes de l'API"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--limit", type=int, default=1000, help="lignes par liste")
+        parser.add_argument("--repeat", type=int, default=20)
+        parser.add_argument("--output", help="fichier JSON de sortie")
+
+    def _measure(self, render, repeat):
+        durations = []
+        for _ in range(repeat):
+            with CaptureQueriesContext(connection) as ctx, timed(durations):
+                render()
+        return summarize(durations), len(ctx.captured_queries)
+
+    def handle(self, *args, **opts):
+        limit, renderer = opts["limit"], JSONRenderer()
+        results = {}
+        for name, (queryset, serializer_class, rows_class) in LISTS.items():
+            n = min(queryset().count(), limit)
+            if not n:
+                raise CommandError(f"{name} : aucune ligne de seed_load, lancer d'abord « manage.py seed_load ».")
+
+            def drf():
+                return serializer_class(eager_load(queryset(), serializer_class)[:limit], many=True).data
+
+            def rows():
+                return rows_class(queryset()[:limit]).data
+
+            if renderer.render(rows()) != renderer.render(drf()):
+                raise CommandError(f"{name} : sortie de {rows_class.__name__} différente du serializer DRF")
+
+            result = {"rows": n}
+            for label, render in (("drf", drf), ("row_serializer", rows)):
+                summary, queries = self._measure(render, opts["repeat"])
+                summary["rows_per_s"] = round(n / (summary["p50_ms"] / 1000)) if summary["p50_ms"] else None
+                summary["queries"] = queries
+                result[label] = summary
+            result["speedup"] = round(result["drf"]["p50_ms"] / result["row_serializer"]["p50_ms"], 2)
+            results[name] = result
+            self.stderr.write(
+                f"{name}: {result['drf']['rows_per_s']} → {result['row_serializer']['rows_per_s']} lignes/s "
+                f"(x{result['speedup']}), requêtes {result['drf']['queries']} → {result['row_serializer']['queries']}"
+            )
+
+        params = {k: opts[k] for k in ("limit", "repeat")}
+        write_results(self, "bench_rows", params, results, opts["output"])
@@ -0,0 +1,53 @@
+# core/management/commands/bench_sqlite.py
+"""
+Même charge que ``bench_db``, sur deux fichiers SQLite temporaires :
+
+- ``default`` : réglages d'origine de SQLite/Django (journal ``delete``,
+  ``synchronous=full``, transactions différées) ;
+- ``tuned`` : ``settings.SQLITE_PRAGMAS`` + ``BEGIN IMMEDIATE``.
+
+    python manage.py bench_sqlite --threads 8 --duration 10 --output bench_sqlite.json
+"""
+import tempfile
+from pathlib import Path
+
+from django.conf import settings
+
+from core.bench import write_results
+from core.db import database_config
+
+from .bench_db import Command as DatabaseBenchCommand
+
+BASELINE_PRAGMAS = {"journal_mode": "delete", "synchronous": "full"}
+
+
+class Command(DatabaseBenchCommand):
+    help = "Compare SQLite par défaut et SQLite réglé (WAL, mmap, busy_timeout, IMMEDIATE) sous charge concurrente"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--threads", type=int, default=8)
+        parser.add_argument("--duration", type=float, default=10.0, help="secondes par profil")
+        parser.add_argument("--write-ratio", type=float, default=0.2)
+        parser.add_argument("--seed", type=int, default=2000, help="références créées avant le run")
+        parser.add_argument("--output", help="fichier JSON de sortie")
+
+    def handle(self, *args, **opts):
+        profiles = {
+            "default": (BASELINE_PRAGMAS, None),
+            "tuned": (settings.SQLITE_PRAGMAS, "IMMEDIATE"),
+        }
+        results = {}
+        with tempfile.TemporaryDirectory(prefix="bench-sqlite-") as tmp:
+            for name, (pragmas, transaction_mode) in profiles.items():
+                config = database_config(f"sqlite:///{Path(tmp) / name}.sqlite3", conn_max_age=60)
+                config["PRAGMAS"] = pragmas
+                options = config.setdefault("OPTIONS", {})
+                options.pop("transaction_mode", None)
+                if transaction_mode:
+                    options["transaction_mode"] = transaction_mode
+                results[name] = self.bench(f"bench_{name}", config, opts)
+                results[name]["pragmas"] = pragmas
+                results[name]["transaction_mode"] = transaction_mode or "DEFERRED"
+
+        params = {k: opts[k] for k in ("threads", "duration", "write_ratio", "seed")}
+        write_results(self, "bench_sqlite", params, results, opts["output"])
@@ -0,0 +1,115 @@
+# core/management/commands/bench_startup.py
+"""
+Coût de démarrage d'un process, mesuré dans des interpréteurs neufs :
+
+    python manage.py bench_startup --repeat 5 --output bench_startup.json
+
+Pour chaque run : chargement de l'application (``clinic_backend.asgi`` ou
+``wsgi``, sans mise en chauffe), puis chaque étape de ``core.startup.warm_up``.
+Le premier run est relancé sous ``python -X importtime`` : temps d'import
+cumulé par paquet, modules les plus lents et modules optionnels lourds
+(Twilio, googletrans, Pillow) chargés dès le démarrage alors qu'ils ne devraient
+l'être qu'au premier usage.
+"""
+import json
+import os
+import subprocess
+import sys
+from collections import defaultdict
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from core.bench import summarize, write_results
+
+# importés à la demande : leur présence au démarrage est une régression
+DEFERRED_MODULES = ("twilio", "googletrans", "PIL.Image")
+
+PROBE = """
+import json, os, sys, time
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "clinic_backend.settings")
+os.environ["STARTUP_WARMUP"] = "0"
+t0 = time.perf_counter()
+import clinic_backend.{entry}
+t1 = time.perf_counter()
+from core.startup import warm_up
+steps = warm_up(force=True)
+t2 = time.perf_counter()
+print(json.dumps({{
+    "load_s": t1 - t0,
+    "warm_up_s": t2 - t1,
+    "steps": steps,
+    "deferred_loaded": [m for m in {deferred!r} if m in sys.modules],
+}}))
+"""
+
+
+def parse_importtime(stderr):
+    """Lignes ``import time: self | cumulé | module`` → ``[(module, self_us, cumul_us)]``."""
+    rows = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        rows.append((name.strip(), int(self_us), int(cumulative_us)))
+    return rows
+
+
+class Command(BaseCommand):
+    help = "Mesure le chargement de l'application, la mise en chauffe et le temps d'import par paquet"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--repeat", type=int, default=5, help="process lancés")
+        parser.add_argument("--entry", choices=("asgi", "wsgi"), default="asgi")
+        parser.add_argument("--top", type=int, default=15, help="paquets / modules listés")
+        parser.add_argument("--output", help="fichier JSON de sortie")
+
+    def _run(self, opts, importtime=False):
+        code = PROBE.format(entry=opts["entry"], deferred=DEFERRED_MODULES)
+        cmd = [sys.executable, *(["-X", "importtime"] if importtime else []), "-c", code]
+        proc = subprocess.run(cmd, cwd=settings.BASE_DIR, env=os.environ.copy(), capture_output=True, text=True)
+        if proc.returncode:
+            raise CommandError(f"Le process de mesure a échoué :\n{proc.stderr[-2000:]}")
+        return json.loads(proc.stdout.strip().splitlines()[-1]), proc.stderr
+
+    def handle(self, *args, **opts):
+        runs = [self._run(opts)[0] for _ in range(opts["repeat"])]
+        steps = defaultdict(list)
+        for run in runs:
+            for name, ms in run["steps"].items():
+                if ms is not None:
+                    steps[name].append(ms / 1000)
+
+        _, stderr = self._run(opts, importtime=True)
+        modules = parse_importtime(stderr)
+        packages = defaultdict(int)
+        for name, self_us, _ in modules:
+            packages[name.split(".")[0]] += self_us
+        top = opts["top"]
+
+        results = {
+            "load": summarize([r["load_s"] for r in runs]),
+            "warm_up": summarize([r["warm_up_s"] for r in runs]),
+            "warm_up_steps": {name: summarize(values) for name, values in steps.items()},
+            "imports": {
+                "modules": len(modules),
+                "total_ms": round(sum(s for _, s, _ in modules) / 1000, 1),
+                "by_package_ms": {
+                    name: round(us / 1000, 1)
+                    for name, us in sorted(packages.items(), key=lambda kv: -kv[1])[:top]
+                },
+                "slowest_modules_ms": {
+                    name: round(us / 1000, 1)
+                    for name, us, _ in sorted(modules, key=lambda row: -row[1])[:top]
+                },
+            },
+            "deferred_loaded_at_startup": runs[0]["deferred_loaded"],
+        }
+        self.stderr.write(
+            f"  chargement p50 {results['load']['p50_ms']} ms, mise en chauffe p50 {results['warm_up']['p50_ms']} ms"
+        )
+        if results["deferred_loaded_at_startup"]:
+            self.stderr.write(f"  importés au démarrage : {', '.join(results['deferred_loaded_at_startup'])}")
+
+        params = {"repeat": opts["repeat"], "entry": opts["entry"]}
+        write_results(self, "bench_startup", params, results, opts["output"])
@@ -0,0 +1,44 @@
+# core/management/commands/build_schema.py
+"""
+Génère le schéma OpenAPI servi par ``/api/schema/`` (étape de build, après
+``collectstatic``) :
+
+    python manage.py build_schema
+    python manage.py build_schema --check   # CI : code 1 si le schéma est périmé
+
+Une variante par langue × format (YAML, JSON) + ``manifest.json`` dans
+``OPENAPI_SCHEMA_DIR`` (cf. ``core/schema.py``).
+"""
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+
+from core import schema
+from core.i18n import supported_languages
+
+
+class Command(BaseCommand):
+    help = "Précalcule le schéma OpenAPI (par langue, YAML + JSON) servi par /api/schema/"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--lang", action="append", choices=supported_languages(),
+                            help="langue(s) à générer (défaut : toutes)")
+        parser.add_argument("--output-dir", help="répertoire de sortie (défaut : OPENAPI_SCHEMA_DIR)")
+        parser.add_argument("--check", action="store_true",
+                            help="ne génère rien ; échoue si le schéma est absent ou périmé")
+
+    def handle(self, *args, **opts):
+        directory = opts["output_dir"] or schema.schema_dir()
+        if opts["check"]:
+            if schema.is_stale(schema.read_manifest(directory)):
+                raise CommandError(f"Schéma OpenAPI absent ou périmé dans {directory} : lancer build_schema")
+            self.stdout.write("Schéma OpenAPI à jour")
+            return
+
+        start = time.perf_counter()
+        manifest = schema.build(opts["lang"], directory)
+        for name, sha in manifest["files"].items():
+            self.stdout.write(f"  {name}  {sha[:12]}")
+        self.stdout.write(self.style.SUCCESS(
+            f"Schéma OpenAPI écrit dans {directory} en {time.perf_counter() - start:.1f}s"
+        ))
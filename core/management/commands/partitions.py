@@ -0,0 +1,41 @@
+# core/management/commands/partitions.py
+"""
+Partitions mensuelles (PostgreSQL, cf. core/partitions.py) :
+
+    python manage.py partitions                 # partitions des mois à venir (cron quotidien)
+    python manage.py partitions --convert       # partitionne les tables existantes (DB_PARTITIONING=1)
+    python manage.py partitions --unpartition   # retour à des tables simples
+"""
+from django.apps import apps
+from django.core.management.base import BaseCommand, CommandError
+from django.db import DEFAULT_DB_ALIAS, connections
+
+from core.partitions import PARTITIONED, convert, enabled, ensure_partitions, unpartition
+
+
+class Command(BaseCommand):
+    help = "Crée les partitions mensuelles à venir ; convertit les tables existantes au besoin"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--database", default=DEFAULT_DB_ALIAS)
+        parser.add_argument("--months-ahead", type=int, help="défaut : DB_PARTITION_MONTHS_AHEAD")
+        group = parser.add_mutually_exclusive_group()
+        group.add_argument("--convert", action="store_true", help="partitionne les tables (copie des données)")
+        group.add_argument("--unpartition", action="store_true", help="revient à des tables simples")
+
+    def handle(self, *args, **opts):
+        connection = connections[opts["database"]]
+        if connection.vendor != "postgresql":
+            raise CommandError(f"Partitionnement natif PostgreSQL uniquement (base : {connection.vendor}).")
+        if opts["convert"] and not enabled(connection):
+            raise CommandError("--convert : activer d'abord DB_PARTITIONING=1.")
+        for label in PARTITIONED:
+            model = apps.get_model(label)
+            if opts["convert"] and convert(connection, model, opts["months_ahead"]):
+                self.stdout.write(f"  {model._meta.db_table}: partitionnée par mois")
+            if opts["unpartition"] and unpartition(connection, model):
+                self.stdout.write(f"  {model._meta.db_table}: table simple")
+        created = ensure_partitions(opts["database"], opts["months_ahead"])
+        self.stdout.write(self.style.SUCCESS(f"{len(created)} partition(s) créée(s)"))
+        for name in created:
+            self.stdout.write(f"  {name}")
@@ -0,0 +1,263 @@
+# core/management/commands/seed_load.py
+"""
+Jeu de données volumineux pour les benchmarks (``bench_api``) :
+
+    python manage.py seed_load                      # volumes par défaut
+    python manage.py seed_load --referrals 10000 --appointments 20000 --notifications 50000
+    python manage.py seed_load --clear              # supprime uniquement les lignes générées
+
+Tout passe par ``bulk_create`` (pas de signaux) ; les lignes générées sont
+marquées (``SEED_TAG``) pour pouvoir être retirées sans toucher au reste.
+"""
+import random
+import re
+import time
+from contextlib import contextmanager
+from datetime import timedelta
+from datetime import time as dtime
+
+from django.contrib.auth.hashers import make_password
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.utils import timezone
+
+from accounts.models import Specialty, User
+from appointments.models import Appointment, AppointmentType, Room
+from appointments.models import Patient as AppointmentPatient
+from core import refdata
+from notifications.models import ArrivalNotification
+from referrals.models import Insurance, InterventionType, Patient, Referral, UrgencyLevel
+from referrals.models_secretary import SecretaryReferral
+
+SEED_TAG = "seed_load"
+USER_PREFIX = "load-"
+# salles générées : « seed_load · Salle 001 » (nom propre au jeu, jamais celui d'une vraie salle)
+ROOM_NAME = f"{SEED_TAG} · Salle {{:03d}}"
+ROOM_NAME_RE = rf"^{re.escape(SEED_TAG)} · Salle [0-9]{{3,}}$"
+
+FIRST_NAMES = ["Amine", "Sara", "Youssef", "Khadija", "Omar", "Imane", "Mehdi", "Salma", "Hamza", "Nadia",
+               "Claire", "Louis", "Emma", "Hugo", "Chloé", "Lucas", "Inès", "Adam", "Léa", "Noah"]
+LAST_NAMES = ["Benali", "El Idrissi", "Alaoui", "Bennani", "Tazi", "Martin", "Bernard", "Dubois", "Moreau",
+              "Laurent", "Chraibi", "Fassi", "Berrada", "Lefebvre", "Garcia", "Roux", "Amrani", "Kettani"]
+CITIES = ["Casablanca", "Rabat", "Marrakech", "Tanger", "Fès", "Agadir", "Montréal", "Lyon"]
+SPECIALTIES = [("Cardiologie", "Cardiology"), ("Orthopédie", "Orthopedics"), ("Neurologie", "Neurology"),
+               ("Pédiatrie", "Pediatrics"), ("Radiologie", "Radiology"), ("Dermatologie", "Dermatology")]
+INTERVENTIONS = [("Consultation", "Consultation"), ("Échographie", "Ultrasound"), ("IRM", "MRI"),
+                 ("Scanner", "CT scan"), ("Chirurgie ambulatoire", "Day surgery"), ("Biopsie", "Biopsy"),
+                 ("Endoscopie", "Endoscopy"), ("Radiographie", "X-ray"), ("Électrocardiogramme", "ECG"),
+                 ("Kinésithérapie", "Physiotherapy"), ("Vaccination", "Vaccination"), ("Bilan sanguin", "Blood test")]
+URGENCIES = [("Faible", "Low", "vert", 4), ("Normale", "Normal", "bleu", 3),
+             ("Élevée", "High", "orange", 2), ("Urgente", "Urgent", "rouge", 1)]
+PROVIDERS = ["cnss", "cnops", "axa", "saham", ""]
+
+
+@contextmanager
+def explicit_timestamps(*models):
+    """Désactive auto_now / auto_now_add le temps du seed (dates réparties dans le passé)."""
+    saved = []
+    for model in models:
+        for field in model._meta.concrete_fields:
+            if getattr(field, "auto_now", False) or getattr(field, "auto_now_add", False):
+                saved.append((field, field.auto_now, field.auto_now_add))
+                field.auto_now = field.auto_now_add = False
+    try:
+        yield
+    finally:
+        for field, auto_now, auto_now_add in saved:
+            field.auto_now, field.auto_now_add = auto_now, auto_now_add
+
+
+class Command(BaseCommand):
+    help = "Génère un gros volume de données réalistes (bulk_create) pour les benchmarks"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--referrals", type=int, default=100_000)
+        parser.add_argument("--appointments", type=int, default=200_000)
+        parser.add_argument("--notifications", type=int, default=500_000)
+        parser.add_argument("--doctors", type=int, default=300)
+        parser.add_argument("--rooms", type=int, default=200)
+        parser.add_argument("--days", type=int, default=365, help="profondeur d'historique")
+        parser.add_argument("--batch-size", type=int, default=5000)
+        parser.add_argument("--random-seed", type=int, default=42)
+        parser.add_argument("--clear", action="store_true", help="supprime les données générées et s'arrête")
+
+    def handle(self, *args, **opts):
+        if opts["clear"]:
+            self._clear()
+            return
+
+        self.rng = random.Random(opts["random_seed"])
+        self.batch_size = opts["batch_size"]
+        self.now = timezone.now()
+        self.days = opts["days"]
+
+        started = time.perf_counter()
+        with explicit_timestamps(Referral, Appointment, ArrivalNotification, SecretaryReferral):
+            refs = self._reference_data(opts["rooms"])
+            doctors = self._doctors(opts["doctors"], refs["specialties"])
+            self._referrals(opts["referrals"], doctors, refs)
+            self._appointments(opts["appointments"], doctors, refs)
+            self._notifications(opts["notifications"], doctors, refs)
+
+        # bulk_create n'émet pas post_save : on invalide le cache de référence à la main
+        refdata.bump_version()
+        self.stdout.write(self.style.SUCCESS(f"Seed terminé en {time.perf_counter() - started:.1f}s"))
+
+    # -----------------------
+    # Outils
+    # -----------------------
+    def _bulk(self, model, objs, label):
+        t0 = time.perf_counter()
+        created = []
+        for i in range(0, len(objs), self.batch_size):
+            with transaction.atomic():
+                created.extend(model.objects.bulk_create(objs[i:i + self.batch_size]))
+        self.stdout.write(f"  {label}: {len(created)} en {time.perf_counter() - t0:.1f}s")
+        return created
+
+    def _past(self, days=None):
+        return self.now - timedelta(seconds=self.rng.randint(0, (days or self.days) * 86400))
+
+    def _name(self):
+        return self.rng.choice(FIRST_NAMES), self.rng.choice(LAST_NAMES)
+
+    # -----------------------
+    # Données de référence
+    # -----------------------
+    def _reference_data(self, n_rooms):
+        specialties = [Specialty.objects.get_or_create(name_fr=fr, defaults={"name_en": en})[0] for fr, en in SPECIALTIES]
+        interventions = [
+            InterventionType.objects.get_or_create(name_fr=fr, defaults={"name_en": en})[0] for fr, en in INTERVENTIONS
+        ]
+        urgencies = [
+            UrgencyLevel.objects.get_or_create(name_fr=fr, defaults={"name_en": en, "color": color, "priority": prio})[0]
+            for fr, en, color, prio in URGENCIES
+        ]
+        types = [AppointmentType.objects.get_or_create(name_fr=fr, defaults={"name_en": en})[0] for fr, en in INTERVENTIONS]
+
+        seeded = Room.objects.filter(name_fr__regex=ROOM_NAME_RE)
+        existing = seeded.count()
+        rooms = self._bulk(Room, [
+            Room(name_fr=ROOM_NAME.format(n), name_en=f"{SEED_TAG} · Room {n:03d}",
+                 status=self.rng.choice(["available", "available", "occupied", "cleaning"]))
+            for n in range(existing + 1, n_rooms + 1)
+        ], "salles") + list(seeded)
+        return {"specialties": specialties, "interventions": interventions, "urgencies": urgencies,
+                "types": types, "rooms": list({r.pk: r for r in rooms}.values())}
+
+    def _doctors(self, n, specialties):
+        existing = list(User.objects.filter(username__startswith=f"{USER_PREFIX}dr-"))
+        password = make_password(None)  # compte de charge : pas de connexion par mot de passe
+        new = []
+        for i in range(len(existing) + 1, n + 1):
+            first, last = self._name()
+            new.append(User(
+                username=f"{USER_PREFIX}dr-{i:04d}", first_name=first, last_name=last, role="medecin",
+                code_personnel=f"LD{i:05d}", specialite=self.rng.choice(specialties), password=password,
+            ))
+        return existing + self._bulk(User, new, "médecins")
+
+    # -----------------------
+    # Volumes
+    # -----------------------
+    def _referrals(self, n, doctors, refs):
+        if not n:
+            return
+        n_patients = max(n * 2 // 3, 1)
+        patients, insurances = [], []
+        for _ in range(n_patients):
+            first, last = self._name()
+            patients.append(Patient(
+                first_name=first, last_name=last, city=self.rng.choice(CITIES), address=SEED_TAG,
+                gender=self.rng.choice(["male", "female"]), phone=f"06{self.rng.randint(10**7, 10**8 - 1)}",
+                birth_date=(self.now - timedelta(days=self.rng.randint(365, 90 * 365))).date(),
+            ))
+            insurances.append(Insurance(
+                insurance_provider=self.rng.choice(PROVIDERS),
+                insurance_policy_number=f"POL-{self.rng.randint(10**6, 10**7 - 1)}",
+                holder_name=f"{first} {last}", insurance_notes=SEED_TAG,
+            ))
+        patients = self._bulk(Patient, patients, "patients")
+        insurances = self._bulk(Insurance, insurances, "assurances")
+
+        statuses = [s for s, _ in Referral.Status.choices]
+        referrals, secretary = [], []
+        for _ in range(n):
+            idx = self.rng.randrange(n_patients)
+            patient, insurance, doctor = patients[idx], insurances[idx], self.rng.choice(doctors)
+            intervention = self.rng.choice(refs["interventions"])
+            created = self._past()
+            referrals.append(Referral(
+                patient=patient, insurance=insurance, doctor=doctor, intervention_type=intervention,
+                urgency_level=self.rng.choice(refs["urgencies"]),
+                consultation_reason="Contrôle", establishment=SEED_TAG,
+                status=self.rng.choice(statuses), created_at=created, updated_at=created,
+            ))
+            # équivalent du signal referral_to_secretary (non déclenché par bulk_create)
+            secretary.append(SecretaryReferral(
+                patient=str(patient), medecin=f"{doctor.first_name} {doctor.last_name}",
+                intervention=intervention.name_fr, date=created,
+                assurance=(insurance.insurance_provider or "—").upper(), internalNotes=SEED_TAG,
+                created_at=created, updated_at=created,
+            ))
+        self._bulk(Referral, referrals, "références")
+        self._bulk(SecretaryReferral, secretary, "références secrétariat")
+
+    def _appointments(self, n, doctors, refs):
+        if not n:
+            return
+        patients = self._bulk(AppointmentPatient, [
+            AppointmentPatient(first_name=first, last_name=last, insurance=SEED_TAG)
+            for first, last in (self._name() for _ in range(max(n // 4, 1)))
+        ], "patients (RDV)")
+        statuses = ["pending", "confirmed", "to_call", "cancelled"]
+        appointments = []
+        for _ in range(n):
+            patient = self.rng.choice(patients)
+            day = (self.now + timedelta(days=self.rng.randint(-self.days // 2, self.days // 2))).date()
+            created = self._past()
+            appointments.append(Appointment(
+                patient=patient, patient_name=str(patient), date=day,
+                time=dtime(self.rng.randint(8, 17), self.rng.choice([0, 15, 30, 45])),
+                status=self.rng.choice(statuses), room=self.rng.choice(refs["rooms"]),
+                type=self.rng.choice(refs["types"]), doctor=self.rng.choice(doctors),
+                notes=SEED_TAG, created_at=created, updated_at=created,
+            ))
+        self._bulk(Appointment, appointments, "rendez-vous")
+
+    def _notifications(self, n, doctors, refs):
+        if not n:
+            return
+        notifs = []
+        for _ in range(n):
+            doctor = self.rng.choice(doctors)
+            created = self._past()
+            first, last = self._name()
+            notifs.append(ArrivalNotification(
+                doctor=doctor, status=self.rng.choice(["new", "ack", "read", "read"]),
+                patient=f"{first} {last}", ref_by=f"{doctor.first_name} {doctor.last_name}",
+                room=self.rng.choice(refs["rooms"]), intervention_type=self.rng.choice(refs["types"]),
+                appt_at=created + timedelta(hours=self.rng.randint(1, 72)), created_at=created, updated_at=created,
+                message="Arrivée du patient", notes=SEED_TAG,
+            ))
+        self._bulk(ArrivalNotification, notifs, "notifications")
+
+    # -----------------------
+    # Nettoyage
+    # -----------------------
+    def _clear(self):
+        with transaction.atomic():
+            counts = {
+                "notifications": ArrivalNotification.objects.filter(notes=SEED_TAG).delete()[0],
+                "rendez-vous": Appointment.objects.filter(notes=SEED_TAG).delete()[0],
+                "références": Referral.objects.filter(establishment=SEED_TAG).delete()[0],
+                "références secrétariat": SecretaryReferral.objects.filter(internalNotes=SEED_TAG).delete()[0],
+                "assurances": Insurance.objects.filter(insurance_notes=SEED_TAG).delete()[0],
+                "patients": Patient.objects.filter(address=SEED_TAG).delete()[0],
+                "patients (RDV)": AppointmentPatient.objects.filter(insurance=SEED_TAG).delete()[0],
+                "médecins": User.objects.filter(username__startswith=USER_PREFIX).delete()[0],
+                "salles": Room.objects.filter(name_fr__regex=ROOM_NAME_RE).delete()[0],
+            }
+        refdata.bump_version()
+        for label, count in counts.items():
+            self.stdout.write(f"  {label}: {count} supprimé(s)")
@@ -0,0 +1,164 @@
+# core/media.py
+"""
+Service des fichiers ``MEDIA_ROOT`` (photos de profil, pièces jointes),
+en production comme en développement.
+
+- un seul ``stat()`` par requête : ETag (mtime + taille) et Last-Modified,
+  réponse 304 sur ``If-None-Match`` / ``If-Modified-Since`` ;
+- requêtes ``Range`` (plage unique, ``If-Range`` respecté) en 206 ;
+- envoi par ``FileResponse`` : sous ASGI (workers uvicorn, cf. gunicorn.conf.py)
+  Django lit le fichier par blocs dans un thread, chaque octet passe par
+  Python ; ``sendfile()`` n'est utilisé que par un worker WSGI ;
+- ``MEDIA_ACCEL_REDIRECT`` (à définir en production) : l'envoi est délégué au
+  reverse proxy (nginx ``X-Accel-Redirect``, zéro copie), la vue ne fait que
+  les contrôles et les en-têtes.
+
+Seuls les chemins sous ``MEDIA_SERVE_PREFIXES`` sont servis.
+"""
+import mimetypes
+import os
+import posixpath
+import re
+import stat
+from urllib.parse import quote
+
+from django.conf import settings
+from django.core.exceptions import SuspiciousFileOperation
+from django.http import FileResponse, Http404, HttpResponse, HttpResponseNotModified
+from django.utils._os import safe_join
+from django.utils.http import http_date, parse_http_date_safe, quote_etag
+from django.views.decorators.http import require_safe
+
+from .conditional import etag_matches
+
+# noms adressés par contenu (cf. accounts/images.py) : un fichier ne change jamais
+_CONTENT_ADDRESSED = re.compile(r"(^|/)[0-9a-f]{64}(-\d+)?\.\w+$")
+_RANGE = re.compile(r"^bytes=(\d*)-(\d*)$")
+
+IMMUTABLE = "public, max-age=31536000, immutable"
+
+
+def media_etag(st):
+    return quote_etag(f"{st.st_mtime_ns:x}-{st.st_size:x}")
+
+
+def parse_range(header, size):
+    """
+    ``(début, fin)`` inclusifs d'un ``Range`` à plage unique ; None si absent,
+    invalide ou multi-plages (réponse complète) ; ``ValueError`` si insatisfiable.
+    """
+    match = _RANGE.match((header or "").strip())
+    if not match or not (match[1] or match[2]):
+        return None
+    if match[1]:
+        start = int(match[1])
+        if match[2] and int(match[2]) < start:
+            return None
+        if start >= size:
+            raise ValueError(header)
+        return start, min(int(match[2]) if match[2] else size - 1, size - 1)
+    suffix = int(match[2])
+    if suffix == 0 or size == 0:
+        raise ValueError(header)
+    return max(size - suffix, 0), size - 1
+
+
+def _if_range_ok(request, etag, mtime):
+    if_range = request.headers.get("If-Range")
+    if not if_range:
+        return True
+    if if_range.startswith(('"', "W/")):
+        return if_range == etag  # comparaison forte
+    return parse_http_date_safe(if_range) == int(mtime)
+
+
+def _not_modified(request, etag, mtime):
+    if_none_match = request.headers.get("If-None-Match")
+    if if_none_match:
+        return etag_matches(etag, if_none_match)
+    since = parse_http_date_safe(request.headers.get("If-Modified-Since", ""))
+    return since is not None and int(mtime) <= since
+
+
+class FileRange:
+    """
+    Tranche ``[start, start + length)`` d'un fichier ouvert pour ``FileResponse``.
+    Lue par blocs sous ASGI ; ``fileno()`` reste exposé pour le
+    ``wsgi.file_wrapper`` d'un worker WSGI (``sendfile()`` depuis la position
+    courante, ``Content-Length`` octets).
+    """
+
+    def __init__(self, fh, start, length):
+        fh.seek(start)
+        self._fh = fh
+        self._remaining = length
+
+    def read(self, size=-1):
+        if size < 0 or size > self._remaining:
+            size = self._remaining
+        data = self._fh.read(size)
+        self._remaining -= len(data)
+        return data
+
+    def fileno(self):
+        return self._fh.fileno()
+
+    def close(self):
+        self._fh.close()
+
+
+@require_safe
+def serve_media(request, path):
+    path = posixpath.normpath(path).lstrip("/")
+    if not path.startswith(tuple(getattr(settings, "MEDIA_SERVE_PREFIXES", ()))):
+        raise Http404
+    try:
+        fullpath = safe_join(settings.MEDIA_ROOT, path)
+        st = os.stat(fullpath)
+    except (SuspiciousFileOperation, OSError):
+        raise Http404
+    if not stat.S_ISREG(st.st_mode):
+        raise Http404
+
+    etag = media_etag(st)
+    headers = {
+        "ETag": etag,
+        "Last-Modified": http_date(st.st_mtime),
+        "Cache-Control": IMMUTABLE if _CONTENT_ADDRESSED.search(path) else settings.MEDIA_CACHE_CONTROL,
+        "Accept-Ranges": "bytes",
+    }
+    if _not_modified(request, etag, st.st_mtime):
+        response = HttpResponseNotModified()
+    else:
+        response = _file_response(request, path, fullpath, st, etag)
+    for key, value in headers.items():
+        response[key] = value
+    return response
+
+
+def _file_response(request, path, fullpath, st, etag):
+    content_type = mimetypes.guess_type(fullpath)[0] or "application/octet-stream"
+    accel = getattr(settings, "MEDIA_ACCEL_REDIRECT", "")
+    if accel:
+        # le proxy gère lui-même Range et l'envoi du fichier
+        response = HttpResponse(content_type=content_type)
+        response["X-Accel-Redirect"] = f"{accel.rstrip('/')}/{quote(path)}"
+        return response
+
+    byte_range = None
+    if "Range" in request.headers and _if_range_ok(request, etag, st.st_mtime):
+        try:
+            byte_range = parse_range(request.headers["Range"], st.st_size)
+        except ValueError:
+            response = HttpResponse(status=416)
+            response["Content-Range"] = f"bytes */{st.st_size}"
+            return response
+
+    fh = open(fullpath, "rb")
+    if byte_range is None:
+        return FileResponse(fh, content_type=content_type)
+    start, end = byte_range
+    response = FileResponse(FileRange(fh, start, end - start + 1), status=206, content_type=content_type)
+    response["Content-Length"] = end - start + 1
+    response["Content-Range"] = f"bytes {start}-{end}/{st.st_size}"
+    return response
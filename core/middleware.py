@@ -0,0 +1,358 @@
+# core/middleware.py
+import logging
+import random
+import time
+from contextlib import ExitStack
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction, sync_to_async
+from django.conf import settings
+from django.contrib.auth import middleware as auth_middleware
+from django.contrib.messages import middleware as messages_middleware
+from django.contrib.sessions import middleware as sessions_middleware
+from django.core.exceptions import MiddlewareNotUsed
+from django.middleware import csrf
+from django.db import connections
+from django.utils import translation
+from django.utils.cache import patch_vary_headers
+from whitenoise import middleware as whitenoise_middleware
+
+from . import compression, perf, refdata, routing
+from .i18n import reset_language, resolve_language, set_language
+
+perf_logger = logging.getLogger("core.perf")
+
+
+class HybridMiddleware:
+    """
+    Base des middlewares du projet, utilisables dans une pile WSGI comme ASGI :
+    sous ASGI, ``__acall__`` attend la suite de la pile sur la boucle, sans
+    repasser par un thread (un seul middleware sync suffit à en imposer un
+    par requête, long-poll compris).
+    """
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.async_mode = iscoroutinefunction(get_response)
+        if self.async_mode:
+            markcoroutinefunction(self)
+
+
+class RequestLanguageMiddleware(HybridMiddleware):
+    """
+    Résout la langue une fois par requête (``?lang=`` puis ``Accept-Language``),
+    l'active pour la durée de la requête puis la réinitialise.
+    """
+
+    def _activate(self, request):
+        lang = resolve_language(request)
+        request.LANGUAGE_CODE = lang
+        translation.activate(lang)
+        return lang, set_language(lang)
+
+    def _finish(self, response, lang):
+        response.headers.setdefault("Content-Language", lang)
+        patch_vary_headers(response, ("Accept-Language",))
+        return response
+
+    def __call__(self, request):
+        if self.async_mode:
+            return self.__acall__(request)
+        lang, token = self._activate(request)
+        try:
+            response = self.get_response(request)
+        finally:
+            translation.deactivate()
+            reset_language(token)
+        return self._finish(response, lang)
+
+    async def __acall__(self, request):
+        lang, token = self._activate(request)
+        try:
+            response = await self.get_response(request)
+        finally:
+            translation.deactivate()
+            reset_language(token)
+        return self._finish(response, lang)
+
+
+class ReferenceDataMiddleware(HybridMiddleware):
+    """Fige le snapshot des données de référence pour toute la requête."""
+
+    def __call__(self, request):
+        if self.async_mode:
+            return self.__acall__(request)
+        token = refdata.begin_request()
+        try:
+            return self.get_response(request)
+        finally:
+            refdata.end_request(token)
+
+    async def __acall__(self, request):
+        token = refdata.begin_request()
+        try:
+            return await self.get_response(request)
+        finally:
+            refdata.end_request(token)
+
+
+class DatabaseRoutingMiddleware(HybridMiddleware):
+    """Routage lecture/écriture propre à la requête (réplica, épinglage), cf. core/routing.py."""
+
+    def __call__(self, request):
+        if self.async_mode:
+            return self.__acall__(request)
+        token = routing.begin_request()
+        try:
+            return self.get_response(request)
+        finally:
+            routing.end_request(token)
+
+    async def __acall__(self, request):
+        token = routing.begin_request()
+        try:
+            return await self.get_response(request)
+        finally:
+            routing.end_request(token)
+
+
+class PerfMiddleware(HybridMiddleware):
+    """
+    Mesure SQL / sérialisation / rendu / total d'une fraction des requêtes
+    (``PERF_SAMPLE_RATE``), alimente ``perf.registry`` et renvoie un en-tête
+    ``Server-Timing``. À placer en tête de ``MIDDLEWARE``.
+    """
+
+    def __init__(self, get_response):
+        if not getattr(settings, "PERF_ENABLED", True):
+            raise MiddlewareNotUsed
+        super().__init__(get_response)
+        self.sample_rate = getattr(settings, "PERF_SAMPLE_RATE", 1.0)
+        self.server_timing = getattr(settings, "PERF_SERVER_TIMING", True)
+        self.slow_ms = getattr(settings, "PERF_SLOW_REQUEST_MS", None)
+        perf.install_serializer_timing()
+
+    def _sampled(self):
+        return self.sample_rate >= 1 or random.random() < self.sample_rate
+
+    @staticmethod
+    def _wrap_connections(stack, timer):
+        for conn in connections.all():
+            stack.enter_context(conn.execute_wrapper(timer.execute_wrapper))
+
+    def __call__(self, request):
+        if self.async_mode:
+            return self.__acall__(request)
+        if not self._sampled():
+            return self.get_response(request)
+
+        timer = perf.RequestTimer()
+        token = perf.activate(timer)
+        try:
+            with ExitStack() as stack:
+                self._wrap_connections(stack, timer)
+                response = self.get_response(request)
+        finally:
+            perf.deactivate(token)
+        return self._record(request, response, timer)
+
+    async def __acall__(self, request):
+        if not self._sampled():
+            return await self.get_response(request)
+
+        timer = perf.RequestTimer()
+        token = perf.activate(timer)
+        # connexions propres à chaque thread : les wrappers sont posés (et
+        # retirés) dans le thread où s'exécute l'ORM de la requête
+        stack = ExitStack()
+        try:
+            await sync_to_async(self._wrap_connections)(stack, timer)
+            response = await self.get_response(request)
+        finally:
+            await sync_to_async(stack.close)()
+            perf.deactivate(token)
+        return self._record(request, response, timer)
+
+    def _record(self, request, response, timer):
+        timer.finish()
+
+        match = request.resolver_match
+        key = f"{request.method} {match.view_name if match else '<unresolved>'}"
+        perf.registry.record(key, timer, response.status_code)
+        if self.server_timing:
+            response["Server-Timing"] = timer.server_timing()
+        if self.slow_ms is not None:
+            spans = timer.spans()
+            if spans["total"] >= self.slow_ms:
+                perf_logger.warning(
+                    "Requête lente %s %s : %.0f ms (db %.0f ms / %d requêtes, serialize %.0f ms, render %.0f ms)",
+                    key, request.path, spans["total"], spans["db"], timer.queries,
+                    spans["serialize"], spans["render"],
+                )
+        return response
+
+    def process_template_response(self, request, response):
+        # appelé juste avant response.render() : borne le temps de rendu
+        timer = perf.current_timer()
+        if timer is not None:
+            timer.render_started()
+            response.add_post_render_callback(timer.render_finished)
+        return response
+
+
+class CompressionMiddleware(HybridMiddleware):
+    """
+    Compression Brotli / gzip des réponses sous ``API_COMPRESSION_PREFIXES``
+    (le statique est déjà précompressé par WhiteNoise).
+
+    Encodage négocié sur ``Accept-Encoding`` (Brotli préféré à qualité égale),
+    corps de moins de ``API_COMPRESSION_MIN_BYTES`` laissés tels quels, streaming
+    compressé paquet par paquet (premier octet inchangé). Exclus : réponses
+    déjà encodées, ``Cache-Control: no-transform``, types non textuels et
+    ``API_COMPRESSION_EXCLUDE`` (jetons d'authentification : pas de secret
+    compressé à côté d'une entrée réfléchie, cf. BREACH).
+    À placer juste après ``PerfMiddleware``.
+    """
+
+    def __init__(self, get_response):
+        if not getattr(settings, "API_COMPRESSION_ENABLED", True):
+            raise MiddlewareNotUsed
+        super().__init__(get_response)
+        self.prefixes = tuple(getattr(settings, "API_COMPRESSION_PREFIXES", ("/api/",)))
+        self.exclude = tuple(getattr(settings, "API_COMPRESSION_EXCLUDE", ()))
+        self.min_bytes = getattr(settings, "API_COMPRESSION_MIN_BYTES", 1024)
+        self.levels = {
+            "gzip": getattr(settings, "API_COMPRESSION_GZIP_LEVEL", 6),
+            "br": getattr(settings, "API_COMPRESSION_BROTLI_QUALITY", 4),
+        }
+        self.encodings = tuple(
+            e for e in compression.available_encodings()
+            if e in getattr(settings, "API_COMPRESSION_ENCODINGS", ("br", "gzip"))
+        )
+
+    def __call__(self, request):
+        if self.async_mode:
+            return self.__acall__(request)
+        return self.compress(request, self.get_response(request))
+
+    async def __acall__(self, request):
+        return self.compress(request, await self.get_response(request))
+
+    def compress(self, request, response):
+        path = request.path
+        if not path.startswith(self.prefixes) or path.startswith(self.exclude) or not self.encodings:
+            return response
+        if response.has_header("Content-Encoding") or not compression.is_compressible(response.get("Content-Type")):
+            return response
+        if "no-transform" in response.get("Cache-Control", ""):
+            return response
+
+        patch_vary_headers(response, ("Accept-Encoding",))
+        encoding = compression.negotiate(request.headers.get("Accept-Encoding", ""), self.encodings)
+        if encoding is None:
+            return response
+        level = self.levels[encoding]
+
+        if response.streaming:
+            if response.is_async:
+                response.streaming_content = compression.acompress_stream(
+                    response.streaming_content, encoding, level
+                )
+            else:
+                response.streaming_content = compression.compress_stream(response.streaming_content, encoding, level)
+            del response["Content-Length"]
+        else:
+            if len(response.content) < self.min_bytes:
+                return response
+            t0 = time.perf_counter()
+            compressed = compression.compress(response.content, encoding, level)
+            timer = perf.current_timer()
+            if timer is not None:
+                timer.compress += time.perf_counter() - t0
+            if len(compressed) >= len(response.content):
+                return response
+            response.content = compressed
+            response["Content-Length"] = str(len(compressed))
+
+        # représentation différente : un ETag fort ne peut plus être garanti
+        etag = response.get("ETag")
+        if etag and etag.startswith('"'):
+            response["ETag"] = "W/" + etag
+        response["Content-Encoding"] = encoding
+        return response
+
+
+class StatelessPathMixin:
+    """
+    Court-circuite un middleware « à état » (session, CSRF, utilisateur de
+    session, messages) pour les chemins ``STATELESS_PATH_PREFIXES`` : l'API
+    s'authentifie uniquement par JWT (``request.user`` est posé par DRF), sans
+    cookie de session, donc sans session à charger ni CSRF à vérifier.
+    Admin et SPA gardent la pile complète.
+
+    Sous-classes des middlewares Django : les checks de l'admin (E408-E410)
+    les reconnaissent toujours.
+    """
+
+    def __init__(self, get_response):
+        super().__init__(get_response)
+        self.stateless_prefixes = tuple(getattr(settings, "STATELESS_PATH_PREFIXES", ()))
+
+    def is_stateless(self, request):
+        return request.path_info.startswith(self.stateless_prefixes)
+
+    def __call__(self, request):
+        if self.is_stateless(request):
+            return self.get_response(request)  # coroutine en mode async : attendue par l'appelant
+        return super().__call__(request)
+
+
+class SessionMiddleware(StatelessPathMixin, sessions_middleware.SessionMiddleware):
+    pass
+
+
+class CsrfViewMiddleware(StatelessPathMixin, csrf.CsrfViewMiddleware):
+
+    def process_view(self, request, callback, callback_args, callback_kwargs):
+        if self.is_stateless(request):
+            return None
+        return super().process_view(request, callback, callback_args, callback_kwargs)
+
+
+class AuthenticationMiddleware(StatelessPathMixin, auth_middleware.AuthenticationMiddleware):
+    pass
+
+
+class MessageMiddleware(StatelessPathMixin, messages_middleware.MessageMiddleware):
+    pass
+
+
+class WhiteNoiseMiddleware(whitenoise_middleware.WhiteNoiseMiddleware):
+    """
+    WhiteNoise utilisable dans une pile ASGI : hors ``autorefresh`` (DEBUG),
+    trouver le fichier n'est qu'une lecture de dict, le reste de la pile est
+    attendu sur la boucle.
+    """
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response=None, settings=settings):
+        super().__init__(get_response, settings)
+        self.async_mode = iscoroutinefunction(get_response)
+        if self.async_mode:
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if self.async_mode:
+            return self.__acall__(request)
+        return super().__call__(request)
+
+    async def __acall__(self, request):
+        if self.autorefresh:
+            static_file = self.find_file(request.path_info)
+        else:
+            static_file = self.files.get(request.path_info)
+        if static_file is not None:
+            return self.serve(static_file, request)
+        return await self.get_response(request)
@@ -0,0 +1,18 @@
+# core/models.py
+from django.db import models
+
+
+class ReferenceDataVersion(models.Model):
+    """
+    Compteur unique (pk=1) incrémenté à chaque modification d'une table de
+    référence (salles, types, interventions, urgences, spécialités).
+    Chaque worker le compare à sa copie en mémoire (cf. core/refdata.py).
+    """
+    version = models.PositiveBigIntegerField(default=0)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        verbose_name = "Version des données de référence"
+
+    def __str__(self):
+        return f"v{self.version}"
@@ -0,0 +1,216 @@
+# core/partitions.py
+"""
+Partitionnement mensuel natif (PostgreSQL) des tables qui croissent sans
+borne : ``Referral`` et ``ArrivalNotification``, par ``created_at``.
+
+Optionnel (``DB_PARTITIONING=1``, sans effet hors PostgreSQL) et jamais
+appliqué par les migrations tant que la conversion n'a pas été validée sur
+un vrai serveur PostgreSQL (``test_convert_keeps_rows_and_prunes_months``) :
+
+- ``manage.py partitions --convert`` : la table est recréée
+  ``PARTITION BY RANGE (created_at)``, clé primaire ``(id, created_at)``,
+  index et clés étrangères d'origine, données recopiées
+  (``--unpartition`` pour revenir en arrière) ;
+- une partition par mois (UTC) ``<table>_pAAAAMM`` jusqu'à
+  ``DB_PARTITION_MONTHS_AHEAD`` mois à l'avance, créées après chaque
+  ``migrate`` et par ``manage.py partitions`` (cron quotidien), plus une
+  partition ``<table>_default`` de secours qui doit rester vide ;
+- ``created_range()`` : filtres ``from`` / ``to`` en comparaisons directes
+  sur la clé de partition, que le planificateur sait élaguer (pas de
+  ``created_at::date``).
+
+Côté Django rien ne change : ``id`` reste la clé primaire du modèle.
+"""
+import datetime
+import logging
+
+from django.apps import apps
+from django.conf import settings
+from django.db import DEFAULT_DB_ALIAS, DatabaseError, NotSupportedError, connections, transaction
+from django.utils import timezone
+from django.utils.dateparse import parse_date, parse_datetime
+
+logger = logging.getLogger(__name__)
+
+# modèle → champ de partition
+PARTITIONED = {
+    "referrals.Referral": "created_at",
+    "notifications.ArrivalNotification": "created_at",
+}
+
+
+def enabled(connection):
+    return connection.vendor == "postgresql" and getattr(settings, "DB_PARTITIONING", False)
+
+
+def month_start(value):
+    return datetime.date(value.year, value.month, 1)
+
+
+def next_month(month):
+    return datetime.date(month.year + month.month // 12, month.month % 12 + 1, 1)
+
+
+def last_month(months_ahead=None):
+    """Dernier mois à couvrir : mois courant + ``DB_PARTITION_MONTHS_AHEAD``."""
+    if months_ahead is None:
+        months_ahead = getattr(settings, "DB_PARTITION_MONTHS_AHEAD", 3)
+    month = month_start(timezone.now())
+    for _ in range(months_ahead):
+        month = next_month(month)
+    return month
+
+
+def partition_name(table, month):
+    return f"{table}_p{month:%Y%m}"
+
+
+def is_partitioned(connection, table):
+    with connection.cursor() as cursor:
+        cursor.execute("SELECT 1 FROM pg_partitioned_table WHERE partrelid = to_regclass(%s)", [table])
+        return cursor.fetchone() is not None
+
+
+def create_partitions(connection, table, first, last):
+    """Partitions mensuelles de ``table`` du mois de ``first`` à ``last`` inclus ; noms créés."""
+    qn = connection.ops.quote_name
+    created = []
+    month = month_start(first)
+    while month <= last:
+        name, upper = partition_name(table, month), next_month(month)
+        try:
+            with transaction.atomic(using=connection.alias), connection.cursor() as cursor:
+                cursor.execute("SELECT to_regclass(%s) IS NOT NULL", [name])
+                if not cursor.fetchone()[0]:
+                    cursor.execute(
+                        f"CREATE TABLE {qn(name)} PARTITION OF {qn(table)} "
+                        f"FOR VALUES FROM ('{month.isoformat()}') TO ('{upper.isoformat()}')"
+                    )
+                    created.append(name)
+        except DatabaseError:
+            # lignes de ce mois déjà tombées dans la partition par défaut : à déplacer à la main
+            logger.warning("Partition %s non créée", name, exc_info=True)
+        month = upper
+    return created
+
+
+def ensure_partitions(using=DEFAULT_DB_ALIAS, months_ahead=None):
+    """Crée les partitions manquantes jusqu'à ``last_month()`` ; noms des partitions créées."""
+    connection = connections[using]
+    if connection.vendor != "postgresql":
+        return []
+    created = []
+    for label in PARTITIONED:
+        table = apps.get_model(label)._meta.db_table
+        if is_partitioned(connection, table):
+            created += create_partitions(connection, table, timezone.now(), last_month(months_ahead))
+    if created:
+        logger.info("Partitions créées : %s", ", ".join(created))
+    return created
+
+
+def after_migrate(sender, using=DEFAULT_DB_ALIAS, **kwargs):
+    """Receiver ``post_migrate`` : partitions des mois à venir."""
+    ensure_partitions(using)
+
+
+def _rebuild(connection, model, partition_by=None, months_ahead=None):
+    """
+    Recrée la table de ``model`` (partitionnée par ``partition_by`` ou simple)
+    avec ses données, index, clés étrangères et séquence, en une transaction.
+    """
+    table, pk = model._meta.db_table, model._meta.pk.column
+    qn = connection.ops.quote_name
+    old = f"{table}_old"
+    with transaction.atomic(using=connection.alias), connection.cursor() as cursor:
+        # contrôles de clés étrangères différés en attente : DROP TABLE les refuserait
+        cursor.execute("SET CONSTRAINTS ALL IMMEDIATE")
+        cursor.execute("SELECT count(*) FROM pg_constraint WHERE confrelid = to_regclass(%s)", [table])
+        if cursor.fetchone()[0]:
+            raise NotSupportedError(f"{table} est référencée par des clés étrangères")
+        cursor.execute(
+            "SELECT pg_get_indexdef(indexrelid), indisunique FROM pg_index "
+            "WHERE indrelid = to_regclass(%s) AND NOT indisprimary", [table],
+        )
+        indexes = cursor.fetchall()
+        if any(unique for _, unique in indexes):
+            raise NotSupportedError(f"{table} : index unique sans la clé de partition")
+        cursor.execute(
+            "SELECT conname, pg_get_constraintdef(oid) FROM pg_constraint "
+            "WHERE conrelid = to_regclass(%s) AND contype = 'f'", [table],
+        )
+        foreign_keys = cursor.fetchall()
+
+        cursor.execute(f"ALTER TABLE {qn(table)} RENAME TO {qn(old)}")
+        partitioning = f" PARTITION BY RANGE ({qn(partition_by)})" if partition_by else ""
+        cursor.execute(f"CREATE TABLE {qn(table)} (LIKE {qn(old)} INCLUDING DEFAULTS INCLUDING CONSTRAINTS){partitioning}")
+        # identité / serial de l'ancienne table : remplacée par une séquence propre (plus bas)
+        cursor.execute(f"ALTER TABLE {qn(table)} ALTER {qn(pk)} DROP DEFAULT")
+        if partition_by:
+            cursor.execute(f"SELECT min({qn(partition_by)}) FROM {qn(old)}")
+            oldest = cursor.fetchone()[0] or timezone.now()
+            cursor.execute(f"CREATE TABLE {qn(table + '_default')} PARTITION OF {qn(table)} DEFAULT")
+            create_partitions(connection, table, oldest, last_month(months_ahead))
+        cursor.execute(f"INSERT INTO {qn(table)} SELECT * FROM {qn(old)}")
+        cursor.execute(f"DROP TABLE {qn(old)}")  # avec ses partitions, index et séquence
+
+        primary = (pk, partition_by) if partition_by else (pk,)
+        cursor.execute(f"ALTER TABLE {qn(table)} ADD PRIMARY KEY ({', '.join(map(qn, primary))})")
+        for statement, _ in indexes:
+            cursor.execute(statement.replace(" ON ONLY ", " ON ", 1))
+        for name, definition in foreign_keys:
+            cursor.execute(f"ALTER TABLE {qn(table)} ADD CONSTRAINT {qn(name)} {definition}")
+        sequence = f"{table}_{pk}_seq"
+        cursor.execute(f"CREATE SEQUENCE {qn(sequence)} OWNED BY {qn(table)}.{qn(pk)}")
+        cursor.execute(f"ALTER TABLE {qn(table)} ALTER {qn(pk)} SET DEFAULT nextval('{sequence}'::regclass)")
+        cursor.execute(f"SELECT setval('{sequence}', coalesce(max({qn(pk)}), 0) + 1, false) FROM {qn(table)}")
+
+
+def convert(connection, model, months_ahead=None):
+    """Partitionne par mois la table de ``model`` ; False si elle l'était déjà."""
+    if is_partitioned(connection, model._meta.db_table):
+        return False
+    field = model._meta.get_field(PARTITIONED[model._meta.label])
+    _rebuild(connection, model, partition_by=field.column, months_ahead=months_ahead)
+    return True
+
+
+def unpartition(connection, model):
+    """Inverse de ``convert`` : table simple ; False si elle l'était déjà."""
+    if not is_partitioned(connection, model._meta.db_table):
+        return False
+    _rebuild(connection, model)
+    return True
+
+
+# -----------------------
+# Filtres élagables
+# -----------------------
+def _bound(value, end=False):
+    """``(opérateur, date-heure aware)`` d'une borne ISO ; une date seule en fin inclut la journée."""
+    if not value:
+        return None
+    try:
+        day = parse_date(value)
+        moment = None if day else parse_datetime(value)
+    except ValueError:
+        return None
+    if day:
+        if end:
+            return "lt", timezone.make_aware(datetime.datetime.combine(day + datetime.timedelta(days=1), datetime.time.min))
+        return "gte", timezone.make_aware(datetime.datetime.combine(day, datetime.time.min))
+    if moment is None:
+        return None
+    if timezone.is_naive(moment):
+        moment = timezone.make_aware(moment)
+    return ("lte" if end else "gte"), moment
+
+
+def created_range(params, field="created_at"):
+    """Filtres ``from`` / ``to`` de ``params`` (date ou date-heure ISO, valeurs illisibles ignorées)."""
+    filters = {}
+    for param, end in (("from", False), ("to", True)):
+        bound = _bound(params.get(param), end)
+        if bound:
+            filters[f"{field}__{bound[0]}"] = bound[1]
+    return filters
@@ -0,0 +1,225 @@
+# core/perf.py
+"""
+Instrumentation des requêtes (cf. ``PerfMiddleware``).
+
+Pour chaque requête échantillonnée on mesure :
+
+- ``db``        : temps et nombre de requêtes SQL (``execute_wrapper``) ;
+- ``serialize`` : temps passé dans ``serializer.data`` hors SQL (le SQL
+  déclenché par un queryset paresseux est compté dans ``db``) ;
+- ``render``    : rendu de la ``Response`` DRF (JSON) ;
+- ``app``       : le reste (middlewares, permissions, logique de vue) ;
+- ``total``.
+
+Les durées alimentent des histogrammes par vue, en mémoire et propres au
+process (chaque worker gunicorn a les siens), lus par ``/api/_perf/``.
+"""
+import bisect
+import math
+import os
+import threading
+import time
+from contextvars import ContextVar
+
+SPANS = ("db", "serialize", "render", "compress", "app", "total")
+
+# bornes (ms) des buckets : progression géométrique ×1.2 de 0.05 ms à ~2 min,
+# soit une erreur relative < 20 % sur les percentiles pour ~80 compteurs
+_BOUNDS = tuple(0.05 * 1.2 ** i for i in range(int(math.log(120_000 / 0.05, 1.2)) + 2))
+
+_current = ContextVar("perf_timer", default=None)
+
+
+class Histogram:
+    """Histogramme à buckets fixes : mémoire constante, enregistrement O(log n)."""
+    __slots__ = ("counts", "count", "sum", "max")
+
+    def __init__(self):
+        self.counts = [0] * (len(_BOUNDS) + 1)
+        self.count = 0
+        self.sum = 0.0
+        self.max = 0.0
+
+    def record(self, value):
+        self.counts[bisect.bisect_left(_BOUNDS, value)] += 1
+        self.count += 1
+        self.sum += value
+        if value > self.max:
+            self.max = value
+
+    def percentile(self, pct):
+        if not self.count:
+            return None
+        rank = math.ceil(self.count * pct / 100)
+        seen = 0
+        for i, n in enumerate(self.counts):
+            seen += n
+            if seen >= rank:
+                return min(_BOUNDS[i] if i < len(_BOUNDS) else self.max, self.max)
+        return self.max
+
+    def summary(self, digits=2):
+        if not self.count:
+            return {"count": 0}
+        r = lambda v: round(v, digits)  # noqa: E731
+        return {
+            "count": self.count,
+            "mean": r(self.sum / self.count),
+            "p50": r(self.percentile(50)),
+            "p95": r(self.percentile(95)),
+            "p99": r(self.percentile(99)),
+            "max": r(self.max),
+        }
+
+
+class ViewStats:
+    __slots__ = ("spans", "queries", "errors")
+
+    def __init__(self):
+        self.spans = {name: Histogram() for name in SPANS}
+        self.queries = Histogram()
+        self.errors = 0
+
+    def summary(self):
+        queries = self.queries.summary(digits=1)
+        return {
+            "count": self.spans["total"].count,
+            "errors": self.errors,
+            **{f"{name}_ms": self.spans[name].summary() for name in SPANS},
+            "queries": {k: v for k, v in queries.items() if k in ("mean", "p95", "max")},
+        }
+
+
+class Registry:
+    """Agrégats par vue (« GET referral-list »…), partagés par les threads du process."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        with self._lock:
+            self._views = {}
+            self.started_at = time.time()
+
+    def record(self, key, timer, status_code):
+        spans = timer.spans()
+        with self._lock:
+            stats = self._views.get(key)
+            if stats is None:
+                stats = self._views[key] = ViewStats()
+            for name, ms in spans.items():
+                stats.spans[name].record(ms)
+            stats.queries.record(timer.queries)
+            if status_code >= 500:
+                stats.errors += 1
+
+    def snapshot(self):
+        with self._lock:
+            views = {key: stats.summary() for key, stats in sorted(self._views.items())}
+        return {"pid": os.getpid(), "since": self.started_at, "views": views}
+
+
+registry = Registry()
+
+
+# ============================================================
+# 🔹 Mesures d'une requête
+# ============================================================
+class RequestTimer:
+    __slots__ = ("start", "end", "db", "queries", "serialize", "render", "compress", "_depth", "_render_start")
+
+    def __init__(self):
+        self.start = time.perf_counter()
+        self.end = None
+        self.db = self.serialize = self.render = self.compress = 0.0
+        self.queries = 0
+        self._depth = 0
+        self._render_start = None
+
+    # --- SQL ---
+    def execute_wrapper(self, execute, sql, params, many, context):
+        t0 = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.db += time.perf_counter() - t0
+            self.queries += 1
+
+    # --- rendu ---
+    def render_started(self):
+        self._render_start = time.perf_counter()
+
+    def render_finished(self, response=None):
+        if self._render_start is not None:
+            self.render += time.perf_counter() - self._render_start
+            self._render_start = None
+
+    def finish(self):
+        self.end = time.perf_counter()
+
+    def spans(self):
+        """Durées en ms ; ``app`` = total moins les autres postes."""
+        total = ((self.end or time.perf_counter()) - self.start) * 1000
+        db, serialize, render = self.db * 1000, self.serialize * 1000, self.render * 1000
+        compress = self.compress * 1000
+        return {
+            "db": db,
+            "serialize": serialize,
+            "render": render,
+            "compress": compress,
+            "app": max(total - db - serialize - render - compress, 0.0),
+            "total": total,
+        }
+
+    def server_timing(self):
+        spans = self.spans()
+        parts = [f'db;dur={spans["db"]:.1f};desc="{self.queries} queries"']
+        parts += [f"{name};dur={spans[name]:.1f}" for name in ("serialize", "render", "compress", "app", "total")]
+        return ", ".join(parts)
+
+
+def current_timer():
+    return _current.get()
+
+
+def activate(timer):
+    return _current.set(timer)
+
+
+def deactivate(token):
+    _current.reset(token)
+
+
+# ============================================================
+# 🔹 Temps de sérialisation (DRF)
+# ============================================================
+def _timed_data(prop):
+    fget = prop.fget
+
+    def data(self):
+        timer = _current.get()
+        # serializer imbriqué / appelé depuis un autre : compté par le plus externe
+        if timer is None or timer._depth:
+            return fget(self)
+        timer._depth += 1
+        db_before = timer.db
+        t0 = time.perf_counter()
+        try:
+            return fget(self)
+        finally:
+            timer._depth -= 1
+            timer.serialize += max((time.perf_counter() - t0) - (timer.db - db_before), 0.0)
+
+    data._perf_timed = True
+    return property(data, doc=prop.__doc__)
+
+
+def install_serializer_timing():
+    """Enveloppe ``Serializer.data`` / ``ListSerializer.data`` (idempotent)."""
+    from rest_framework import serializers
+
+    for cls in (serializers.Serializer, serializers.ListSerializer):
+        prop = cls.__dict__["data"]
+        if not getattr(prop.fget, "_perf_timed", False):
+            cls.data = _timed_data(prop)
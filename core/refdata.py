@@ -0,0 +1,254 @@
+# core/refdata.py
+"""
+Cache process-wide des données de référence.
+
+Salles, types de rendez-vous, types d'intervention, niveaux d'urgence et
+spécialités changent quelques fois par an mais sont lus à chaque requête.
+Chaque worker en garde une copie immuable (``Snapshot``) ; une ligne
+``ReferenceDataVersion`` est incrémentée à chaque save/delete et le worker la
+relit au plus toutes les ``REFDATA_CHECK_INTERVAL`` secondes pour savoir s'il
+doit recharger.
+"""
+import threading
+import time
+from collections import namedtuple
+from contextvars import ContextVar
+from types import MappingProxyType
+
+from django.apps import apps
+from django.conf import settings
+from django.db import connection, transaction
+from django.db.models import F
+from rest_framework import serializers
+
+from .i18n import bilingual, get_language, reset_language, set_language
+
+# nom → (modèle, colonnes, tri)
+TABLES = {
+    "rooms": ("appointments.Room", ("id", "name_fr", "name_en", "status"), ("id",)),
+    "appointment_types": ("appointments.AppointmentType", ("id", "name_fr", "name_en"), ("id",)),
+    "intervention_types": (
+        "referrals.InterventionType",
+        ("id", "name_fr", "name_en", "description_fr", "description_en"),
+        ("name_fr",),
+    ),
+    "urgency_levels": ("referrals.UrgencyLevel", ("id", "name_fr", "name_en", "color", "priority"), ("priority",)),
+    "specialties": ("accounts.Specialty", ("id", "name_fr", "name_en", "is_active"), ("name_fr",)),
+}
+
+_row_types = {}
+
+
+def _row_type(table):
+    """namedtuple par table (immuable, accès par attribut comme une instance)."""
+    if table not in _row_types:
+        base = namedtuple(f"{table.title().replace('_', '')}Row", TABLES[table][1])
+        _row_types[table] = type(base.__name__, (base,), {
+            "__slots__": (),
+            "pk": property(lambda self: self.id),
+            "__str__": lambda self: bilingual(self) or str(self.id),
+        })
+    return _row_types[table]
+
+
+class Snapshot:
+    """Copie immuable des tables de référence pour une version donnée."""
+
+    def __init__(self, version, rows, volatile=False):
+        self.version = version
+        # chargée dans une transaction (tests…) : à revérifier à chaque accès
+        self.volatile = volatile
+        self._rows = {name: tuple(r) for name, r in rows.items()}
+        self._by_id = {name: MappingProxyType({r.id: r for r in r_}) for name, r_ in self._rows.items()}
+        self._serialized = {}
+
+    def rows(self, table):
+        return self._rows[table]
+
+    def get(self, table, pk):
+        return self._by_id[table].get(pk)
+
+    def label(self, table, pk, lang=None, fallback=True, empty=""):
+        return bilingual(self._by_id[table].get(pk), lang=lang, fallback=fallback, empty=empty)
+
+    def find_ids(self, table, needle, fields=("name_fr", "name_en")):
+        """ids dont un des champs contient ``needle`` (équivalent d'un ``icontains``)."""
+        needle = (needle or "").lower()
+        return [
+            r.id for r in self._rows[table]
+            if any(needle in (getattr(r, f) or "").lower() for f in fields)
+        ]
+
+    def serialized(self, table, serializer_class, lang=None):
+        """
+        ``{pk: données sérialisées}`` calculé une fois par version et par langue.
+        Les dicts renvoyés sont partagés : ne pas les modifier.
+        """
+        lang = lang or get_language()
+        key = (table, serializer_class, lang)
+        cached = self._serialized.get(key)
+        if cached is None:
+            token = set_language(lang)
+            try:
+                cached = {r.id: serializer_class(r).data for r in self._rows[table]}
+            finally:
+                reset_language(token)
+            self._serialized[key] = cached
+        return cached
+
+
+# ============================================================
+# 🔹 Cache du worker
+# ============================================================
+_lock = threading.Lock()
+_snapshot = None
+_checked_at = 0.0
+
+# snapshot figé pour la durée d'une requête (cf. ReferenceDataMiddleware)
+_request_snapshot = ContextVar("request_refdata", default=None)
+
+
+def current_version():
+    from .models import ReferenceDataVersion
+    return ReferenceDataVersion.objects.filter(pk=1).values_list("version", flat=True).first() or 0
+
+
+def _load(version):
+    rows = {}
+    for name, (label, fields, ordering) in TABLES.items():
+        model = apps.get_model(label)
+        row_type = _row_type(name)
+        rows[name] = [row_type._make(v) for v in model.objects.order_by(*ordering).values_list(*fields)]
+    return Snapshot(version, rows, volatile=connection.in_atomic_block)
+
+
+def begin_request():
+    return _request_snapshot.set([None])
+
+
+def end_request(token):
+    _request_snapshot.reset(token)
+
+
+def pin_snapshot(snap):
+    """Fige ``snap`` pour le contexte courant (hors middleware, ex. réponse en streaming)."""
+    return _request_snapshot.set([snap])
+
+
+def get_snapshot():
+    """Snapshot à jour (une requête de version au plus par intervalle)."""
+    holder = _request_snapshot.get()
+    if holder is not None and holder[0] is not None:
+        return holder[0]
+    snap = _get_worker_snapshot()
+    if holder is not None:
+        holder[0] = snap
+    return snap
+
+
+def _get_worker_snapshot():
+    global _snapshot, _checked_at
+    snap = _snapshot
+    now = time.monotonic()
+    interval = getattr(settings, "REFDATA_CHECK_INTERVAL", 2.0)
+    if snap is not None and not snap.volatile and now - _checked_at < interval:
+        return snap
+
+    version = current_version()
+    if snap is None or snap.version != version:
+        with _lock:
+            snap = _snapshot
+            if snap is None or snap.version != version:
+                snap = _snapshot = _load(version)
+    _checked_at = now
+    return snap
+
+
+def invalidate():
+    """Oublie la copie locale (rechargée au prochain accès)."""
+    global _snapshot, _checked_at
+    _snapshot = None
+    _checked_at = 0.0
+    holder = _request_snapshot.get()
+    if holder is not None:
+        holder[0] = None
+
+
+def bump_version(**kwargs):
+    """Receiver post_save / post_delete des modèles de référence."""
+    from .models import ReferenceDataVersion
+    if not ReferenceDataVersion.objects.filter(pk=1).update(version=F("version") + 1):
+        ReferenceDataVersion.objects.get_or_create(pk=1, defaults={"version": 1})
+    invalidate()
+    transaction.on_commit(invalidate)
+
+
+def reference_models():
+    return [apps.get_model(label) for label, _, _ in TABLES.values()]
+
+
+# ============================================================
+# 🔹 Champs DRF / admin
+# ============================================================
+class RefLabelField(serializers.Field):
+    """Libellé bilingue d'une FK de référence lu dans le cache (``source="room_id"``)."""
+
+    def __init__(self, table, fallback=True, empty="", **kwargs):
+        kwargs["read_only"] = True
+        super().__init__(**kwargs)
+        self.table = table
+        self.fallback = fallback
+        self.empty = empty
+
+    def get_attribute(self, instance):
+        pk = super().get_attribute(instance)
+        # None ne doit pas court-circuiter vers null : on renvoie ``empty``
+        return self.empty if pk is None else pk
+
+    def to_representation(self, pk):
+        if pk is self.empty:
+            return pk
+        return get_snapshot().label(self.table, pk, fallback=self.fallback, empty=self.empty)
+
+
+class RefDataField(serializers.Field):
+    """Objet de référence imbriqué, servi depuis le cache déjà sérialisé."""
+
+    def __init__(self, table, serializer_class, **kwargs):
+        kwargs["read_only"] = True
+        super().__init__(**kwargs)
+        self.table = table
+        self.serializer_class = serializer_class
+
+    def to_representation(self, pk):
+        return get_snapshot().serialized(self.table, self.serializer_class).get(pk)
+
+
+def admin_label(table, attname, description, fallback=True):
+    """Colonne d'admin affichant le libellé d'une FK de référence sans jointure."""
+    def column(obj):
+        pk = getattr(obj, attname)
+        return get_snapshot().label(table, pk, fallback=fallback, empty="-") if pk else "-"
+    column.short_description = description
+    column.admin_order_field = attname
+    return column
+
+
+class RefDataListMixin:
+    """
+    ``list()`` servi depuis le cache pour les viewsets de référence, tant
+    qu'aucun filtre n'est demandé (seul ``?lang=`` est toléré).
+    """
+    refdata_table = None
+
+    def filter_refdata(self, rows):
+        return rows
+
+    def list(self, request, *args, **kwargs):
+        if set(request.query_params) - {"lang"}:
+            return super().list(request, *args, **kwargs)
+        from rest_framework.response import Response
+
+        snap = get_snapshot()
+        data = snap.serialized(self.refdata_table, self.get_serializer_class())
+        return Response([data[r.id] for r in self.filter_refdata(snap.rows(self.refdata_table))])
@@ -0,0 +1,71 @@
+# core/renderers.py
+"""
+Rendu / lecture JSON de l'API via orjson (repli sur la stdlib s'il manque).
+
+La sortie reste octet pour octet celle de ``rest_framework.renderers.JSONRenderer``
+(compact, UTF-8) : date / heure / datetime / Decimal, UUID, chaînes
+traduites… passent par l'encodeur DRF (``OPT_PASSTHROUGH_DATETIME``), de sorte
+que ``"2025-01-01T10:00:00Z"`` garde le même format pour la SPA. Le reste
+(dicts, listes, chaînes, nombres) est encodé en C.
+
+Repli sur l'implémentation DRF : orjson absent, indentation demandée
+(``Accept: application/json; indent=4``), ``UNICODE_JSON`` / ``COMPACT_JSON``
+désactivés, ou entrée non UTF-8 pour le parser.
+"""
+import codecs
+
+from django.conf import settings
+from rest_framework import renderers, parsers
+from rest_framework.exceptions import ParseError
+from rest_framework.settings import api_settings
+from rest_framework.utils import encoders
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - dépendance optionnelle
+    orjson = None
+
+_default = encoders.JSONEncoder().default
+_stdlib = renderers.JSONRenderer()
+
+
+def dumps(data):
+    """``bytes`` JSON identiques à ``JSONRenderer().render(data)``."""
+    if orjson is None:
+        return _stdlib.render(data)
+    try:
+        ret = orjson.dumps(data, default=_default, option=orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_NON_STR_KEYS)
+    except orjson.JSONEncodeError:
+        # entiers > 64 bits, types inconnus d'orjson et de DRF… : même erreur / sortie que DRF
+        return _stdlib.render(data)
+    # comme DRF : U+2028 / U+2029 échappés (JSON valide mais pas JavaScript valide)
+    if b"\xe2\x80\xa8" in ret or b"\xe2\x80\xa9" in ret:
+        ret = ret.replace(b"\xe2\x80\xa8", b"\\u2028").replace(b"\xe2\x80\xa9", b"\\u2029")
+    return ret
+
+
+class FastJSONRenderer(renderers.JSONRenderer):
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b""
+        if (
+            orjson is None
+            or not (api_settings.UNICODE_JSON and api_settings.COMPACT_JSON)
+            or self.get_indent(accepted_media_type or "", renderer_context or {}) is not None
+        ):
+            return super().render(data, accepted_media_type, renderer_context)
+        return dumps(data)
+
+
+class FastJSONParser(parsers.JSONParser):
+    renderer_class = FastJSONRenderer
+
+    def parse(self, stream, media_type=None, parser_context=None):
+        encoding = (parser_context or {}).get("encoding", settings.DEFAULT_CHARSET)
+        if orjson is None or codecs.lookup(encoding).name != "utf-8":
+            return super().parse(stream, media_type, parser_context)
+        try:
+            return orjson.loads(stream.read())
+        except orjson.JSONDecodeError as exc:
+            raise ParseError(f"JSON parse error - {exc}")
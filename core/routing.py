@@ -0,0 +1,118 @@
+# core/routing.py
+"""
+Lectures sur réplica (``DATABASE_REPLICA_URL`` → alias ``DATABASE_REPLICA_ALIAS``).
+
+Tout va sur le primaire par défaut ; une requête ne lit sur le réplica que
+si la vue le demande (``ReplicaReadMixin`` : actions de lecture des viewsets,
+GET des statistiques). Dès qu'elle écrit, la requête est épinglée sur le
+primaire : ses lectures suivantes voient ses propres écritures.
+
+Réplica non configuré ou injoignable : lectures sur le primaire, réplica
+écarté ``DATABASE_REPLICA_RETRY`` secondes après un échec de connexion.
+L'état est propre à la requête (cf. ``DatabaseRoutingMiddleware``).
+"""
+import logging
+import time
+from contextvars import ContextVar
+
+from django.conf import settings
+from django.db import DEFAULT_DB_ALIAS, DatabaseError, connections
+from rest_framework.permissions import SAFE_METHODS
+
+logger = logging.getLogger(__name__)
+
+_state = ContextVar("db_routing", default=None)
+# alias → instant (monotonic) avant lequel le réplica n'est plus tenté
+_down_until = {}
+
+
+class RoutingState:
+    __slots__ = ("read_alias", "pinned")
+
+    def __init__(self):
+        self.read_alias = None
+        self.pinned = False
+
+
+def begin_request():
+    return _state.set(RoutingState())
+
+
+def end_request(token):
+    _state.reset(token)
+
+
+def replica_alias():
+    return getattr(settings, "DATABASE_REPLICA_ALIAS", "replica")
+
+
+def replica_available(alias):
+    if alias not in connections.settings or time.monotonic() < _down_until.get(alias, 0):
+        return False
+    try:
+        connections[alias].ensure_connection()
+    except DatabaseError:
+        retry = getattr(settings, "DATABASE_REPLICA_RETRY", 30)
+        logger.warning("Réplica %s injoignable : lectures sur le primaire pendant %s s", alias, retry, exc_info=True)
+        _down_until[alias] = time.monotonic() + retry
+        return False
+    return True
+
+
+def use_replica():
+    """Lectures de la requête courante sur le réplica (s'il répond) ; alias retenu ou None."""
+    state = _state.get()
+    if state is None or state.pinned:
+        return None
+    alias = replica_alias()
+    if replica_available(alias):
+        state.read_alias = alias
+    return state.read_alias
+
+
+def read_alias():
+    """Alias des lectures de la requête courante (None : primaire)."""
+    state = _state.get()
+    return None if state is None or state.pinned else state.read_alias
+
+
+class ReplicaRouter:
+    """``DATABASE_ROUTERS`` : lectures selon la requête courante, écritures sur le primaire."""
+
+    def db_for_read(self, model, **hints):
+        return read_alias()
+
+    def db_for_write(self, model, **hints):
+        state = _state.get()
+        if state is not None:
+            state.pinned = True
+        # objet lié d'une autre base (alias temporaire des benchmarks…) : on y reste, jamais sur le réplica
+        instance = hints.get("instance")
+        if instance is not None and instance._state.db not in (None, replica_alias()):
+            return instance._state.db
+        return DEFAULT_DB_ALIAS
+
+    def allow_relation(self, obj1, obj2, **hints):
+        aliases = {DEFAULT_DB_ALIAS, replica_alias()}
+        if obj1._state.db in aliases and obj2._state.db in aliases:
+            return True
+        return None
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints):
+        # schéma répliqué depuis le primaire
+        return False if db == replica_alias() else None
+
+
+class ReplicaReadMixin:
+    """
+    Vues DRF : lectures sur le réplica pour les actions ``replica_actions``
+    d'un viewset, ou pour les GET d'une ``APIView`` (statistiques).
+    Authentification et permissions restent sur le primaire.
+    """
+    replica_actions = ("list", "retrieve", "archive", "stats", "export")
+
+    def initial(self, request, *args, **kwargs):
+        super().initial(request, *args, **kwargs)
+        action = getattr(self, "action", None)
+        if request.method in SAFE_METHODS and (action is None or action in self.replica_actions):
+            use_replica()
@@ -0,0 +1,145 @@
+# core/rows.py
+"""
+Sérialisation rapide des listes en lecture seule.
+
+Un ``RowSerializer`` lit ``queryset.values(*columns)`` (une seule requête,
+jointures comprises) et construit directement les dicts de sortie, sans
+instancier de modèles ni parcourir les champs DRF ligne par ligne. Les
+libellés (données de référence, choix) sont précalculés une fois par
+réponse dans ``prepare()``.
+
+La sortie doit rester identique, au JSON près, à celle du serializer DRF
+correspondant : chaque ``RowSerializer`` a son test de parité.
+"""
+from django.conf import settings
+from django.utils.encoding import force_str
+from rest_framework import serializers
+from rest_framework.response import Response
+
+from .refdata import get_snapshot
+from .sparse import sparse_spec
+
+# formatage identique à DRF (ISO 8601, fuseau courant, « Z » pour UTC)
+_date = serializers.DateField()
+_time = serializers.TimeField()
+_datetime = serializers.DateTimeField()
+
+
+def fmt_date(value):
+    return None if value is None else _date.to_representation(value)
+
+
+def fmt_time(value):
+    return None if value is None else _time.to_representation(value)
+
+
+def fmt_datetime(value):
+    return None if value is None else _datetime.to_representation(value)
+
+
+def ref_labels(table, fallback=True, empty=""):
+    """
+    Équivalent de ``RefLabelField(table, fallback, empty)`` :
+    fonction ``pk → libellé`` sur un dict précalculé pour la langue courante.
+    """
+    snap = get_snapshot()
+    labels = {row.id: snap.label(table, row.id, fallback=fallback, empty=empty) for row in snap.rows(table)}
+
+    def label(pk):
+        return empty if pk is None else labels.get(pk, empty)
+    return label
+
+
+def ref_objects(table, serializer_class):
+    """Équivalent de ``RefDataField`` : ``pk → dict`` déjà sérialisé (partagé)."""
+    data = get_snapshot().serialized(table, serializer_class)
+
+    def obj(pk):
+        return None if pk is None else data.get(pk)
+    return obj
+
+
+def choice_labels(model, field):
+    """Équivalent de ``get_<field>_display()`` dans la langue courante."""
+    labels = {value: force_str(label) for value, label in model._meta.get_field(field).flatchoices}
+
+    def label(value):
+        return labels.get(value, value)
+    return label
+
+
+def related_columns(prefix, fields):
+    """Colonnes ``values()`` d'une FK jointe : ``("patient__id", "patient__first_name", …)``."""
+    return tuple(f"{prefix}__{f}" for f in fields)
+
+
+class RowSerializer:
+    """
+    Base des sérialiseurs de liste rapides.
+
+    Sous-classes : ``columns`` (colonnes passées à ``values()``), ``prepare()``
+    pour les tables de libellés et ``to_row(values)`` pour une ligne.
+    """
+    columns = ()
+
+    def __init__(self, queryset, context=None):
+        self.queryset = queryset
+        self.context = context or {}
+
+    def prepare(self):
+        pass
+
+    def to_row(self, values):
+        raise NotImplementedError
+
+    def _values(self):
+        return self.queryset.prefetch_related(None).values(*self.columns)
+
+    @property
+    def data(self):
+        self.prepare()
+        to_row = self.to_row
+        return [to_row(values) for values in self._values()]
+
+    async def adata(self):
+        """``data`` par l'ORM async (vue ASGI)."""
+        self.prepare()
+        to_row = self.to_row
+        return [to_row(values) async for values in self._values()]
+
+    def iter_chunks(self, chunk_size):
+        """Lignes par paquets de ``chunk_size``, curseur parcouru avec ``iterator()``."""
+        self.prepare()
+        to_row = self.to_row
+        chunk = []
+        for values in self._values().iterator(chunk_size=chunk_size):
+            chunk.append(to_row(values))
+            if len(chunk) >= chunk_size:
+                yield chunk
+                chunk = []
+        if chunk:
+            yield chunk
+
+
+class FastListMixin:
+    """
+    ``list()`` servi par ``row_serializer_class`` (filtres et tri du viewset
+    conservés). Repli sur le serializer DRF si une pagination est active ou
+    si ``FAST_LIST_SERIALIZERS`` est désactivé, ainsi qu'en présence de
+    ``?fields=`` / ``?expand=`` (élagage par le serializer DRF, core/sparse.py).
+    """
+    row_serializer_class = None
+
+    def use_fast_list(self):
+        return (
+            self.row_serializer_class is not None
+            and self.paginator is None
+            and getattr(settings, "FAST_LIST_SERIALIZERS", True)
+            and sparse_spec(self.request) is None
+        )
+
+    def list(self, request, *args, **kwargs):
+        if not self.use_fast_list():
+            return super().list(request, *args, **kwargs)
+        queryset = self.filter_queryset(self.get_queryset())
+        return Response(self.row_serializer_class(queryset, context=self.get_serializer_context()).data)
@@ -0,0 +1,164 @@
+# core/schema.py
+"""
+Schéma OpenAPI précalculé.
+
+``python manage.py build_schema`` génère le schéma (une variante par langue
+× format YAML / JSON) dans ``OPENAPI_SCHEMA_DIR``, avec un ``manifest.json``
+(hash de chaque fichier + empreinte des sources). ``/api/schema/`` sert
+ensuite ces fichiers tels quels au lieu d'introspecter toutes les vues à
+chaque appel ; la page ``/api/docs/`` pointe sur l'URL versionnée
+(``?v=<hash>``), mise en cache un an.
+
+En développement (``OPENAPI_SCHEMA_AUTOBUILD``), le schéma est régénéré dès
+que l'empreinte des sources (fichiers ``.py`` des apps du projet, ``.mo``)
+ne correspond plus au manifest.
+"""
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import threading
+from functools import lru_cache
+from pathlib import Path
+
+from django.apps import apps
+from django.conf import settings
+from django.utils import timezone, translation
+from drf_spectacular.renderers import OpenApiJsonRenderer, OpenApiYamlRenderer
+from drf_spectacular.settings import spectacular_settings
+
+from .i18n import supported_languages
+
+logger = logging.getLogger(__name__)
+
+MANIFEST = "manifest.json"
+RENDERERS = {"yaml": OpenApiYamlRenderer, "json": OpenApiJsonRenderer}
+
+_lock = threading.Lock()
+_loaded = {"mtime": None, "manifest": None, "files": {}}
+
+
+def schema_dir():
+    return Path(getattr(settings, "OPENAPI_SCHEMA_DIR", Path(settings.BASE_DIR) / "build" / "openapi"))
+
+
+def artifact_name(lang, fmt):
+    return f"openapi.{lang}.{fmt}"
+
+
+# -----------------------
+# Empreinte des sources
+# -----------------------
+def _source_files():
+    base = Path(settings.BASE_DIR).resolve()
+    roots = {Path(app.path).resolve() for app in apps.get_app_configs()}
+    roots.add(base / settings.ROOT_URLCONF.split(".", 1)[0])
+    for root in sorted(r for r in roots if r.is_relative_to(base) and "venv" not in r.parts):
+        yield from root.rglob("*.py")
+    for locale_dir in getattr(settings, "LOCALE_PATHS", ()):
+        yield from Path(locale_dir).rglob("*.mo")
+
+
+@lru_cache(maxsize=1)
+def source_fingerprint():
+    """Hash (chemin, taille, mtime) des sources du projet ; une fois par process (l'autoreload redémarre)."""
+    digest = hashlib.sha1()
+    base = Path(settings.BASE_DIR).resolve()
+    for path in sorted(set(_source_files())):
+        stat = path.stat()
+        digest.update(f"{path.resolve().relative_to(base)}:{stat.st_size}:{stat.st_mtime_ns}\n".encode())
+    digest.update(repr(sorted(getattr(settings, "SPECTACULAR_SETTINGS", {}).items())).encode())
+    return digest.hexdigest()
+
+
+# -----------------------
+# Génération
+# -----------------------
+def generate(lang):
+    """Schéma (dict) tel que le produirait ``SpectacularAPIView`` dans la langue ``lang``."""
+    generator = spectacular_settings.DEFAULT_GENERATOR_CLASS()
+    with translation.override(lang):
+        return generator.get_schema(request=None, public=True)
+
+
+def _write(path, data):
+    fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.")
+    with os.fdopen(fd, "wb") as fh:
+        fh.write(data)
+    os.replace(tmp, path)  # atomique : un worker ne lit jamais un fichier à moitié écrit
+
+
+def build(languages=None, directory=None):
+    """Génère et écrit toutes les variantes ; renvoie le manifest."""
+    directory = Path(directory or schema_dir())
+    directory.mkdir(parents=True, exist_ok=True)
+    files = {}
+    for lang in languages or supported_languages():
+        schema = generate(lang)
+        for fmt, renderer_class in RENDERERS.items():
+            body = renderer_class().render(schema, renderer_context={})
+            name = artifact_name(lang, fmt)
+            _write(directory / name, body)
+            files[name] = hashlib.sha1(body).hexdigest()
+    manifest = {
+        "fingerprint": source_fingerprint(),
+        "generated_at": timezone.now().isoformat(),
+        "files": files,
+    }
+    _write(directory / MANIFEST, json.dumps(manifest, indent=2).encode())
+    return manifest
+
+
+def is_stale(manifest):
+    return manifest is None or manifest.get("fingerprint") != source_fingerprint()
+
+
+# -----------------------
+# Lecture (en mémoire, rechargée si le manifest change)
+# -----------------------
+def read_manifest(directory=None):
+    try:
+        return json.loads((Path(directory or schema_dir()) / MANIFEST).read_text())
+    except (OSError, ValueError):
+        return None
+
+
+def _reload():
+    path = schema_dir() / MANIFEST
+    try:
+        mtime = path.stat().st_mtime_ns
+    except OSError:
+        mtime = None
+    if mtime == _loaded["mtime"] and mtime is not None:
+        return
+    with _lock:
+        manifest = read_manifest()
+        if getattr(settings, "OPENAPI_SCHEMA_AUTOBUILD", settings.DEBUG) and is_stale(manifest):
+            logger.info("Schéma OpenAPI absent ou périmé : régénération dans %s", schema_dir())
+            manifest = build()
+            mtime = path.stat().st_mtime_ns
+        _loaded.update(mtime=mtime, manifest=manifest, files={})
+
+
+def artifact(lang, fmt):
+    """``(body, sha1)`` de la variante précalculée, ou None (pas de build : génération à la volée)."""
+    _reload()
+    manifest = _loaded["manifest"]
+    name = artifact_name(lang, fmt)
+    if manifest is None or name not in manifest["files"]:
+        return None
+    cached = _loaded["files"].get(name)
+    if cached is None:
+        try:
+            body = (schema_dir() / name).read_bytes()
+        except OSError:
+            return None
+        cached = _loaded["files"][name] = (body, manifest["files"][name])
+    return cached
+
+
+def version(lang, fmt="json"):
+    """Hash de la variante (pour ``?v=``), ou None."""
+    found = artifact(lang, fmt)
+    return found[1] if found else None
@@ -0,0 +1,72 @@
+# core/spa.py
+"""
+Coquille de la SPA (``index.html`` du build Vite) servie depuis la mémoire.
+
+Le fichier est rendu une seule fois par process (même gabarit que l'ancien
+``TemplateView``, repli sur la copie de ``collectstatic`` si ``dist/``
+n'existe pas) ; chaque navigation ne coûte plus qu'une comparaison d'ETag.
+La coquille est revalidée à chaque chargement (``no-cache``) : c'est elle
+qui référence les assets hashés, eux mis en cache un an par WhiteNoise.
+
+En ``DEBUG``, le fichier est relu à chaque requête (rebuild Vite).
+"""
+import hashlib
+import threading
+from pathlib import Path
+
+from django.conf import settings
+from django.http import HttpResponse, HttpResponseNotModified
+from django.template import TemplateDoesNotExist
+from django.template.loader import get_template
+from django.utils.http import quote_etag
+from django.views import View
+
+from .conditional import etag_matches
+
+SHELL_TEMPLATE = "index.html"
+
+_lock = threading.Lock()
+_shell = None
+
+
+def render_shell():
+    """``(body, etag)`` de la coquille ; ``TemplateDoesNotExist`` si aucun build n'est disponible."""
+    try:
+        body = get_template(SHELL_TEMPLATE).render().encode()
+    except TemplateDoesNotExist:
+        collected = Path(settings.STATIC_ROOT or "") / SHELL_TEMPLATE
+        if not settings.STATIC_ROOT or not collected.is_file():
+            raise
+        body = collected.read_bytes()
+    return body, quote_etag(hashlib.sha1(body).hexdigest())
+
+
+def get_shell():
+    global _shell
+    if settings.DEBUG:
+        return render_shell()
+    if _shell is None:
+        with _lock:
+            if _shell is None:
+                _shell = render_shell()
+    return _shell
+
+
+def reset_shell():
+    global _shell
+    _shell = None
+
+
+class SPAView(View):
+    """Catch-all hors ``/api/`` : routes côté client de la SPA."""
+    http_method_names = ["get", "head", "options"]
+
+    def get(self, request, *args, **kwargs):
+        body, etag = get_shell()
+        if etag_matches(etag, request.headers.get("If-None-Match")):
+            response = HttpResponseNotModified()
+        else:
+            response = HttpResponse(body, content_type="text/html; charset=utf-8")
+        response["ETag"] = etag
+        response["Cache-Control"] = "no-cache"
+        return response
@@ -0,0 +1,87 @@
+# core/sparse.py
+"""
+Champs à la demande sur les API en lecture : ``?fields=`` et ``?expand=``.
+
+- sans paramètre : sortie inchangée ;
+- ``?fields=id,status,patient.first_name`` : seuls ces champs sont rendus
+  (notation pointée pour les serializers imbriqués) ;
+- ``?expand=patient`` : les objets imbriqués déclarés dans
+  ``Meta.expandable`` ne sont rendus en entier que s'ils sont demandés ici ;
+  sinon (dès qu'un des deux paramètres est présent) ils sortent réduits à
+  leur id.
+
+Les champs écartés sont retirés avant le rendu : ni serializer imbriqué ni
+``SerializerMethodField`` n'est évalué, et ``core/eager.py`` ne joint que les
+relations effectivement rendues. Ne concerne que GET / HEAD.
+"""
+from rest_framework import serializers
+
+FIELDS_PARAM = "fields"
+EXPAND_PARAM = "expand"
+
+# pas de spécification posée par le serializer parent
+_UNSET = object()
+
+
+def _names(raw):
+    return tuple(sorted({name.strip() for name in raw.split(",") if name.strip()}))
+
+
+def sparse_spec(request):
+    """``(fields, expand)`` demandés par la requête (tuples triés, ``fields`` à None = tous), ou None."""
+    if request is None or request.method not in ("GET", "HEAD"):
+        return None
+    params = request.query_params
+    fields, expand = params.get(FIELDS_PARAM), params.get(EXPAND_PARAM)
+    if fields is None and expand is None:
+        return None
+    return (None if fields is None else _names(fields)), _names(expand or "")
+
+
+def _sub(names, prefix):
+    """Noms sous ``prefix.`` : ``("patient.first_name",)`` → ``("first_name",)``."""
+    if names is None:
+        return None
+    return tuple(n.split(".", 1)[1] for n in names if n.startswith(prefix + ".")) or None
+
+
+class SparseFieldsMixin:
+    """
+    Serializer élagué selon ``?fields=`` / ``?expand=``.
+
+    ``Meta.expandable`` : ``{champ imbriqué: source de sa forme réduite}``,
+    par ex. ``{"patient": "patient_id"}``. La spécification vient de
+    ``context["sparse"]`` si présent (vues, ``core/eager.py``), sinon de
+    ``context["request"]`` ; les serializers imbriqués la reçoivent du parent.
+    """
+    _sparse = _UNSET
+
+    def get_sparse_spec(self):
+        if self._sparse is not _UNSET:
+            return self._sparse
+        if "sparse" in self.context:
+            return self.context["sparse"]
+        return sparse_spec(self.context.get("request"))
+
+    def get_fields(self):
+        fields = super().get_fields()
+        spec = self.get_sparse_spec()
+        wanted, expand = spec if spec is not None else (None, ())
+        top_wanted = None if wanted is None else {n.split(".", 1)[0] for n in wanted}
+        top_expand = {n.split(".", 1)[0] for n in expand}
+        expandable = getattr(getattr(self, "Meta", None), "expandable", {})
+
+        kept = {}
+        for name, field in fields.items():
+            if top_wanted is not None and name not in top_wanted:
+                continue
+            if spec is not None and name in expandable and name not in top_expand:
+                kept[name] = serializers.ReadOnlyField(source=expandable[name])
+                continue
+            nested = field.child if isinstance(field, serializers.ListSerializer) else field
+            if isinstance(nested, SparseFieldsMixin):
+                sub_expand = _sub(expand, name) or ()
+                sub_wanted = _sub(wanted, name)
+                nested._sparse = None if sub_wanted is None and not sub_expand else (sub_wanted, sub_expand)
+            kept[name] = field
+        return kept
@@ -0,0 +1,111 @@
+# core/startup.py
+"""
+Mise en chauffe d'un process avant sa première requête.
+
+``warm_up()`` est appelé par ``clinic_backend/asgi.py`` et ``wsgi.py`` une
+fois l'application chargée (``STARTUP_WARMUP``) :
+
+- catalogues gettext de chaque langue de ``LANGUAGES`` ;
+- résolveur d'URL (patterns importés, tables de ``reverse()`` par langue) ;
+- snapshot des données de référence et libellés sérialisés de ``bootstrap`` ;
+- coquille de la SPA et variantes précalculées du schéma OpenAPI.
+
+Avec ``preload_app`` (gunicorn.conf.py), tout cela est fait une seule fois
+dans le master et partagé par les workers forkés (y compris ceux qui
+remplacent un worker recyclé par ``max_requests``). Les connexions SQL
+ouvertes sont refermées à la fin, pools psycopg (``DB_POOL=1``) compris :
+ni socket ni thread de pool ne doit survivre au fork.
+
+Une étape qui échoue (base pas encore migrée, pas de build front…) est
+journalisée et ignorée : la mise en chauffe ne bloque jamais le démarrage.
+"""
+import logging
+import time
+
+from django.conf import settings
+from django.db import connections
+from django.template import TemplateDoesNotExist
+from django.urls import get_resolver
+from django.utils import translation
+
+from . import refdata, schema, spa
+
+logger = logging.getLogger(__name__)
+
+
+def _languages():
+    return [code for code, _ in settings.LANGUAGES]
+
+
+def warm_translations():
+    for lang in _languages():
+        with translation.override(lang):
+            translation.gettext("")  # charge et fusionne les catalogues de la langue
+
+
+def warm_urls():
+    resolver = get_resolver()
+    resolver.url_patterns
+    for lang in _languages():
+        with translation.override(lang):
+            resolver.reverse_dict  # tables construites par langue active
+
+
+def warm_refdata():
+    from .views import BOOTSTRAP_LOOKUPS
+
+    snap = refdata.get_snapshot()
+    for lang in _languages():
+        for table, serializer_class, _ in BOOTSTRAP_LOOKUPS.values():
+            snap.serialized(table, serializer_class, lang=lang)
+
+
+def warm_spa():
+    try:
+        spa.get_shell()
+    except TemplateDoesNotExist:
+        pass  # API seule : pas de build front
+
+
+def warm_schema():
+    for lang in _languages():
+        schema.artifact(lang, "json")
+
+
+def close_connections():
+    """Ferme connexions et pools de connexions (sans en créer : ``pool`` est paresseux)."""
+    connections.close_all()  # avec un pool, la connexion n'y est que rendue
+    for alias in connections:
+        conn = connections[alias]
+        if alias in getattr(conn, "_connection_pools", ()):
+            conn.close_pool()
+
+
+STEPS = {
+    "translations": warm_translations,
+    "urls": warm_urls,
+    "refdata": warm_refdata,
+    "spa": warm_spa,
+    "schema": warm_schema,
+}
+
+
+def warm_up(force=False):
+    """Exécute les étapes de ``STEPS`` ; ``{étape: ms}`` (None si l'étape a échoué)."""
+    if not force and not getattr(settings, "STARTUP_WARMUP", True):
+        return {}
+    timings = {}
+    try:
+        for name, step in STEPS.items():
+            t0 = time.perf_counter()
+            try:
+                step()
+            except Exception:
+                logger.warning("Mise en chauffe : étape %s ignorée", name, exc_info=True)
+                timings[name] = None
+            else:
+                timings[name] = round((time.perf_counter() - t0) * 1000, 1)
+    finally:
+        close_connections()
+    logger.info("Mise en chauffe terminée : %s", ", ".join(f"{k} {v} ms" for k, v in timings.items()))
+    return timings
@@ -0,0 +1,128 @@
+# core/streaming.py
+"""
+Listes en streaming, à la demande : ``?stream=1`` (tableau JSON) ou
+``Accept: application/x-ndjson`` (un objet par ligne).
+
+Le queryset est parcouru avec ``iterator()`` par paquets de
+``STREAM_CHUNK_SIZE`` lignes, chaque paquet est rendu puis envoyé : la
+mémoire reste bornée par la taille d'un paquet et le premier octet part
+dès le premier paquet. Même contenu que la liste normale (liste rapide
+``core/rows.py`` ou serializer DRF, ``?fields=`` compris).
+
+Le générateur est consommé après la sortie des middlewares : la langue et
+le snapshot des données de référence de la requête sont réactivés autour
+de chaque paquet. Sous ASGI, il est exposé en itérateur asynchrone (un
+paquet par passage dans un thread) : Django chargerait sinon toute la
+réponse en mémoire avant d'envoyer le premier octet.
+"""
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.core.handlers.asgi import ASGIRequest
+from django.http import StreamingHttpResponse
+from django.utils import translation
+
+from . import refdata
+from .i18n import get_language, reset_language, set_language
+from .renderers import FastJSONRenderer
+
+STREAM_PARAM = "stream"
+NDJSON = "application/x-ndjson"
+
+
+def stream_format(request):
+    """``"ndjson"``, ``"json"`` ou None (pas de streaming demandé)."""
+    if NDJSON in request.headers.get("Accept", ""):
+        return "ndjson"
+    if request.query_params.get(STREAM_PARAM, "").lower() in ("1", "true", "yes"):
+        return "json"
+    return None
+
+
+def is_asgi(request):
+    """Requête servie par le handler ASGI (``request`` Django ou DRF)."""
+    return isinstance(getattr(request, "_request", request), ASGIRequest)
+
+
+async def aiter_sync(iterator):
+    """Itérateur synchrone consommé élément par élément hors de la boucle."""
+    it = iter(iterator)
+    done = object()
+    step = sync_to_async(next)
+    while (item := await step(it, done)) is not done:
+        yield item
+
+
+class NDJSONRenderer(FastJSONRenderer):
+    """Une ligne JSON par élément (listes) ; négocié via ``Accept``."""
+    media_type = NDJSON
+    format = "ndjson"
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if not isinstance(data, list):
+            return super().render(data, accepted_media_type, renderer_context) + b"\n"
+        return b"".join(super(NDJSONRenderer, self).render(row) + b"\n" for row in data)
+
+
+def _render_stream(chunks, fmt, lang, snap):
+    renderer = NDJSONRenderer() if fmt == "ndjson" else FastJSONRenderer()
+
+    def next_chunk():
+        lang_token, snap_token = set_language(lang), refdata.pin_snapshot(snap)
+        try:
+            with translation.override(lang):
+                return next(chunks, None)
+        finally:
+            refdata.end_request(snap_token)
+            reset_language(lang_token)
+
+    if fmt == "json":
+        yield b"["
+    first = True
+    while (rows := next_chunk()) is not None:
+        if fmt == "json":
+            body = renderer.render(rows)[1:-1]  # « [a,b] » → « a,b »
+            yield body if first else b"," + body
+        else:
+            yield renderer.render(rows)
+        first = False
+    if fmt == "json":
+        yield b"]"
+
+
+class StreamingListMixin:
+    """``list()`` en ``StreamingHttpResponse`` si le client le demande (hors pagination)."""
+    stream_chunk_size = None
+
+    def get_renderers(self):
+        return [*super().get_renderers(), NDJSONRenderer()]
+
+    def get_stream_chunk_size(self):
+        return self.stream_chunk_size or getattr(settings, "STREAM_CHUNK_SIZE", 500)
+
+    def stream_chunks(self, queryset, chunk_size):
+        if getattr(self, "use_fast_list", lambda: False)():
+            yield from self.row_serializer_class(queryset, context=self.get_serializer_context()).iter_chunks(chunk_size)
+            return
+        serializer = self.get_serializer()
+        chunk = []
+        for obj in queryset.iterator(chunk_size=chunk_size):
+            chunk.append(serializer.to_representation(obj))
+            if len(chunk) >= chunk_size:
+                yield chunk
+                chunk = []
+        if chunk:
+            yield chunk
+
+    def list(self, request, *args, **kwargs):
+        fmt = stream_format(request) if self.paginator is None else None
+        if fmt is None:
+            return super().list(request, *args, **kwargs)
+        queryset = self.filter_queryset(self.get_queryset())
+        queryset = queryset.using(queryset.db)  # alias (réplica) résolu tant que la requête est en cours
+        chunks = self.stream_chunks(queryset, self.get_stream_chunk_size())
+        # capturés maintenant : le générateur tourne après la sortie des middlewares
+        content = _render_stream(chunks, fmt, get_language(), refdata.get_snapshot())
+        return StreamingHttpResponse(
+            aiter_sync(content) if is_asgi(request) else content,
+            content_type=NDJSON if fmt == "ndjson" else "application/json",
+        )
@@ -0,0 +1,90 @@
+# core/testing.py
+"""
+Budgets de requêtes SQL pour les tests.
+
+    with assert_max_queries(4):
+        client.get(url)
+
+    @max_queries(4)
+    def test_...(): ...
+
+    assert_constant_queries(make_rows, lambda: client.get(url), sizes=(1, 10, 100))
+
+``assert_constant_queries`` échoue si le nombre de requêtes d'un endpoint
+croît avec le nombre de lignes (N+1).
+"""
+from contextlib import ContextDecorator
+
+from django.db import connections
+from django.test.utils import CaptureQueriesContext
+
+
+def _format_queries(queries, limit=30):
+    lines = [f"  {i}. {q['sql']}" for i, q in enumerate(queries[:limit], 1)]
+    if len(queries) > limit:
+        lines.append(f"  … {len(queries) - limit} de plus")
+    return "\n".join(lines)
+
+
+class assert_max_queries(ContextDecorator):
+    """Échoue si le bloc (ou la fonction décorée) exécute plus de ``limit`` requêtes."""
+
+    def __init__(self, limit, using="default"):
+        self.limit = limit
+        self.using = using
+
+    def __enter__(self):
+        self.context = CaptureQueriesContext(connections[self.using])
+        self.context.__enter__()
+        return self.context
+
+    def __exit__(self, exc_type, exc, tb):
+        self.context.__exit__(exc_type, exc, tb)
+        if exc_type is not None:
+            return False
+        executed = len(self.context)
+        if executed > self.limit:
+            raise AssertionError(
+                f"{executed} requêtes SQL exécutées, budget {self.limit} :\n"
+                f"{_format_queries(self.context.captured_queries)}"
+            )
+        return False
+
+
+max_queries = assert_max_queries
+
+
+def count_queries(func, using="default"):
+    """Exécute ``func()`` et renvoie ``(résultat, requêtes capturées)``."""
+    with CaptureQueriesContext(connections[using]) as ctx:
+        result = func()
+    return result, ctx.captured_queries
+
+
+def assert_constant_queries(make_rows, request, sizes=(1, 10, 100), budget=None, using="default"):
+    """
+    Pour chaque taille, complète le jeu de données à ``size`` lignes via
+    ``make_rows(size)`` puis compte les requêtes de ``request()`` (après un
+    appel d'échauffement : caches, données de référence…).
+
+    Échoue si le compte varie avec la taille ou dépasse ``budget``.
+    Renvoie ``{taille: nombre de requêtes}``.
+    """
+    counts, last = {}, None
+    for size in sizes:
+        make_rows(size)
+        request()
+        response, queries = count_queries(request, using=using)
+        status = getattr(response, "status_code", 200)
+        if status >= 400:
+            raise AssertionError(f"réponse {status} pour {size} ligne(s) : {getattr(response, 'content', b'')[:300]!r}")
+        counts[size], last = len(queries), queries
+
+    if len(set(counts.values())) > 1:
+        raise AssertionError(
+            f"Le nombre de requêtes croît avec N (N+1 ?) : {counts}\n"
+            f"Requêtes pour N={sizes[-1]} :\n{_format_queries(last)}"
+        )
+    if budget is not None and counts[sizes[-1]] > budget:
+        raise AssertionError(f"{counts[sizes[-1]]} requêtes, budget {budget} :\n{_format_queries(last)}")
+    return counts
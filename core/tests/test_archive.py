@@ -0,0 +1,56 @@
+# core/tests/test_archive.py
+import datetime
+from io import StringIO
+
+import pytest
+from django.core.management import call_command
+from django.urls import reverse
+from django.utils import timezone
+
+from accounts.models import User
+from appointments.models import Appointment, ArchivedAppointment
+from core.management.commands.seed_load import explicit_timestamps
+from notifications.models import ArchivedArrivalNotification, ArrivalNotification
+from referrals.models import ArchivedReferral, Patient, Referral
+from referrals.models_secretary import ArchivedSecretaryReferral, SecretaryReferral
+
+
+def at(*args):
+    return timezone.make_aware(datetime.datetime(*args))
+
+
+@pytest.mark.django_db
+def test_archive_moves_closed_rows_and_reads_through(api):
+    patient = Patient.objects.create(first_name="Kenza", last_name="B")
+    with explicit_timestamps(Referral):
+        def referral(status, created_at):
+            return Referral.objects.create(patient=patient, status=status, created_at=created_at, updated_at=created_at)
+        closed = referral(Referral.Status.ARRIVED, at(2020, 3, 1, 10))
+        still_open = referral(Referral.Status.NEW, at(2020, 3, 2, 10))
+        recent = referral(Referral.Status.REJECTED, timezone.now())
+    doctor = User.objects.create_user(username="dr", role="medecin")
+    appt = Appointment.objects.create(patient_name="Omar Z", date="2020-05-04", time="09:00", doctor=doctor)
+    assert ArrivalNotification.objects.count() == 1
+
+    detail = reverse("referrals-detail", args=[closed.pk])
+    expected = api.get(detail).json()
+    expected_appt = api.get(reverse("appointments-detail", args=[appt.pk])).json()
+
+    call_command("archive", until_year=2020, batch_size=1, stdout=StringIO())
+    call_command("archive", until_year=2020, stdout=StringIO())  # relancer : rien de plus
+
+    # lignes closes et leurs projections déplacées, le reste intact
+    assert set(Referral.objects.values_list("pk", flat=True)) == {still_open.pk, recent.pk}
+    assert ArchivedReferral.objects.get().year == 2020
+    assert SecretaryReferral.objects.count() == 2 and ArchivedSecretaryReferral.objects.count() == 1
+    assert not Appointment.objects.exists() and ArchivedAppointment.objects.count() == 1
+    assert not ArrivalNotification.objects.exists() and ArchivedArrivalNotification.objects.count() == 1
+
+    # lecture au format de l'API, par id ou par patient ; archive en lecture seule
+    res = api.get(detail)
+    assert res.status_code == 200 and res["X-Archived"] == "1"
+    assert res.json() == expected
+    assert api.get(reverse("referrals-archive"), {"patient": patient.pk}).json() == [expected]
+    assert api.get(reverse("appointments-archive"), {"patient_name": "omar z"}).json() == [expected_appt]
+    assert api.get(reverse("referrals-archive")).status_code == 400
+    assert api.patch(detail, {"notes": "x"}, format="json").status_code == 404
@@ -0,0 +1,83 @@
+# core/tests/test_async.py
+import asyncio
+import time
+
+import pytest
+from asgiref.sync import async_to_sync, sync_to_async
+from django.test import AsyncClient
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework.test import APIClient
+from rest_framework_simplejwt.tokens import AccessToken
+
+from appointments.models import Appointment, Room
+from notifications.models import ArrivalNotification
+from referrals.models import Patient, Referral
+
+
+def clients(user):
+    sync = APIClient()
+    sync.force_authenticate(user=user)
+    token = f"Bearer {AccessToken.for_user(user)}"
+
+    async def aget(url, data=None, **headers):
+        return await AsyncClient().get(url, data, headers={"Authorization": token, **headers})
+    return sync, aget
+
+
+def notify(patient):
+    return ArrivalNotification.objects.create(patient=patient, appt_at=timezone.now())
+
+
+@pytest.mark.django_db
+def test_async_endpoints_match_sync_output(boss):
+    room = Room.objects.create(name_fr="Salle 1", name_en="Room 1")
+    notify("Kenza")
+    Appointment.objects.create(patient_name="Omar", date="2025-03-21", time="14:00", room=room)
+    Referral.objects.create(patient=Patient.objects.create(first_name="A", last_name="B"))
+    sync, aget = clients(boss)
+
+    for url in (
+        reverse("arrival-notifs-list"),
+        reverse("appointments-list") + "?date_after=2025-03-01&date_before=2025-03-31",
+        reverse("referral-stats"),
+        reverse("bootstrap"),
+    ):
+        expected = sync.get(url, HTTP_ACCEPT_LANGUAGE="en")
+        res = async_to_sync(aget)(url, **{"Accept-Language": "en"})
+        assert res.status_code == 200, (url, res.content[:300])
+        assert res.json() == expected.json(), url
+        if url != reverse("referral-stats"):  # pas de validateur sur les statistiques
+            again = async_to_sync(aget)(url, **{"Accept-Language": "en", "If-None-Match": res["ETag"]})
+            assert again.status_code == 304
+
+    assert async_to_sync(AsyncClient().get)(reverse("arrival-notifs-list")).status_code == 401
+
+
+@pytest.mark.django_db
+def test_long_poll_returns_on_change_or_after_wait(boss, settings):
+    settings.LONG_POLL_INTERVAL = 0.05
+    notify("Kenza")
+    _, aget = clients(boss)
+    url = reverse("arrival-notifs-list")
+    etag = async_to_sync(aget)(url)["ETag"]
+
+    settings.LONG_POLL_MAX_WAIT = 0.2
+    t0 = time.monotonic()
+    res = async_to_sync(aget)(url, {"wait": 30}, **{"If-None-Match": etag})
+    assert res.status_code == 304 and 0.2 <= time.monotonic() - t0 < 2
+
+    settings.LONG_POLL_MAX_WAIT = 10
+
+    async def poll_while_arriving():
+        async def arrive():
+            await asyncio.sleep(0.2)
+            await sync_to_async(notify)("Omar")
+        poll, _ = await asyncio.gather(aget(url, {"wait": 10}, **{"If-None-Match": etag}), arrive())
+        return poll
+
+    t0 = time.monotonic()
+    res = async_to_sync(poll_while_arriving)()
+    assert res.status_code == 200 and time.monotonic() - t0 < 5
+    assert [n["patient"] for n in res.json()] == ["Omar", "Kenza"]
+    assert res["ETag"] != etag
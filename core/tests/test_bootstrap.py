@@ -0,0 +1,53 @@
+# core/tests/test_bootstrap.py
+import pytest
+from django.urls import reverse
+
+from accounts.models import Specialty, User
+from appointments.models import Room
+from referrals.models import UrgencyLevel
+
+
+@pytest.mark.django_db
+def test_bootstrap_returns_all_lookups_with_etag(anon_api):
+    spec = Specialty.objects.create(name_fr="Cardiologie", name_en="Cardiology")
+    Specialty.objects.create(name_fr="Ancienne", name_en="Old", is_active=False)
+    doc = User.objects.create_user(username="dr", role="medecin", code_personnel="M1", specialite=spec)
+    Room.objects.create(name_fr="Salle 1", name_en="Room 1")
+    UrgencyLevel.objects.create(name_fr="Urgent", name_en="Urgent", priority=1)
+    anon_api.force_authenticate(user=doc)
+
+    res = anon_api.get(reverse("bootstrap"), HTTP_ACCEPT_LANGUAGE="en")
+    assert res.status_code == 200
+    data = res.json()
+    assert set(data) >= {
+        "rooms", "appointment_types", "physicians",
+        "interventions", "urgencies", "specialties",
+    }
+    assert "insurances" not in data and "me" not in data
+    assert data["rooms"][0]["name"] == "Room 1"
+    assert [s["name"] for s in data["specialties"]] == ["Cardiology"]
+    assert data["physicians"][0]["specialite"]["name"] == "Cardiology"
+
+    etag = res["ETag"]
+    again = anon_api.get(reverse("bootstrap"), HTTP_ACCEPT_LANGUAGE="en", HTTP_IF_NONE_MATCH=etag)
+    assert again.status_code == 304
+
+    # autre langue → autre contenu, donc autre ETag
+    fr = anon_api.get(reverse("bootstrap"), HTTP_ACCEPT_LANGUAGE="fr", HTTP_IF_NONE_MATCH=etag)
+    assert fr.status_code == 200
+    assert fr.json()["rooms"][0]["name"] == "Salle 1"
+
+
+@pytest.mark.django_db
+def test_bootstrap_revalidates_before_serializing(api, django_assert_max_num_queries):
+    doc = User.objects.create_user(username="dr", role="medecin", last_name="Alami")
+    etag = api.get(reverse("bootstrap"))["ETag"]
+
+    with django_assert_max_num_queries(2):  # version des données de référence + agrégat des médecins
+        assert api.get(reverse("bootstrap"), HTTP_IF_NONE_MATCH=etag).status_code == 304
+
+    # médecin renommé : nouvel ETag
+    doc.last_name = "Bennani"
+    doc.save()
+    renamed = api.get(reverse("bootstrap"), HTTP_IF_NONE_MATCH=etag)
+    assert renamed.status_code == 200 and renamed.json()["physicians"][0]["last_name"] == "Bennani"
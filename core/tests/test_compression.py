@@ -0,0 +1,61 @@
+# core/tests/test_compression.py
+import gzip
+import json
+
+import pytest
+from django.urls import reverse
+
+from accounts.models import User
+from core.compression import negotiate
+from referrals.models import Patient, Referral
+
+
+@pytest.fixture
+def referrals(db):
+    for n in range(30):
+        Referral.objects.create(patient=Patient.objects.create(first_name="Patient", last_name=str(n)))
+
+
+def test_negotiate():
+    assert negotiate("gzip, deflate, br", ("br", "gzip")) == "br"
+    assert negotiate("br;q=0.5, gzip", ("br", "gzip")) == "gzip"
+    assert negotiate("gzip;q=0, identity", ("br", "gzip")) is None
+    assert negotiate("*", ("gzip",)) == "gzip"
+    assert negotiate("", ("br", "gzip")) is None
+
+
+@pytest.mark.django_db
+def test_large_json_is_gzipped(api, referrals):
+    url = reverse("referrals-list")
+    plain = api.get(url)
+    assert "Content-Encoding" not in plain and "Accept-Encoding" in plain["Vary"]
+
+    res = api.get(url, HTTP_ACCEPT_ENCODING="gzip")
+    assert res["Content-Encoding"] == "gzip"
+    assert int(res["Content-Length"]) < len(plain.content) / 3
+    assert json.loads(gzip.decompress(res.content)) == plain.json()
+    assert res["ETag"].startswith('W/"')
+
+
+@pytest.mark.django_db
+def test_small_excluded_and_streaming_bodies(api, referrals, settings):
+    settings.API_COMPRESSION_MIN_BYTES = 10 ** 9
+    User.objects.create_user(username="dr", password="secret-pass", role="direction")
+    login = api.post(reverse("auth-login"), {"username": "dr", "password": "secret-pass", "role": "direction"},
+                     format="json", HTTP_ACCEPT_ENCODING="gzip")
+    assert "Content-Encoding" not in login
+
+    small = api.get(reverse("referrals-list"), HTTP_ACCEPT_ENCODING="gzip")
+    assert "Content-Encoding" not in small
+
+    stream = api.get(reverse("referrals-list"), {"stream": "1"}, HTTP_ACCEPT_ENCODING="gzip")
+    assert stream["Content-Encoding"] == "gzip"
+    assert json.loads(gzip.decompress(b"".join(stream.streaming_content))) == small.json()
+
+
+@pytest.mark.django_db
+def test_brotli_preferred_when_available(api, referrals):
+    brotli = pytest.importorskip("brotli")
+    res = api.get(reverse("referrals-list"), HTTP_ACCEPT_ENCODING="gzip, br")
+    assert res["Content-Encoding"] == "br"
+    assert json.loads(brotli.decompress(res.content))
@@ -0,0 +1,84 @@
+# core/tests/test_conditional.py
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from accounts.models import User
+from appointments.models import Appointment
+from notifications.models import ArrivalNotification
+from referrals.models import Patient, Referral
+
+
+@pytest.mark.django_db
+def test_list_revalidates_with_one_aggregate_query(api):
+    patient = Patient.objects.create(first_name="Omar", last_name="B")
+    referral = Referral.objects.create(patient=patient)
+    url = reverse("referrals-list")
+
+    first = api.get(url)
+    assert first.status_code == 200
+    etag = first["ETag"]
+    assert etag.startswith('W/"') and first["Last-Modified"]
+
+    with CaptureQueriesContext(connection) as ctx:
+        again = api.get(url, HTTP_IF_NONE_MATCH=etag)
+    assert again.status_code == 304 and not again.content
+    assert len(ctx.captured_queries) <= 2  # version des données de référence + agrégat
+
+    # filtre, langue, ajout, modification, patient imbriqué : nouvel ETag
+    assert api.get(url, {"status": "new"}, HTTP_IF_NONE_MATCH=etag).status_code == 200
+    assert api.get(url, HTTP_IF_NONE_MATCH=etag, HTTP_ACCEPT_LANGUAGE="en").status_code == 200
+    patient.city = "Tunis"
+    patient.save()
+    changed = api.get(url, HTTP_IF_NONE_MATCH=etag)
+    assert changed.status_code == 200 and changed["ETag"] != etag
+
+    # sans réécrire la référence : updated_at reste l'heure métier (lue par le front)
+    referral.refresh_from_db()
+    assert referral.updated_at < patient.updated_at
+
+    Referral.objects.filter(pk=referral.pk).delete()
+    assert api.get(url, HTTP_IF_NONE_MATCH=changed["ETag"]).status_code == 200
+
+
+@pytest.mark.django_db
+def test_doctor_rename_advances_appointment_validators(api):
+    doctor = User.objects.create_user(username="dr", role="medecin", last_name="Alami")
+    appt = Appointment.objects.create(patient_name="Omar Z", date="2025-05-04", time="09:00", doctor=doctor)
+    list_url, detail_url = reverse("appointments-list"), reverse("appointments-detail", args=[appt.pk])
+    list_etag, detail = api.get(list_url)["ETag"], api.get(detail_url)
+
+    doctor.last_name = "Bennani"
+    doctor.save()
+    assert api.get(list_url, HTTP_IF_NONE_MATCH=list_etag).status_code == 200
+    assert api.get(detail_url, HTTP_IF_NONE_MATCH=detail["ETag"]).status_code == 200
+
+
+@pytest.mark.django_db
+def test_detail_honours_if_none_match_and_if_modified_since(api):
+    referral = Referral.objects.create(patient=Patient.objects.create(first_name="A", last_name="B"))
+    url = reverse("referrals-detail", args=[referral.pk])
+
+    first = api.get(url)
+    assert first.status_code == 200 and first.json()["id"] == referral.pk
+    assert api.get(url, HTTP_IF_NONE_MATCH=first["ETag"]).status_code == 304
+    assert api.get(url, HTTP_IF_MODIFIED_SINCE=first["Last-Modified"]).status_code == 304
+
+    referral.status = "sent"
+    referral.save()
+    assert api.get(url, HTTP_IF_NONE_MATCH=first["ETag"]).status_code == 200
+
+
+@pytest.mark.django_db
+def test_notification_status_changes_advance_updated_at(api):
+    notif = ArrivalNotification.objects.create(patient="Lina", appt_at="2025-01-01T10:00:00Z")
+    url = reverse("arrival-notifs-list")
+    etag = api.get(url)["ETag"]
+
+    api.post(reverse("arrival-notifs-ack", args=[notif.pk]))
+    acked = api.get(url, HTTP_IF_NONE_MATCH=etag)
+    assert acked.status_code == 200
+
+    api.post(reverse("arrival-notifs-mark-all-read"))
+    assert api.get(url, HTTP_IF_NONE_MATCH=acked["ETag"]).status_code == 200
@@ -0,0 +1,64 @@
+import sqlite3
+
+import pytest
+from django.db import connection
+
+from core.db import configure_sqlite, database_config, sqlite_pragmas
+
+
+def test_database_config_sqlite_and_postgres(monkeypatch):
+    monkeypatch.setenv("DB_STATEMENT_TIMEOUT_MS", "2000")
+    monkeypatch.setenv("DB_POOL", "1")
+
+    lite = database_config(None, default="sqlite:////tmp/x.sqlite3")
+    assert lite["OPTIONS"]["transaction_mode"] == "IMMEDIATE"
+    assert lite["CONN_HEALTH_CHECKS"] is True
+
+    pg = database_config("postgres://u:p@db:5432/clinic")
+    assert pg["OPTIONS"]["options"] == "-c statement_timeout=2000"
+    assert pg["OPTIONS"]["pool"]["max_size"] == 10
+    assert pg["CONN_MAX_AGE"] == 0
+
+    assert database_config(None, default="sqlite:////tmp/x.sqlite3", conn_max_age=60, asgi=True)["CONN_MAX_AGE"] == 0
+
+
+def test_pragmas_applied_to_file_database(tmp_path, monkeypatch):
+    monkeypatch.setenv("SQLITE_BUSY_TIMEOUT", "1234")
+
+    class FakeWrapper:
+        vendor = "sqlite"
+        settings_dict = {"PRAGMAS": sqlite_pragmas()}
+
+        def __init__(self, path):
+            self.connection = sqlite3.connect(path)
+
+        def is_in_memory_db(self):
+            return False
+
+    fake = FakeWrapper(tmp_path / "t.sqlite3")
+    configure_sqlite(sender=None, connection=fake)
+    pragma = lambda name: fake.connection.execute(f"PRAGMA {name}").fetchone()[0]  # noqa: E731
+    assert pragma("journal_mode") == "wal"
+    assert pragma("busy_timeout") == 1234
+    assert pragma("synchronous") == 1  # NORMAL
+
+
+@pytest.mark.skipif(connection.vendor != "sqlite", reason="PRAGMA SQLite")
+@pytest.mark.django_db
+def test_default_connection_is_tuned():
+    with connection.cursor() as cursor:
+        cursor.execute("PRAGMA busy_timeout")
+        assert cursor.fetchone()[0] == sqlite_pragmas()["busy_timeout"]
+
+
+@pytest.mark.parametrize("command", ["bench_db", "bench_partitions"])
+def test_benchmarks_refuse_to_flush_a_configured_database(command, tmp_path, monkeypatch):
+    from django.core.management import CommandError, call_command
+    from django.db import connections
+
+    app_db = tmp_path / "clinic.sqlite3"
+    monkeypatch.setitem(connections.settings["default"], "NAME", app_db)
+    url = f"sqlite:///{app_db}"
+    option = {"urls": [url]} if command == "bench_db" else {"url": url}
+    with pytest.raises(CommandError, match="--i-know"):
+        call_command(command, **option)
@@ -0,0 +1,71 @@
+# core/tests/test_eager.py
+import logging
+
+import pytest
+from rest_framework import serializers
+
+from appointments.models import Appointment
+from appointments.serializers import AppointmentSerializer
+from core.eager import eager_load, eager_paths
+from referrals.models import Insurance, Patient, Referral
+from referrals.serializers import ReferralCreateSerializer, ReferralSerializer
+
+
+class PatientWithReferralsSerializer(serializers.ModelSerializer):
+    referrals = ReferralSerializer(many=True)
+
+    class Meta:
+        model = Patient
+        fields = ["id", "referrals"]
+
+
+class ReferralDottedSerializer(serializers.ModelSerializer):
+    patient_city = serializers.CharField(source="patient.city")
+    insurance = serializers.PrimaryKeyRelatedField(queryset=Insurance.objects.all())
+    doctor = serializers.StringRelatedField()
+
+    class Meta:
+        model = Referral
+        fields = ["id", "patient_city", "insurance", "doctor"]
+
+
+def test_nested_serializers_and_meta_hints():
+    assert eager_paths(ReferralSerializer, Referral) == (("insurance", "patient"), ())
+    assert eager_paths(AppointmentSerializer, Appointment) == (("doctor", "patient"), ())
+
+
+def test_dotted_sources_and_pk_only_relations():
+    # la FK lue en clé primaire seule ne demande pas de jointure
+    assert eager_paths(ReferralDottedSerializer, Referral) == (("doctor", "patient"), ())
+
+
+def test_reverse_relations_are_prefetched():
+    assert eager_paths(PatientWithReferralsSerializer, Patient) == (
+        (), ("referrals__insurance", "referrals__patient"),
+    )
+
+
+def test_eager_load_keeps_declared_paths_and_reports_missing(settings, caplog):
+    settings.EAGER_LOAD_REPORT = True
+    qs = eager_load(Referral.objects.select_related("patient"), ReferralSerializer)
+    assert qs.query.select_related == {"patient": {}, "insurance": {}}
+    assert "select_related manquant ['insurance']" in caplog.text
+
+    caplog.clear()
+    with caplog.at_level(logging.WARNING, logger="core.eager"):
+        eager_load(Referral.objects.select_related("patient", "insurance"), ReferralSerializer)
+    assert caplog.text == ""
+
+
+def test_write_serializers_are_ignored():
+    qs = Referral.objects.all()
+    assert eager_load(qs, ReferralCreateSerializer) is qs
+
+
+@pytest.mark.django_db
+def test_lazy_loads_disappear(django_assert_num_queries):
+    patient = Patient.objects.create(first_name="A", last_name="B")
+    for _ in range(3):
+        Referral.objects.create(patient=patient, insurance=Insurance.objects.create(insurance_provider="axa"))
+    with django_assert_num_queries(1):
+        list(ReferralDottedSerializer(eager_load(Referral.objects.all(), ReferralDottedSerializer), many=True).data)
@@ -0,0 +1,38 @@
+# core/tests/test_i18n.py
+import pytest
+from django.urls import reverse
+from django.utils import translation
+
+from appointments.models import Room
+from core.i18n import normalize_language
+from referrals.models import InterventionType
+
+
+@pytest.mark.parametrize("raw, expected", [
+    ("en-US,en;q=0.9,fr;q=0.8", "en"),
+    ("fr-FR,fr;q=0.9,en;q=0.8", "fr"),
+    ("de-DE,en;q=0.5", "en"),
+    ("", "fr"),
+    ("*", "fr"),
+])
+def test_normalize_language(raw, expected):
+    assert normalize_language(raw) == expected
+
+
+@pytest.mark.django_db
+def test_labels_follow_request_language_and_are_reset(anon_api):
+    Room.objects.create(name_fr="Salle 1", name_en="Room 1", status="cleaning")
+    InterventionType.objects.create(name_fr="Chirurgie", name_en="")
+
+    res = anon_api.get(reverse("rooms-list"), HTTP_ACCEPT_LANGUAGE="en-GB,en;q=0.9")
+    row = res.data[0]
+    assert (row["name"], row["status_label"]) == ("Room 1", "Cleaning")
+    assert res["Content-Language"] == "en"
+
+    # ?lang= prioritaire ; repli sur le FR quand la traduction manque
+    res = anon_api.get(reverse("interventions-list"), {"lang": "en"}, HTTP_ACCEPT_LANGUAGE="fr")
+    assert res.data[0]["name"] == "Chirurgie"
+
+    res = anon_api.get(reverse("rooms-list"))
+    assert res.data[0]["status_label"] == "Nettoyage"
+    assert translation.get_language() == "fr"
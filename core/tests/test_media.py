@@ -0,0 +1,70 @@
+# core/tests/test_media.py
+import pytest
+from django.test import Client
+
+from core.media import parse_range
+
+DIGEST = "ab" * 32
+
+
+@pytest.fixture
+def media(settings, tmp_path):
+    settings.MEDIA_ROOT = tmp_path
+    (tmp_path / "profiles" / "thumbs").mkdir(parents=True)
+    (tmp_path / "profiles" / "legacy.png").write_bytes(bytes(range(256)) * 4)
+    (tmp_path / "profiles" / "thumbs" / f"{DIGEST}-96.webp").write_bytes(b"webp")
+    (tmp_path / "private.txt").write_bytes(b"secret")
+    return tmp_path
+
+
+def _body(res):
+    return b"".join(res.streaming_content)
+
+
+def test_parse_range():
+    assert parse_range("bytes=0-99", 1000) == (0, 99)
+    assert parse_range("bytes=900-", 1000) == (900, 999)
+    assert parse_range("bytes=-100", 1000) == (900, 999)
+    assert parse_range("bytes=0-5000", 1000) == (0, 999)
+    assert parse_range("bytes=0-1,5-6", 1000) is None
+    assert parse_range("bytes=9-3", 1000) is None
+    with pytest.raises(ValueError):
+        parse_range("bytes=1000-", 1000)
+
+
+def test_conditional_and_cache_headers(media):
+    client = Client()
+    res = client.get("/media/profiles/legacy.png")
+    assert res.status_code == 200 and _body(res) == (media / "profiles" / "legacy.png").read_bytes()
+    assert res["Content-Type"] == "image/png" and res["Cache-Control"] == "public, no-cache"
+
+    assert client.get("/media/profiles/legacy.png", HTTP_IF_NONE_MATCH=res["ETag"]).status_code == 304
+    assert client.get("/media/profiles/legacy.png", HTTP_IF_MODIFIED_SINCE=res["Last-Modified"]).status_code == 304
+
+    thumb = client.get(f"/media/profiles/thumbs/{DIGEST}-96.webp")
+    assert "immutable" in thumb["Cache-Control"]
+
+    assert client.get("/media/private.txt").status_code == 404
+    assert client.get("/media/profiles/../private.txt").status_code == 404
+    assert client.get("/media/profiles/thumbs").status_code == 404
+
+
+def test_range_requests(media):
+    client = Client()
+    data = (media / "profiles" / "legacy.png").read_bytes()
+    res = client.get("/media/profiles/legacy.png", HTTP_RANGE="bytes=10-19")
+    assert res.status_code == 206 and _body(res) == data[10:20]
+    assert res["Content-Range"] == f"bytes 10-19/{len(data)}" and res["Content-Length"] == "10"
+
+    stale = client.get("/media/profiles/legacy.png", HTTP_RANGE="bytes=10-19", HTTP_IF_RANGE='"autre"')
+    assert stale.status_code == 200 and _body(stale) == data
+
+    res = client.get("/media/profiles/legacy.png", HTTP_RANGE=f"bytes={len(data)}-")
+    assert res.status_code == 416 and res["Content-Range"] == f"bytes */{len(data)}"
+
+
+def test_accel_redirect(media, settings):
+    settings.MEDIA_ACCEL_REDIRECT = "/_media/"
+    res = Client().get("/media/profiles/legacy.png")
+    assert res["X-Accel-Redirect"] == "/_media/profiles/legacy.png" and res.content == b""
+    assert res["ETag"] and res["Content-Type"] == "image/png"
@@ -0,0 +1,70 @@
+# core/tests/test_partitions.py
+import datetime
+
+import pytest
+from django.db import connection, migrations
+from django.db.migrations.loader import MigrationLoader
+from django.urls import reverse
+from django.utils import timezone
+
+from core.management.commands.bench_partitions import _relations
+from core.management.commands.seed_load import explicit_timestamps
+from core.partitions import convert, created_range, ensure_partitions, is_partitioned, partition_name, unpartition
+from notifications.models import ArrivalNotification
+from referrals.models import Referral
+
+
+def at(*args):
+    return timezone.make_aware(datetime.datetime(*args))
+
+
+def test_created_range_uses_plain_bounds():
+    assert created_range({"from": "2025-03-01", "to": "2025-03-31"}) == {
+        "created_at__gte": at(2025, 3, 1), "created_at__lt": at(2025, 4, 1),  # journée du 31 incluse
+    }
+    assert created_range({"to": "2025-03-31T12:30:00+00:00"}) == {
+        "created_at__lte": datetime.datetime(2025, 3, 31, 12, 30, tzinfo=datetime.timezone.utc),
+    }
+    assert created_range({"from": "hier", "to": ""}) == {}
+
+
+@pytest.mark.django_db
+def test_stats_and_notifications_filter_by_window(api):
+    with explicit_timestamps(Referral, ArrivalNotification):
+        for moment in (at(2025, 2, 28, 23), at(2025, 3, 31, 18), at(2025, 4, 1, 9)):
+            Referral.objects.create(created_at=moment, updated_at=moment)
+            ArrivalNotification.objects.create(patient="P", appt_at=moment, created_at=moment, updated_at=moment)
+
+    window = {"from": "2025-03-01", "to": "2025-03-31"}
+    assert api.get(reverse("referral-stats"), window).json()["funnel"]["referrals"] == 1
+    assert [n["id"] for n in api.get(reverse("arrival-notifs-list"), window).json()] == [
+        ArrivalNotification.objects.get(created_at=at(2025, 3, 31, 18)).pk
+    ]
+
+
+def test_migrations_do_not_partition():
+    # conversion manuelle (« partitions --convert ») tant qu'elle n'est pas validée sur PostgreSQL
+    graph = MigrationLoader(None, ignore_no_migrations=True).graph
+    for app in ("referrals", "notifications"):
+        operations = graph.nodes[(app, "0005_partition_by_month")].operations
+        assert [type(op) for op in operations] == [migrations.AddIndex]
+
+
+@pytest.mark.skipif(connection.vendor != "postgresql", reason="partitionnement natif PostgreSQL")
+@pytest.mark.django_db
+def test_convert_keeps_rows_and_prunes_months():
+    with explicit_timestamps(Referral):
+        old = Referral.objects.create(created_at=at(2024, 1, 10), updated_at=at(2024, 1, 10))
+    assert convert(connection, Referral)
+    try:
+        table = Referral._meta.db_table
+        assert is_partitioned(connection, table)
+        assert ensure_partitions() == []  # mois à venir déjà créés par la conversion
+        assert Referral.objects.get(pk=old.pk).created_at == old.created_at
+        assert Referral.objects.create().pk > old.pk  # séquence reprise après les lignes copiées
+
+        plan = Referral.objects.filter(**created_range({"from": "2024-01-01", "to": "2024-01-31"})).explain(format="json")
+        assert _relations(plan) == [partition_name(table, datetime.date(2024, 1, 1))]
+    finally:
+        assert unpartition(connection, Referral)
+    assert Referral.objects.filter(pk=old.pk).exists()
@@ -0,0 +1,44 @@
+# core/tests/test_perf.py
+import pytest
+from django.urls import reverse
+
+from accounts.models import User
+from appointments.models import Appointment
+from core import perf
+
+
+@pytest.fixture(autouse=True)
+def sampling(settings):
+    settings.PERF_SAMPLE_RATE = 1.0
+    perf.registry.reset()
+
+
+def test_histogram_percentiles_stay_within_bucket_error():
+    h = perf.Histogram()
+    for ms in range(1, 101):
+        h.record(float(ms))
+    summary = h.summary()
+    assert summary["count"] == 100 and summary["max"] == 100
+    assert 50 <= summary["p50"] <= 50 * 1.2
+    assert 95 <= summary["p95"] <= 100
+
+
+@pytest.mark.django_db
+def test_server_timing_and_perf_endpoint(anon_api, boss):
+    doc = User.objects.create_user(username="dr", role="medecin", code_personnel="M1")
+    Appointment.objects.create(patient_name="A", date="2025-01-01", time="09:00", doctor=doc)
+    anon_api.force_authenticate(user=doc)
+
+    res = anon_api.get(reverse("appointments-list"))
+    assert res.status_code == 200
+    timing = res["Server-Timing"]
+    assert timing.startswith("db;dur=") and "serialize;dur=" in timing and "total;dur=" in timing
+
+    assert anon_api.get(reverse("perf-stats")).status_code == 403
+
+    anon_api.force_authenticate(user=boss)
+    stats = anon_api.get(reverse("perf-stats")).json()
+    row = stats["views"]["GET appointments-list"]
+    assert row["count"] == 1
+    assert row["queries"]["max"] >= 1
+    assert set(row["total_ms"]) >= {"p50", "p95", "p99"}
@@ -0,0 +1,146 @@
+# core/tests/test_query_budgets.py
+"""
+Budget de requêtes des listes de chaque router (accounts, appointments,
+referrals, notifications) : le nombre de requêtes ne doit pas dépendre du
+nombre de lignes (tailles 1, 10, 100).
+"""
+import itertools
+
+import pytest
+from django.urls import reverse
+from django.utils import timezone
+
+from accounts.models import Specialty, User
+from accounts.urls import router as accounts_router
+from appointments.models import Appointment, AppointmentType, Patient as AppointmentPatient, Room
+from appointments.urls import router as appointments_router
+from core.testing import assert_constant_queries, assert_max_queries
+from notifications.models import ArrivalNotification
+from notifications.urls import router as notifications_router
+from referrals.models import Insurance, InterventionType, Patient, Referral, UrgencyLevel
+from referrals.urls import router as referrals_router
+
+ROUTERS = [accounts_router, appointments_router, referrals_router, notifications_router]
+SIZES = (1, 10, 100)
+
+_seq = itertools.count()
+
+
+def _doctor():
+    n = next(_seq)
+    spec = Specialty.objects.create(name_fr=f"Spécialité {n}", name_en=f"Specialty {n}")
+    return User.objects.create_user(
+        username=f"dr{n}", role="medecin", code_personnel=f"C{n}", specialite=spec, first_name="Jean", last_name=f"D{n}"
+    )
+
+
+def _fill(model, build):
+    """make_rows(size) : complète la table jusqu'à ``size`` lignes avec ``build()``."""
+    def make_rows(size):
+        missing = size - model.objects.count()
+        for _ in range(max(missing, 0)):
+            build()
+    return make_rows
+
+
+def _referral():
+    n = next(_seq)
+    return Referral.objects.create(
+        patient=Patient.objects.create(first_name="P", last_name=str(n)),
+        insurance=Insurance.objects.create(insurance_provider="cnss", insurance_policy_number=str(n)),
+        doctor=_doctor(),
+        intervention_type=InterventionType.objects.create(name_fr=f"Intervention {n}"),
+        urgency_level=UrgencyLevel.objects.create(name_fr=f"Urgence {n}", priority=n),
+    )
+
+
+def _appointment():
+    n = next(_seq)
+    return Appointment.objects.create(
+        patient=AppointmentPatient.objects.create(first_name="P", last_name=str(n)),
+        patient_name=f"P {n}", time="09:00", doctor=_doctor(),
+        room=Room.objects.create(name_fr=f"Salle {n}"),
+        type=AppointmentType.objects.create(name_fr=f"Type {n}"),
+    )
+
+
+def _notification():
+    n = next(_seq)
+    return ArrivalNotification.objects.create(
+        doctor=_doctor(), patient=f"P {n}", appt_at=timezone.now(),
+        room=Room.objects.create(name_fr=f"Salle {n}"),
+        intervention_type=AppointmentType.objects.create(name_fr=f"Type {n}"),
+    )
+
+
+# basename → make_rows(size)
+FACTORIES = {
+    "users": lambda size: [_doctor() for _ in range(max(size - User.objects.filter(role="medecin").count(), 0))],
+    "specialty": _fill(Specialty, lambda: Specialty.objects.create(name_fr=f"S{next(_seq)}", name_en="S")),
+    "appointments": _fill(Appointment, _appointment),
+    "rooms": _fill(Room, lambda: Room.objects.create(name_fr=f"Salle {next(_seq)}")),
+    "appointment-types": _fill(AppointmentType, lambda: AppointmentType.objects.create(name_fr=f"T{next(_seq)}")),
+    "patient": _fill(AppointmentPatient, lambda: AppointmentPatient.objects.create(first_name="P", last_name=str(next(_seq)))),
+    "referrals": _fill(Referral, _referral),
+    "interventions": _fill(InterventionType, lambda: InterventionType.objects.create(name_fr=f"I{next(_seq)}")),
+    "urgencies": _fill(UrgencyLevel, lambda: UrgencyLevel.objects.create(name_fr=f"U{next(_seq)}", priority=next(_seq))),
+    "insurances": _fill(Insurance, lambda: Insurance.objects.create(insurance_provider="axa")),
+    "secretary-referrals": _fill(Referral, _referral),
+    "arrival-notifs": _fill(ArrivalNotification, _notification),
+}
+
+# budget max par liste (requête de version des données de référence comprise,
+# + l'agrégat du validateur ETag pour les listes conditionnelles, cf. core/conditional.py)
+BUDGETS = {
+    "users": 2,
+    "specialty": 1,
+    "appointments": 3,
+    "rooms": 1,
+    "appointment-types": 1,
+    "patient": 1,
+    "referrals": 3,
+    "interventions": 1,
+    "urgencies": 1,
+    "insurances": 1,
+    "secretary-referrals": 3,
+    "arrival-notifs": 3,
+}
+
+# listes encore en N+1 (à corriger) : strict=True signale toute correction
+KNOWN_N_PLUS_ONE = {}
+
+
+def _registered():
+    for router in ROUTERS:
+        for prefix, viewset, basename in router.registry:
+            yield basename or router.get_default_basename(viewset)
+
+
+def test_every_router_has_a_factory_and_budget():
+    registered = set(_registered())
+    assert registered <= set(FACTORIES), registered - set(FACTORIES)
+    assert registered <= set(BUDGETS), registered - set(BUDGETS)
+
+
+@pytest.mark.django_db
+def test_assert_max_queries_reports_overflow():
+    with assert_max_queries(1):
+        list(Room.objects.all())
+    with pytest.raises(AssertionError, match="2 requêtes SQL exécutées, budget 1"):
+        with assert_max_queries(1):
+            list(Room.objects.all())
+            list(Room.objects.all())
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("basename", [
+    pytest.param(name, marks=pytest.mark.xfail(reason=KNOWN_N_PLUS_ONE[name], strict=True))
+    if name in KNOWN_N_PLUS_ONE else name
+    for name in _registered()
+])
+@pytest.mark.parametrize("fast", [True, False], ids=["rows", "drf"])
+def test_list_query_count_is_constant(api, settings, basename, fast):
+    # drf : serializers DRF + chargement anticipé déduit (core/eager.py)
+    settings.FAST_LIST_SERIALIZERS = fast
+    url = reverse(f"{basename}-list")
+    assert_constant_queries(FACTORIES[basename], lambda: api.get(url), sizes=SIZES, budget=BUDGETS[basename])
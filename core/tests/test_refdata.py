@@ -0,0 +1,61 @@
+# core/tests/test_refdata.py
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from appointments.models import Room
+from core import refdata
+from core.models import ReferenceDataVersion
+
+
+@pytest.fixture(autouse=True)
+def fresh_snapshot(settings):
+    settings.REFDATA_CHECK_INTERVAL = 60
+    refdata.invalidate()
+    yield
+    refdata.invalidate()
+
+
+@pytest.mark.django_db(transaction=True)
+def test_reference_lists_are_served_from_worker_memory(anon_api):
+    Room.objects.create(name_fr="Salle 1", name_en="Room 1")
+    anon_api.get(reverse("rooms-list"))  # chargement initial
+
+    with CaptureQueriesContext(connection) as ctx:
+        res = anon_api.get(reverse("rooms-list"))
+    assert [r["name"] for r in res.data] == ["Salle 1"]
+    assert len(ctx.captured_queries) == 0
+
+    # save → version incrémentée → rechargement
+    before = ReferenceDataVersion.objects.get(pk=1).version
+    Room.objects.create(name_fr="Salle 2")
+    assert ReferenceDataVersion.objects.get(pk=1).version == before + 1
+    res = anon_api.get(reverse("rooms-list"))
+    assert [r["name"] for r in res.data] == ["Salle 1", "Salle 2"]
+
+
+@pytest.mark.django_db(transaction=True)
+def test_other_worker_change_is_seen_after_check_interval(anon_api, settings):
+    Room.objects.create(name_fr="Salle 1")
+    assert [r.name_fr for r in refdata.get_snapshot().rows("rooms")] == ["Salle 1"]
+
+    # un autre worker modifie la table (pas de signal dans ce process)
+    Room.objects.filter(name_fr="Salle 1").update(name_fr="Salle A")
+    ReferenceDataVersion.objects.filter(pk=1).update(version=99)
+    assert refdata.get_snapshot().rows("rooms")[0].name_fr == "Salle 1"
+
+    settings.REFDATA_CHECK_INTERVAL = 0
+    assert refdata.get_snapshot().rows("rooms")[0].name_fr == "Salle A"
+
+
+@pytest.mark.django_db
+def test_referral_reference_missing_from_snapshot_is_read_from_db():
+    from referrals.models import InterventionType
+    from referrals.serializers import _resolve_reference
+
+    stale = refdata.Snapshot(0, {"intervention_types": []})  # copie d'avant la création
+    scan = InterventionType.objects.create(name_fr="Scanner", name_en="CT scan")
+    assert _resolve_reference(stale, "intervention_types", str(scan.pk)).id == scan.pk
+    assert _resolve_reference(stale, "intervention_types", "ct SCAN").id == scan.pk
+    assert _resolve_reference(stale, "intervention_types", str(scan.pk + 1)) is None
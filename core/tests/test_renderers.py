@@ -0,0 +1,44 @@
+# core/tests/test_renderers.py
+import datetime
+import io
+import uuid
+from decimal import Decimal
+from zoneinfo import ZoneInfo
+
+import pytest
+from django.utils.translation import gettext_lazy as _
+from rest_framework.exceptions import ParseError
+from rest_framework.parsers import JSONParser
+from rest_framework.renderers import JSONRenderer
+
+from core.renderers import FastJSONParser, FastJSONRenderer
+
+PAYLOAD = {
+    "utc": datetime.datetime(2025, 1, 1, 10, 0, tzinfo=datetime.timezone.utc),
+    "local": datetime.datetime(2025, 7, 1, 10, 0, 0, 123456, tzinfo=ZoneInfo("Africa/Tunis")),
+    "naive": datetime.datetime(2025, 1, 1, 10, 0),
+    "day": datetime.date(2025, 1, 2),
+    "slot": datetime.time(9, 30),
+    "amount": Decimal("125.50"),
+    "id": uuid.UUID("12345678-1234-5678-1234-567812345678"),
+    "label": _("Nouveau"),
+    "text": "Créé\u2028ok",
+    1: [1.5, None, True, 2 ** 70],
+}
+
+
+def test_render_is_byte_identical_to_drf():
+    assert FastJSONRenderer().render(PAYLOAD) == JSONRenderer().render(PAYLOAD)
+    assert FastJSONRenderer().render(None) == b""
+
+
+def test_indent_falls_back_to_drf():
+    rendered = FastJSONRenderer().render({"a": 1}, "application/json; indent=2")
+    assert rendered == JSONRenderer().render({"a": 1}, "application/json; indent=2")
+
+
+def test_parser_matches_drf_and_reports_errors():
+    body = JSONRenderer().render({"name": "Ahmed", "items": [1, 2.5, None]})
+    assert FastJSONParser().parse(io.BytesIO(body)) == JSONParser().parse(io.BytesIO(body))
+    with pytest.raises(ParseError, match="JSON parse error"):
+        FastJSONParser().parse(io.BytesIO(b'{"a": NaN}'))
@@ -0,0 +1,74 @@
+# core/tests/test_routing.py
+import pytest
+from django.db import connections
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from core import refdata, routing
+from referrals.models import Patient, Referral
+
+# deux alias sur la base de test : un réplica valide, un injoignable
+ALIASES = {"replica": {}, "replica_down": {"NAME": "/nonexistent/dir/replica.sqlite3"}}
+pytestmark = pytest.mark.django_db(transaction=True, databases=["default", *ALIASES])
+
+
+@pytest.fixture(scope="module", autouse=True)
+def replicas(django_db_setup, django_db_blocker):
+    for alias, overrides in ALIASES.items():
+        connections.settings[alias] = {
+            **connections["default"].settings_dict, "TEST": {"MIRROR": "default"}, **overrides,
+        }
+    yield
+    with django_db_blocker.unblock():
+        for alias in ALIASES:
+            connections[alias].close()
+            del connections[alias]
+            del connections.settings[alias]
+    refdata.invalidate()  # snapshot chargé hors transaction de test
+
+
+@pytest.fixture
+def client(api):
+    routing._down_until.clear()
+    return api
+
+
+def test_reads_go_to_replica(client):
+    Referral.objects.create(patient=Patient.objects.create(first_name="A", last_name="B"))
+    for url in (reverse("referrals-list"), reverse("referral-stats")):
+        with CaptureQueriesContext(connections["replica"]) as on_replica:
+            res = client.get(url)
+        assert res.status_code == 200, url
+        assert len(on_replica), url
+
+
+def test_write_pins_request_to_primary():
+    token = routing.begin_request()
+    try:
+        assert routing.use_replica() == "replica"
+        assert Patient.objects.all().db == "replica"
+        Patient.objects.create(first_name="A", last_name="B")
+        assert Patient.objects.all().db == "default"
+        assert routing.use_replica() is None
+    finally:
+        routing.end_request(token)
+    assert Patient.objects.all().db == "default"  # hors requête : primaire
+
+
+def test_writes_follow_related_object_database():
+    router = routing.ReplicaRouter()
+    on_bench, on_replica = Patient(), Patient()
+    on_bench._state.db, on_replica._state.db = "bench_0", "replica"
+    assert router.db_for_write(Referral, instance=on_bench) == "bench_0"  # alias temporaire (bench_db)
+    assert router.db_for_write(Referral, instance=on_replica) == "default"
+    assert router.db_for_write(Referral) == "default"
+
+
+@pytest.mark.parametrize("alias", ["absent", "replica_down"])
+def test_stats_without_replica(client, settings, alias):
+    settings.DATABASE_REPLICA_ALIAS = alias
+    with CaptureQueriesContext(connections["default"]) as on_primary:
+        assert client.get(reverse("referral-stats")).status_code == 200
+    assert len(on_primary)
+    # injoignable : écarté, plus de tentative à chaque requête
+    assert (alias in routing._down_until) == (alias == "replica_down")
@@ -0,0 +1,89 @@
+# core/tests/test_rows_parity.py
+"""Les RowSerializer (core/rows.py) produisent exactement le JSON des serializers DRF."""
+import datetime
+
+import pytest
+from django.utils import timezone, translation
+from rest_framework.renderers import JSONRenderer
+
+from accounts.models import User
+from appointments.models import Appointment, AppointmentType, Patient as AppointmentPatient, Room
+from appointments.rows import AppointmentRows
+from appointments.serializers import AppointmentSerializer
+from core.i18n import reset_language, set_language
+from notifications.models import ArrivalNotification
+from notifications.rows import ArrivalNotificationRows
+from notifications.serializers import ArrivalNotificationSerializer
+from referrals.models import Insurance, InterventionType, Patient, Referral, UrgencyLevel
+from referrals.rows import ReferralRows
+from referrals.serializers import ReferralSerializer
+
+
+def _render(data):
+    return JSONRenderer().render(data)
+
+
+def assert_parity(serializer_class, rows_class, queryset):
+    for lang in ("fr", "en"):
+        token = set_language(lang)
+        try:
+            with translation.override(lang):
+                expected = _render(serializer_class(queryset, many=True).data)
+                actual = _render(rows_class(queryset).data)
+        finally:
+            reset_language(token)
+        assert actual == expected, lang
+
+
+@pytest.fixture
+def refs(db):
+    return {
+        "room": Room.objects.create(name_fr="Salle A", name_en=None, status="occupied"),
+        "type": AppointmentType.objects.create(name_fr="Consultation", name_en="Visit"),
+        "intervention": InterventionType.objects.create(name_fr="IRM", name_en="MRI", description_fr="Imagerie"),
+        "urgency": UrgencyLevel.objects.create(name_fr="Urgente", name_en="", color="rouge", priority=1),
+        "doctor": User.objects.create_user(username="dr", first_name="Ana", last_name="Roy", role="medecin",
+                                           code_personnel="M1"),
+        "nameless": User.objects.create_user(username="dr2", role="medecin", code_personnel="M2"),
+    }
+
+
+@pytest.mark.django_db
+def test_appointment_rows_parity(refs):
+    patient = AppointmentPatient.objects.create(first_name="Lina", last_name=None, birth_date=datetime.date(1990, 5, 1))
+    Appointment.objects.create(
+        patient=patient, patient_name="Lina", date=datetime.date(2025, 3, 4), time=datetime.time(9, 30),
+        room=refs["room"], type=refs["type"], doctor=refs["doctor"], reason="Douleur", email="l@x.io",
+    )
+    Appointment.objects.create(patient_name="Sans Lien", time="10:00", doctor=refs["nameless"])
+    Appointment.objects.create(patient_name="Texte", time="11:15", physician="Dr Texte —")
+    appt = Appointment.objects.create(patient_name="Orphelin", time="12:00")
+    Appointment.objects.filter(pk=appt.pk).update(patient=None)
+
+    assert_parity(AppointmentSerializer, AppointmentRows, Appointment.objects.order_by("id"))
+
+
+@pytest.mark.django_db
+def test_referral_rows_parity(refs):
+    patient = Patient.objects.create(first_name="Omar", last_name="B", gender="male", birth_date="1980-01-02")
+    insurance = Insurance.objects.create(insurance_provider="axa", expiration_date="2026-12-31")
+    Referral.objects.create(
+        patient=patient, insurance=insurance, doctor=refs["doctor"], status="accepted",
+        intervention_type=refs["intervention"], urgency_level=refs["urgency"], notes="x",
+    )
+    Referral.objects.create(patient=Patient.objects.create(first_name="Nora", last_name="C", gender="other"))
+    Referral.objects.create(status="inconnu")
+
+    assert_parity(ReferralSerializer, ReferralRows, Referral.objects.order_by("id"))
+
+
+@pytest.mark.django_db
+def test_notification_rows_parity(refs):
+    now = timezone.now()
+    ArrivalNotification.objects.create(
+        doctor=refs["doctor"], patient="Lina", ref_by="Dr Roy", appt_at=now,
+        room=refs["room"], intervention_type=refs["type"], message="Arrivée",
+    )
+    ArrivalNotification.objects.create(patient="Sans salle", appt_at=now - datetime.timedelta(days=1))
+
+    assert_parity(ArrivalNotificationSerializer, ArrivalNotificationRows, ArrivalNotification.objects.all())
@@ -0,0 +1,49 @@
+# core/tests/test_schema.py
+import pytest
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+from core import schema
+
+
+@pytest.fixture
+def schema_dir(settings, tmp_path):
+    settings.OPENAPI_SCHEMA_DIR = tmp_path
+    settings.OPENAPI_SCHEMA_AUTOBUILD = False
+    schema._loaded.update(mtime=None, manifest=None, files={})
+    yield tmp_path
+    schema._loaded.update(mtime=None, manifest=None, files={})
+
+
+@pytest.mark.django_db
+def test_schema_served_from_build(schema_dir):
+    manifest = schema.build(["fr"])
+    body = (schema_dir / "openapi.fr.json").read_bytes()
+    sha = manifest["files"]["openapi.fr.json"]
+    client = APIClient()
+
+    res = client.get(reverse("schema"), {"lang": "fr"}, HTTP_ACCEPT="application/json")
+    assert res.status_code == 200 and res.content == body
+    assert res["ETag"] == f'"{sha}"' and res["Cache-Control"] == "public, no-cache"
+    assert client.get(reverse("schema"), {"lang": "fr"}, HTTP_ACCEPT="application/json",
+                      HTTP_IF_NONE_MATCH=res["ETag"]).status_code == 304
+
+    versioned = client.get(reverse("schema"), {"lang": "fr", "v": sha}, HTTP_ACCEPT="application/json")
+    assert "immutable" in versioned["Cache-Control"]
+    # YAML par défaut, comme SpectacularAPIView
+    assert client.get(reverse("schema"), {"lang": "fr"}).content == (schema_dir / "openapi.fr.yaml").read_bytes()
+
+    docs = client.get(reverse("docs"), {"lang": "fr"})
+    assert sha in docs.content.decode()  # URL passée par escapejs : « v\u003D<hash> »
+
+
+@pytest.mark.django_db
+def test_schema_without_build_falls_back_or_autobuilds(schema_dir, settings):
+    client = APIClient()
+    res = client.get(reverse("schema"), {"lang": "en"}, HTTP_ACCEPT="application/json")
+    assert res.status_code == 200 and "ETag" not in res and res.json()["openapi"]
+
+    settings.OPENAPI_SCHEMA_AUTOBUILD = True
+    res = client.get(reverse("schema"), {"lang": "en"}, HTTP_ACCEPT="application/json")
+    assert res["ETag"] and (schema_dir / "openapi.en.json").read_bytes() == res.content
+    assert not schema.is_stale(schema.read_manifest())
@@ -0,0 +1,46 @@
+# core/tests/test_seed_load.py
+import pytest
+from django.core.management import call_command
+
+from accounts.models import User
+from appointments.models import Appointment, Room
+from notifications.models import ArrivalNotification
+from referrals.models import Referral
+from referrals.models_secretary import SecretaryReferral
+
+
+@pytest.mark.django_db
+def test_seed_load_creates_and_clears_tagged_rows():
+    keep = Referral.objects.create(consultation_reason="réelle")
+    real_room = Room.objects.create(name_fr="Salle Lumière")  # vraie salle : ni réutilisée ni supprimée
+
+    call_command("seed_load", referrals=30, appointments=40, notifications=50, doctors=5, rooms=3, batch_size=7)
+    assert Referral.objects.count() == 31
+    assert SecretaryReferral.objects.filter(internalNotes="seed_load").count() == 30
+    assert Appointment.objects.count() == 40
+    assert ArrivalNotification.objects.count() == 50
+    assert User.objects.filter(username__startswith="load-dr-").count() == 5
+    assert Room.objects.count() == 4 and not Appointment.objects.filter(room=real_room).exists()
+    # dates réparties dans le passé, pas toutes à « maintenant »
+    assert Referral.objects.values("created_at").distinct().count() > 1
+
+    call_command("seed_load", clear=True)
+    assert list(Referral.objects.all()) == [keep]
+    assert not Appointment.objects.exists()
+    assert not User.objects.filter(username__startswith="load-").exists()
+    assert list(Room.objects.all()) == [real_room]
+
+
+@pytest.mark.django_db
+def test_bench_rows_reports_rows_per_second_and_queries(tmp_path):
+    import json
+
+    call_command("seed_load", referrals=20, appointments=20, notifications=20, doctors=3, rooms=2)
+    out = tmp_path / "bench_rows.json"
+    call_command("bench_rows", limit=10, repeat=2, output=str(out))
+
+    results = json.loads(out.read_text())["results"]
+    assert set(results) == {"appointments", "referrals", "notifications"}
+    for result in results.values():
+        assert result["rows"] == 10
+        assert result["drf"]["rows_per_s"] and result["row_serializer"]["queries"] >= 1
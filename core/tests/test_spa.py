@@ -0,0 +1,35 @@
+# core/tests/test_spa.py
+import re
+
+import pytest
+from django.conf import settings
+from django.test import Client
+
+from core import spa
+
+
+@pytest.fixture
+def client():
+    spa.reset_shell()
+    yield Client()
+    spa.reset_shell()
+
+
+def test_shell_served_from_memory_with_etag(client, monkeypatch):
+    res = client.get("/referrals/42/")
+    body, etag = spa.render_shell()
+    assert res.status_code == 200 and res.content == body
+    assert res["ETag"] == etag and res["Cache-Control"] == "no-cache"
+
+    # plus de rendu ni d'accès disque après le premier chargement
+    monkeypatch.setattr(spa, "render_shell", lambda: pytest.fail("coquille relue"))
+    assert client.get("/agenda/", HTTP_IF_NONE_MATCH=etag).status_code == 304
+    assert client.head("/").status_code == 200
+
+
+def test_vite_assets_are_immutable():
+    immutable = re.compile(settings.WHITENOISE_IMMUTABLE_FILE_TEST)
+    assert immutable.search("/static/assets/index-N1SOIhiG.js")
+    assert immutable.search("/static/assets/index-C0B1CZ9C.css")
+    assert not immutable.search("/static/img/clinique-logo.png")
+    assert not immutable.search("/static/index.html")
@@ -0,0 +1,79 @@
+# core/tests/test_sparse.py
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from accounts.models import Specialty, User
+from appointments.models import Appointment, Patient as AppointmentPatient
+from referrals.models import Insurance, Patient, Referral
+
+
+@pytest.fixture
+def referral(db):
+    return Referral.objects.create(
+        patient=Patient.objects.create(first_name="Omar", last_name="B", gender="male"),
+        insurance=Insurance.objects.create(insurance_provider="axa"),
+        status="accepted",
+    )
+
+
+def _get(api, url, **params):
+    with CaptureQueriesContext(connection) as ctx:
+        res = api.get(url, params)
+    assert res.status_code == 200
+    return res.json(), " ".join(q["sql"] for q in ctx.captured_queries)
+
+
+@pytest.mark.django_db
+def test_fields_keeps_only_requested_keys_without_joins(api, referral):
+    data, sql = _get(api, reverse("referrals-list"), fields="id,status,created_at")
+    assert list(data[0]) == ["id", "status", "created_at"]
+    assert "referrals_patient" not in sql and "referrals_insurance" not in sql
+
+
+@pytest.mark.django_db
+def test_expand_renders_nested_objects_on_demand(api, referral):
+    data, sql = _get(api, reverse("referrals-list"), expand="patient")
+    row = data[0]
+    assert row["patient"]["first_name"] == "Omar"
+    assert row["insurance"] == referral.insurance_id
+    assert row["status_label"]
+    assert "referrals_patient" in sql and "referrals_insurance" not in sql
+
+
+@pytest.mark.django_db
+def test_dotted_fields_prune_nested_serializers(api, referral):
+    data, _ = _get(api, reverse("referrals-list"), fields="id,patient.first_name,patient.gender_label", expand="patient")
+    assert data == [{"id": referral.id, "patient": {"first_name": "Omar", "gender_label": "Homme"}}]
+
+    collapsed, _ = _get(api, reverse("referrals-list"), fields="id,patient")
+    assert collapsed == [{"id": referral.id, "patient": referral.patient_id}]
+
+
+@pytest.mark.django_db
+def test_method_fields_and_their_joins_are_skipped(api):
+    doctor = User.objects.create_user(username="dr", first_name="Ana", role="medecin", code_personnel="M1")
+    Appointment.objects.create(
+        patient=AppointmentPatient.objects.create(first_name="Lina"), patient_name="Lina", time="09:00", doctor=doctor,
+    )
+    data, sql = _get(api, reverse("appointments-list"), fields="id,patient_name")
+    assert list(data[0]) == ["id", "patient_name"]
+    assert "accounts_user" not in sql
+
+    data, sql = _get(api, reverse("appointments-list"), fields="id,doctor_full_name")
+    assert data[0]["doctor_full_name"] == "Ana"
+    assert 'JOIN "accounts_user"' in sql
+
+
+@pytest.mark.django_db
+def test_users_specialite_collapses_unless_expanded(api):
+    spec = Specialty.objects.create(name_fr="Cardiologie", name_en="Cardiology")
+    doc = User.objects.create_user(username="dr", role="medecin", code_personnel="M1", specialite=spec)
+
+    data, _ = _get(api, reverse("users-list"), fields="id,specialite")
+    assert {"id": doc.id, "specialite": spec.id} in data
+
+    data, _ = _get(api, reverse("users-list"), fields="id,specialite", expand="specialite")
+    assert {"id": doc.id, "specialite": {"id": spec.id, "name": "Cardiologie", "name_fr": "Cardiologie",
+                                         "name_en": "Cardiology"}} in data
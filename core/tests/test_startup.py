@@ -0,0 +1,56 @@
+# core/tests/test_startup.py
+import json
+import os
+import subprocess
+import sys
+
+from django.conf import settings
+
+from core.management.commands.bench_startup import DEFERRED_MODULES
+from core.startup import STEPS, warm_up
+
+
+def test_warm_up_never_blocks_startup():
+    # sans accès à la base (base pas encore migrée…) : étape ignorée, les autres passent
+    timings = warm_up(force=True)
+    assert set(timings) == set(STEPS)
+    assert timings["refdata"] is None
+    assert timings["translations"] is not None and timings["urls"] is not None
+
+
+def test_optional_modules_are_not_imported_at_startup():
+    code = (
+        "import json, sys\n"
+        "import clinic_backend.asgi\n"
+        "from django.urls import get_resolver\n"
+        "get_resolver().url_patterns\n"
+        f"print(json.dumps([m for m in {DEFERRED_MODULES!r} if m in sys.modules]))\n"
+    )
+    env = {**os.environ, "DJANGO_SETTINGS_MODULE": "clinic_backend.settings", "STARTUP_WARMUP": "0"}
+    proc = subprocess.run([sys.executable, "-c", code], cwd=settings.BASE_DIR, env=env, capture_output=True, text=True)
+    assert proc.returncode == 0, proc.stderr
+    assert json.loads(proc.stdout.splitlines()[-1]) == []
+
+
+def test_warm_up_leaves_no_connection_pool_behind():
+    # DB_POOL=1 : le pool ouvert dans le master de gunicorn ne doit pas être hérité par les workers
+    from django.db import connections
+
+    alias = "pooled"
+    connections.settings[alias] = connections.configure_settings({
+        "default": connections.settings["default"],
+        alias: {
+            "ENGINE": "django.db.backends.postgresql", "NAME": "clinic", "HOST": "127.0.0.1", "PORT": "1",
+            "CONN_MAX_AGE": 0, "OPTIONS": {"pool": {"min_size": 1, "timeout": 1}},
+        },
+    })[alias]
+    pools = type(connections[alias])._connection_pools
+    try:
+        connections[alias].pool.open(wait=False)  # ce que fait la première connexion
+        warm_up(force=True)
+        assert alias not in pools
+    finally:
+        if alias in pools:
+            pools.pop(alias).close()
+        del connections[alias]
+        connections.settings.pop(alias)
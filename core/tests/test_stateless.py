@@ -0,0 +1,35 @@
+# core/tests/test_stateless.py
+import pytest
+from django.http import HttpResponse
+from django.test import Client
+
+from accounts.models import User
+from core.middleware import AuthenticationMiddleware, CsrfViewMiddleware, MessageMiddleware, SessionMiddleware
+
+
+def _view(request):
+    request.seen = {name: hasattr(request, name) for name in ("session", "user", "_messages")}
+    return HttpResponse()
+
+
+@pytest.mark.parametrize("path, stateful", [("/api/referrals/", False), ("/admin/", True), ("/agenda/", True)])
+def test_stateful_middlewares_skip_api(rf, path, stateful):
+    handler = SessionMiddleware(AuthenticationMiddleware(MessageMiddleware(_view)))
+    request = rf.get(path)
+    handler(request)
+    assert request.seen == {"session": stateful, "user": stateful, "_messages": stateful}
+
+    post = rf.post(path)
+    csrf = CsrfViewMiddleware(_view)
+    csrf(post)
+    rejected = csrf.process_view(post, _view, (), {})
+    assert (rejected is not None and rejected.status_code == 403) is stateful
+
+
+@pytest.mark.django_db
+def test_admin_keeps_full_stack():
+    client = Client(enforce_csrf_checks=True)
+    client.force_login(User.objects.create_superuser(username="boss", password="pw", role="direction"))
+    res = client.get("/admin/")
+    assert res.status_code == 200 and "Cookie" in res["Vary"]
+    assert client.post("/admin/logout/").status_code == 403  # CSRF toujours vérifié
@@ -0,0 +1,56 @@
+# core/tests/test_streaming.py
+import json
+
+import pytest
+from django.urls import reverse
+from django.utils import timezone
+
+from appointments.models import Patient as AppointmentPatient, Room
+from notifications.models import ArrivalNotification
+from referrals.models import Patient, Referral
+
+
+@pytest.fixture(autouse=True)
+def small_chunks(settings):
+    settings.STREAM_CHUNK_SIZE = 2
+
+
+def _body(response):
+    assert response.streaming
+    return b"".join(response.streaming_content)
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("fast", [True, False], ids=["rows", "drf"])
+def test_stream_matches_regular_list(api, settings, fast):
+    settings.FAST_LIST_SERIALIZERS = fast
+    for n in range(5):
+        Referral.objects.create(patient=Patient.objects.create(first_name="P", last_name=str(n), gender="female"))
+    url = reverse("secretary-referrals-list")
+
+    expected = api.get(url, HTTP_ACCEPT_LANGUAGE="en").json()
+    streamed = api.get(url, {"stream": "1"}, HTTP_ACCEPT_LANGUAGE="en")
+    assert streamed["Content-Type"] == "application/json"
+    assert json.loads(_body(streamed)) == expected
+    assert expected[0]["patient"]["gender_label"] == "Female"
+
+
+@pytest.mark.django_db
+def test_ndjson_and_empty_lists(api):
+    url = reverse("arrival-notifs-list")
+    assert json.loads(_body(api.get(url, {"stream": "1"}))) == []
+
+    room = Room.objects.create(name_fr="Salle 1")
+    for n in range(3):
+        ArrivalNotification.objects.create(patient=f"P{n}", appt_at=timezone.now(), room=room)
+    res = api.get(url, HTTP_ACCEPT="application/x-ndjson")
+    assert res["Content-Type"] == "application/x-ndjson"
+    lines = _body(res).decode().splitlines()
+    assert [json.loads(line) for line in lines] == api.get(url).json()
+
+
+@pytest.mark.django_db
+def test_stream_keeps_sparse_fields(api):
+    AppointmentPatient.objects.create(first_name="Lina", last_name="B")
+    res = api.get(reverse("patient-list"), {"stream": "1", "fields": "first_name"})
+    assert json.loads(_body(res)) == [{"first_name": "Lina"}]
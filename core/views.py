@@ -0,0 +1,140 @@
+# core/views.py
+from django.conf import settings
+from django.db.models import Count, Max
+from django.http import HttpResponse, HttpResponseNotModified
+from django.utils.cache import patch_vary_headers
+from django.utils.http import quote_etag
+from drf_spectacular.plumbing import set_query_parameters
+from drf_spectacular.views import SpectacularAPIView, SpectacularSwaggerView
+from rest_framework import permissions
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from accounts.serializers import PhysicianLookupSerializer, SpecialtySerializer
+from accounts.views import physician_queryset
+from appointments.serializers import AppointmentTypeSerializer, RoomSerializer
+from referrals.serializers import InterventionTypeSerializer, UrgencyLevelSerializer
+
+from . import perf, schema
+from .asyncviews import AsyncDispatchMixin, snapshot
+from .conditional import etag_matches, weak_etag
+from .i18n import get_language
+from .renderers import dumps
+
+# clé du payload → (table de référence, serializer, filtre éventuel)
+BOOTSTRAP_LOOKUPS = {
+    "rooms": ("rooms", RoomSerializer, None),
+    "appointment_types": ("appointment_types", AppointmentTypeSerializer, None),
+    "interventions": ("intervention_types", InterventionTypeSerializer, None),
+    "urgencies": ("urgency_levels", UrgencyLevelSerializer, None),
+    "specialties": ("specialties", SpecialtySerializer, lambda row: row.is_active),
+}
+
+
+class BootstrapView(AsyncDispatchMixin, APIView):
+    """
+    Tout ce dont la SPA a besoin au premier affichage, en un seul appel :
+    listes de référence et médecins visibles, dans la langue de la requête
+    (l'utilisateur courant reste servi par ``/api/accounts/auth/me/``).
+
+    Réponse versionnée par ETag, calculé avant toute sérialisation à partir
+    de la version des données de référence, de la langue, de l'utilisateur
+    et de l'agrégat des médecins (``updated_at``, nombre) : un rechargement
+    sans changement coûte un 304 et une requête. Médecins lus par l'ORM async.
+
+    Pas d'assurances ici (données personnelles) : ``/api/insurances/``.
+    """
+    permission_classes = [permissions.IsAuthenticated]
+
+    async def get(self, request):
+        refs = await snapshot()
+        user = request.user
+        physicians = physician_queryset(user)
+        state = await physicians.order_by().aaggregate(last_modified=Max("updated_at"), count=Count("pk"))
+        etag = weak_etag(
+            "bootstrap", refs.version, get_language(), user.pk, user.updated_at.isoformat(),
+            state["count"], state["last_modified"].isoformat() if state["last_modified"] else "-",
+        )
+        if etag_matches(etag, request.headers.get("If-None-Match")):
+            return self._finalize(HttpResponseNotModified(), etag)
+
+        payload = {
+            "version": refs.version,
+            "language": get_language(),
+        }
+        for key, (table, serializer_class, keep) in BOOTSTRAP_LOOKUPS.items():
+            data = refs.serialized(table, serializer_class)
+            payload[key] = [data[row.id] for row in refs.rows(table) if keep is None or keep(row)]
+        physicians = [physician async for physician in physicians]
+        payload["physicians"] = PhysicianLookupSerializer(physicians, many=True, context={"request": request}).data
+        return self._finalize(HttpResponse(dumps(payload), content_type="application/json"), etag)
+
+    def _finalize(self, response, etag):
+        response["ETag"] = etag
+        # propre à l'utilisateur : cache navigateur uniquement, revalidé à chaque chargement
+        response["Cache-Control"] = "private, no-cache"
+        patch_vary_headers(response, ("Accept-Language", "Authorization"))
+        return response
+
+
+class PerfStatsView(APIView):
+    """
+    Histogrammes de latence par vue (p50/p95/p99, ms) du process courant.
+    ``DELETE`` remet les compteurs à zéro.
+    """
+    permission_classes = [permissions.IsAdminUser]
+
+    def get(self, request):
+        data = perf.registry.snapshot()
+        data["sample_rate"] = getattr(settings, "PERF_SAMPLE_RATE", 1.0)
+        return Response(data)
+
+    def delete(self, request):
+        perf.registry.reset()
+        return Response(status=204)
+
+
+class SchemaView(SpectacularAPIView):
+    """
+    ``/api/schema/`` servi depuis les fichiers de ``build_schema`` (cf.
+    ``core/schema.py``) ; génération à la volée seulement sans build ou pour
+    une version d'API explicite.
+
+    Avec ``?v=<hash>`` (URL utilisée par ``/api/docs/``) la réponse est
+    immuable et mise en cache un an ; sans, elle est revalidée par ETag.
+    """
+
+    def _get_schema_response(self, request):
+        renderer, _media_type = self.perform_content_negotiation(request, force=True)
+        version = self.api_version or request.version or self._get_version_parameter(request)
+        found = None if version else schema.artifact(get_language(), renderer.format)
+        if found is None:
+            return super()._get_schema_response(request)
+
+        body, sha = found
+        etag = quote_etag(sha)
+        if etag_matches(etag, request.headers.get("If-None-Match")):
+            response = HttpResponseNotModified()
+        else:
+            content_type = renderer.media_type
+            if renderer.charset:
+                content_type += f"; charset={renderer.charset}"
+            response = HttpResponse(body, content_type=content_type)
+            response["Content-Disposition"] = f'inline; filename="{self._get_filename(request, None)}"'
+        response["ETag"] = etag
+        if request.GET.get("v") == sha:
+            response["Cache-Control"] = "public, max-age=31536000, immutable"
+        else:
+            response["Cache-Control"] = "public, no-cache"
+        patch_vary_headers(response, ("Accept", "Accept-Language"))
+        return response
+
+
+class DocsView(SpectacularSwaggerView):
+    """Swagger UI pointé sur l'URL versionnée du schéma précalculé (langue explicite)."""
+
+    def _get_schema_url(self, request):
+        lang = get_language()
+        url = set_query_parameters(super()._get_schema_url(request), lang=lang)
+        sha = None if request.GET.get("version") else schema.version(lang, "json")
+        return set_query_parameters(url, v=sha) if sha else url
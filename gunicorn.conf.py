@@ -0,0 +1,37 @@
+# gunicorn.conf.py
+"""
+Serveur de production : gunicorn gère les process, chaque worker uvicorn
+sert l'application ASGI (``clinic_backend.asgi``) sur sa boucle d'événements.
+
+L'application est chargée et mise en chauffe une fois dans le master
+(``preload_app``, cf. core/startup.py) puis forkée : les workers, y compris
+ceux qui remplacent un worker recyclé, acceptent le trafic à chaud.
+
+Une connexion inactive ou en long-poll (``?wait=`` des notifications) ne
+coûte qu'une coroutine : quelques workers tiennent des milliers de clients.
+Le travail synchrone (DRF, écritures) passe par le pool de threads du
+worker ; les connexions SQL ne sont pas persistantes sous ASGI (``DB_POOL=1``
+pour les réutiliser, cf. core/db.py).
+
+    gunicorn clinic_backend.asgi:application -c gunicorn.conf.py
+"""
+import multiprocessing
+import os
+
+bind = f"0.0.0.0:{os.getenv('PORT', '8000')}"
+worker_class = os.getenv("GUNICORN_WORKER_CLASS", "uvicorn_worker.UvicornWorker")
+workers = int(os.getenv("WEB_CONCURRENCY", min(2 * multiprocessing.cpu_count() + 1, 4)))
+preload_app = os.getenv("GUNICORN_PRELOAD", "1") == "1"
+
+# supérieur à LONG_POLL_MAX_WAIT : un long-poll n'est jamais coupé par le serveur
+timeout = int(os.getenv("GUNICORN_TIMEOUT", "60"))
+graceful_timeout = int(os.getenv("GUNICORN_GRACEFUL_TIMEOUT", "35"))
+keepalive = int(os.getenv("GUNICORN_KEEPALIVE", "75"))
+
+# recyclage périodique des workers (fuites mémoire éventuelles)
+max_requests = int(os.getenv("GUNICORN_MAX_REQUESTS", "5000"))
+max_requests_jitter = int(os.getenv("GUNICORN_MAX_REQUESTS_JITTER", "500"))
+
+# en-têtes X-Forwarded-* du proxy de la plateforme (SECURE_PROXY_SSL_HEADER)
+forwarded_allow_ips = os.getenv("FORWARDED_ALLOW_IPS", "*")
+accesslog = "-" if os.getenv("GUNICORN_ACCESS_LOG", "0") == "1" else None
@@ -4,10 +4,18 @@
 
 # APRES
 from django.contrib import admin
+from core.refdata import admin_label
 from .models import ArrivalNotification
 
 @admin.register(ArrivalNotification)
 class ArrivalNotificationAdmin(admin.ModelAdmin):
-    list_display = ('id', 'patient', 'doctor', "intervention_type", 'status', 'room', 'appt_at', 'created_at')
+    list_display = (
+        'id', 'patient', 'doctor',
+        admin_label("appointment_types", "intervention_type_id", "Type d’intervention"),
+        'status',
+        admin_label("rooms", "room_id", "Salle"),
+        'appt_at', 'created_at',
+    )
+    list_select_related = ('doctor',)
     list_filter = ('status', "intervention_type",)
     search_fields = ('patient', 'ref_by', 'message', 'notes')
@@ -0,0 +1,25 @@
+# Generated by Django 5.2.18 on 2026-10-19 16:09
+
+from django.db import migrations, models
+
+
+def backfill_updated_at(apps, schema_editor):
+    # lignes existantes : dernière modification inconnue, on part de la création
+    ArrivalNotification = apps.get_model("notifications", "ArrivalNotification")
+    ArrivalNotification.objects.update(updated_at=models.F("created_at"))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('notifications', '0002_remove_arrivalnotification_speciality_and_more'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='arrivalnotification',
+            name='updated_at',
+            field=models.DateTimeField(auto_now=True),
+        ),
+        migrations.RunPython(backfill_updated_at, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,27 @@
+# Generated by Django 5.2.18 on 2026-10-19 16:54
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('notifications', '0003_arrivalnotification_updated_at'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ArchivedArrivalNotification',
+            fields=[
+                ('id', models.BigIntegerField(primary_key=True, serialize=False)),
+                ('year', models.PositiveSmallIntegerField(db_index=True)),
+                ('data', models.JSONField()),
+                ('archived_at', models.DateTimeField(auto_now_add=True)),
+                ('doctor_id', models.IntegerField(db_index=True, null=True)),
+                ('patient', models.CharField(db_index=True, max_length=150)),
+            ],
+            options={
+                'abstract': False,
+            },
+        ),
+    ]
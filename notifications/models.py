@@ -2,6 +2,7 @@
 from django.db import models
 from django.contrib.auth import get_user_model
 from appointments.models import Room, AppointmentType  # ✅ importe le bon modèle
+from core.archive import ArchiveRecord
 
 User = get_user_model()
 
@@ -32,6 +33,7 @@ class ArrivalNotification(models.Model):
 
     appt_at = models.DateTimeField()
     created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
     message = models.TextField(blank=True, null=True)
     notes = models.TextField(blank=True, null=True)
     created_by = models.ForeignKey(
@@ -40,7 +42,36 @@ class ArrivalNotification(models.Model):
 
     class Meta:
         ordering = ["-created_at"]
+        # clé de partition sous PostgreSQL (core/partitions.py) : tri et fenêtres from / to
+        indexes = [models.Index(fields=["created_at"], name="arrivalnotif_created_at_idx")]
 
     def __str__(self):
         doc = f" → @{self.doctor.username}" if self.doctor_id else ""
         return f"[{self.status}] {self.patient}{doc}"
+
+
+class ArchivedArrivalNotification(ArchiveRecord):
+    """Notification d'un rendez-vous archivé (cf. ``ArchivedAppointment``)."""
+    source = "notifications.ArrivalNotification"
+    date_field = "appt_at"
+    key_fields = ("doctor_id", "patient")
+    lookups = {"patient": "patient__iexact", "doctor": "doctor_id"}
+
+    doctor_id = models.IntegerField(null=True, db_index=True)
+    patient = models.CharField(max_length=150, db_index=True)
+
+    @classmethod
+    def projected_from(cls, appointments):
+        """Notifications créées pour ces rendez-vous (même clé que appointments/signals.py)."""
+        from appointments.signals import _combine_date_time
+
+        keys = {
+            (appt.doctor_id, appt.patient_name or "—", _combine_date_time(appt.date, appt.time))
+            for appt in appointments if appt.doctor_id
+        }
+        if not keys:
+            return []
+        rows = ArrivalNotification.objects.filter(
+            doctor_id__in={key[0] for key in keys}, appt_at__in={key[2] for key in keys},
+        )
+        return [row for row in rows if (row.doctor_id, row.patient, row.appt_at) in keys]
@@ -0,0 +1,28 @@
+# notifications/rows.py
+"""Listes rapides (cf. core/rows.py) — parité avec ``ArrivalNotificationSerializer``."""
+from core.rows import RowSerializer, fmt_datetime, ref_labels
+
+
+class ArrivalNotificationRows(RowSerializer):
+    columns = (
+        "id", "status", "patient", "ref_by", "room_id", "intervention_type_id",
+        "appt_at", "created_at", "message", "notes",
+    )
+
+    def prepare(self):
+        self.room_label = ref_labels("rooms", fallback=False, empty="—")
+        self.intervention_label = ref_labels("appointment_types", fallback=False, empty="—")
+
+    def to_row(self, v):
+        return {
+            "id": v["id"],
+            "status": v["status"],
+            "patient": v["patient"],
+            "refBy": v["ref_by"],
+            "roomLabel": self.room_label(v["room_id"]),
+            "interventionLabel": self.intervention_label(v["intervention_type_id"]),
+            "apptAt": fmt_datetime(v["appt_at"]),
+            "createdAt": fmt_datetime(v["created_at"]),
+            "message": v["message"],
+            "notes": v["notes"],
+        }
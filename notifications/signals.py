@@ -1,4 +1,6 @@
 # notifications/signals.py
+import logging
+
 from django.db.models.signals import post_save
 from django.dispatch import receiver
 from django.utils import timezone
@@ -7,6 +9,8 @@ from datetime import datetime, time as dtime
 from appointments.models import Appointment
 from notifications.models import ArrivalNotification  # ton modèle réel
 
+logger = logging.getLogger(__name__)
+
 
 def _combine_date_time(d, t):
     """Combine une date et une heure en datetime timezone-aware."""
@@ -32,7 +36,7 @@ def appointment_to_arrival(sender, instance: Appointment, created, **kwargs):
 
     doctor_user = instance.doctor
     if not doctor_user:
-        print("⚠️ Aucun docteur associé → pas de notification.")
+        logger.debug("RDV %s sans médecin : pas de notification.", instance.pk)
         return
 
     # combine date + time
@@ -56,4 +60,4 @@ def appointment_to_arrival(sender, instance: Appointment, created, **kwargs):
         instance.room.status = "occupied"
         instance.room.save(update_fields=["status"])
 
-    print(f"✅ Notification créée pour {doctor_user.email} ({instance.patient_name}) à {appt_at}.")
+    logger.info("Notification d'arrivée créée pour le RDV %s (médecin %s, %s)", instance.pk, doctor_user.pk, appt_at)
@@ -1,36 +1,49 @@
+from django.utils import timezone
 from rest_framework import viewsets, status
 from rest_framework.decorators import action
 from rest_framework.response import Response
 from rest_framework.permissions import IsAuthenticated
-from django.db import models  # ✅ nécessaire pour Q(...)
+from core.asyncviews import AsyncListMixin
+from core.conditional import ConditionalGetMixin
+from core.eager import AutoEagerLoadMixin
+from core.partitions import created_range
+from core.refdata import get_snapshot
+from core.routing import ReplicaReadMixin
+from core.rows import FastListMixin
+from core.streaming import StreamingListMixin
 from .models import ArrivalNotification
+from .rows import ArrivalNotificationRows
 from .serializers import ArrivalNotificationSerializer
 
 
-class ArrivalNotificationViewSet(viewsets.ModelViewSet):
-    """Gestion des notifications d'arrivée (filtrées selon le rôle utilisateur)"""
+class ArrivalNotificationViewSet(
+    ReplicaReadMixin, AsyncListMixin, ConditionalGetMixin, AutoEagerLoadMixin,
+    StreamingListMixin, FastListMixin, viewsets.ModelViewSet,
+):
+    """
+    Gestion des notifications d'arrivée (filtrées selon le rôle utilisateur).
+    Liste en long-poll sous ASGI : ``?wait=30`` + ``If-None-Match`` ;
+    fenêtre de création ``?from=…&to=…`` (date ou date-heure ISO).
+    """
     serializer_class = ArrivalNotificationSerializer
+    row_serializer_class = ArrivalNotificationRows
     permission_classes = [IsAuthenticated]
+    long_poll = True
 
     def get_queryset(self):
         """Filtrage intelligent selon le rôle et le type d’intervention."""
-        qs = ArrivalNotification.objects.select_related(
-            "room", "doctor", "intervention_type"
-        ).order_by("-created_at")
+        # salle / type : libellés lus dans le cache des données de référence
+        qs = ArrivalNotification.objects.order_by("-created_at")
 
-        user = self.request.user
-        lang = self.request.headers.get("Accept-Language", "fr")
+        # 🔹 Fenêtre ``from`` / ``to`` (élagage des partitions mensuelles, cf. core/partitions.py)
+        qs = qs.filter(**created_range(self.request.query_params))
 
-        print(f"🟢 HEADER REÇU: {lang}")
-        print(f"🧩 Utilisateur connecté: {user.username if user.is_authenticated else 'Anonyme'}")
+        user = self.request.user
 
         # 🔹 Filtrage par type d’intervention (FR/EN)
         intervention = self.request.query_params.get("intervention_type")
         if intervention:
-            qs = qs.filter(
-                models.Q(intervention_type__name_fr__icontains=intervention)
-                | models.Q(intervention_type__name_en__icontains=intervention)
-            )
+            qs = qs.filter(intervention_type_id__in=get_snapshot().find_ids("appointment_types", intervention))
 
         # 🔹 Filtrage selon le rôle utilisateur
         if not user.is_authenticated:
@@ -48,7 +61,6 @@ class ArrivalNotificationViewSet(viewsets.ModelViewSet):
         """✅ Envoie la requête au serializer pour la gestion des langues."""
         ctx = super().get_serializer_context()
         ctx["request"] = self.request
-        print("💜 CONTEXT REQUEST:", bool(ctx["request"]))
         return ctx
 
     # ----------- ACTIONS PERSONNALISÉES -----------
@@ -58,7 +70,7 @@ class ArrivalNotificationViewSet(viewsets.ModelViewSet):
         """Marquer une notification comme 'ack' (accusé de réception)."""
         notif = self.get_object()
         notif.status = "ack"
-        notif.save(update_fields=["status"])
+        notif.save(update_fields=["status", "updated_at"])
         return Response(self.get_serializer(notif).data)
 
     @action(detail=True, methods=["patch", "post"])
@@ -66,12 +78,12 @@ class ArrivalNotificationViewSet(viewsets.ModelViewSet):
         """Marquer une notification comme 'read'."""
         notif = self.get_object()
         notif.status = "read"
-        notif.save(update_fields=["status"])
+        notif.save(update_fields=["status", "updated_at"])
         return Response(self.get_serializer(notif).data)
 
     @action(detail=False, methods=["post"])
     def mark_all_read(self, request):
         """Marquer toutes les notifications comme lues."""
         qs = self.get_queryset()
-        updated = qs.exclude(status="read").update(status="read")
+        updated = qs.exclude(status="read").update(status="read", updated_at=timezone.now())
         return Response({"updated": updated}, status=status.HTTP_200_OK)
@@ -1,4 +1,7 @@
 from django.contrib import admin
+from django.utils.translation import gettext_lazy as _
+from core.i18n import bilingual
+from core.refdata import admin_label
 from .models import Patient, Insurance, Referral, InterventionType, UrgencyLevel
 
 
@@ -33,11 +36,12 @@ class ReferralAdmin(admin.ModelAdmin):
         "id",
         "patient",
         "doctor",
-        "intervention_type",
-        "urgency_level",
+        admin_label("intervention_types", "intervention_type_id", _("Type d’intervention")),
+        admin_label("urgency_levels", "urgency_level_id", _("Niveau d’urgence")),
         "status",
         "created_at",
     )
+    list_select_related = ("patient", "doctor")
     search_fields = (
         "patient__first_name",
         "patient__last_name",
@@ -67,17 +71,11 @@ class InterventionTypeAdmin(admin.ModelAdmin):
 # =======================
 #   URGENCY LEVEL
 # =======================
-from django.utils.translation import gettext_lazy as _
-
 @admin.register(UrgencyLevel)
 class UrgencyLevelAdmin(admin.ModelAdmin):
     list_display = ("translated_name", "color", "priority")
 
     def translated_name(self, obj):
-        from django.utils import translation
-        lang = translation.get_language() or "fr"
-        if lang.startswith("en") and obj.name_en:
-            return obj.name_en
-        return obj.name_fr or obj.name_en
+        return bilingual(obj)
 
     translated_name.short_description = _("Nom")
@@ -0,0 +1,39 @@
+# Generated by Django 5.2.18 on 2026-10-19 16:54
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('referrals', '0003_remove_urgencylevel_name_urgencylevel_name_en_and_more'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ArchivedReferral',
+            fields=[
+                ('id', models.BigIntegerField(primary_key=True, serialize=False)),
+                ('year', models.PositiveSmallIntegerField(db_index=True)),
+                ('data', models.JSONField()),
+                ('archived_at', models.DateTimeField(auto_now_add=True)),
+                ('patient_id', models.IntegerField(db_index=True, null=True)),
+                ('doctor_id', models.IntegerField(db_index=True, null=True)),
+                ('status', models.CharField(max_length=20)),
+            ],
+            options={
+                'verbose_name': 'Référence archivée',
+                'verbose_name_plural': 'Références archivées',
+            },
+        ),
+        migrations.CreateModel(
+            name='ArchivedSecretaryReferral',
+            fields=[
+                ('id', models.BigIntegerField(primary_key=True, serialize=False)),
+                ('year', models.PositiveSmallIntegerField(db_index=True)),
+                ('data', models.JSONField()),
+                ('archived_at', models.DateTimeField(auto_now_add=True)),
+                ('patient', models.CharField(db_index=True, max_length=100)),
+            ],
+        ),
+    ]
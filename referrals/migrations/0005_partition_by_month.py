@@ -0,0 +1,21 @@
+# Generated by Django 5.2.18 on 2026-10-19 16:58
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('referrals', '0004_archive'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='referral',
+            index=models.Index(fields=['created_at'], name='referral_created_at_idx'),
+        ),
+        # pas de conversion de la table ici : « manage.py partitions --convert »
+        # (PostgreSQL, DB_PARTITIONING=1), cf. core/partitions.py
+    ]
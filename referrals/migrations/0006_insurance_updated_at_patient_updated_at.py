@@ -0,0 +1,23 @@
+# Generated by Django 5.2.18 on 2026-10-19 17:08
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('referrals', '0005_partition_by_month'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='insurance',
+            name='updated_at',
+            field=models.DateTimeField(auto_now=True, verbose_name='Dernière mise à jour'),
+        ),
+        migrations.AddField(
+            model_name='patient',
+            name='updated_at',
+            field=models.DateTimeField(auto_now=True, verbose_name='Dernière mise à jour'),
+        ),
+    ]
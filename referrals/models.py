@@ -2,6 +2,8 @@ from django.conf import settings
 from django.db import models
 from django.utils.translation import gettext_lazy as _
 
+from core.archive import ArchiveRecord
+
 
 # =======================
 #   PATIENT
@@ -23,6 +25,7 @@ class Patient(models.Model):
     address = models.CharField(_("Adresse"), max_length=255, blank=True)
     city = models.CharField(_("Ville"), max_length=120, blank=True)
     postal_code = models.CharField(_("Code postal"), max_length=30, blank=True)
+    updated_at = models.DateTimeField(_("Dernière mise à jour"), auto_now=True)
 
     class Meta:
         verbose_name = _("Patient")
@@ -50,6 +53,7 @@ class Insurance(models.Model):
     expiration_date = models.DateField(_("Date d'expiration"), null=True, blank=True)
     holder_name = models.CharField(_("Titulaire"), max_length=120, blank=True)
     insurance_notes = models.TextField(_("Notes"), blank=True)
+    updated_at = models.DateTimeField(_("Dernière mise à jour"), auto_now=True)
 
     class Meta:
         verbose_name = _("Assurance")
@@ -176,8 +180,33 @@ class Referral(models.Model):
 
     class Meta:
         ordering = ("-created_at",)
+        # clé de partition sous PostgreSQL (core/partitions.py) : tri et fenêtres from / to
+        indexes = [models.Index(fields=["created_at"], name="referral_created_at_idx")]
         verbose_name = _("Référence")
         verbose_name_plural = _("Références")
 
     def __str__(self):
         return f"Référence #{self.pk} — {self.patient or 'N/A'} ({self.get_status_display()})"
+
+
+class ArchivedReferral(ArchiveRecord):
+    """Référence close (arrivée / rejetée) archivée avec sa ligne secrétariat, cf. core/archive.py."""
+    source = "referrals.Referral"
+    date_field = "created_at"
+    archive_when = {"status__in": (Referral.Status.ARRIVED, Referral.Status.REJECTED)}
+    key_fields = ("patient_id", "doctor_id", "status")
+    lookups = {"patient": "patient_id", "doctor": "doctor_id", "status": "status"}
+
+    patient_id = models.IntegerField(null=True, db_index=True)
+    doctor_id = models.IntegerField(null=True, db_index=True)
+    status = models.CharField(max_length=20)
+
+    class Meta:
+        verbose_name = _("Référence archivée")
+        verbose_name_plural = _("Références archivées")
+
+    @classmethod
+    def projections(cls, objs):
+        from .models_secretary import ArchivedSecretaryReferral
+
+        return [(ArchivedSecretaryReferral, ArchivedSecretaryReferral.projected_from(objs))]
@@ -1,5 +1,8 @@
 # referrals/models_secretary.py
 from django.db import models
+from django.db.models import prefetch_related_objects
+
+from core.archive import ArchiveRecord
 
 class SecretaryReferral(models.Model):
     STATUT_CHOICES = [
@@ -38,3 +41,25 @@ class SecretaryReferral(models.Model):
         return f"{self.patient} — {self.medecin}"
 
 
+class ArchivedSecretaryReferral(ArchiveRecord):
+    """Ligne secrétariat archivée : close (terminée / annulée) ou projection d'une référence archivée."""
+    source = "referrals.SecretaryReferral"
+    date_field = "date"
+    archive_when = {"statut__in": ("Terminé", "Annulé")}
+    key_fields = ("patient",)
+    lookups = {"patient": "patient__iexact"}
+
+    patient = models.CharField(max_length=100, db_index=True)
+
+    class Meta:
+        app_label = "referrals"
+
+    @classmethod
+    def projected_from(cls, referrals):
+        """Lignes synchronisées depuis ces références (même clé que referrals/signals.py)."""
+        from .signals import secretary_key
+
+        prefetch_related_objects(referrals, "patient")
+        keys = {secretary_key(ref) for ref in referrals}
+        rows = SecretaryReferral.objects.filter(date__in={ref.created_at for ref in referrals})
+        return [row for row in rows if (row.patient, row.medecin, row.date) in keys]
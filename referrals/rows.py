@@ -0,0 +1,86 @@
+# referrals/rows.py
+"""Listes rapides (cf. core/rows.py) — parité avec ``ReferralSerializer``."""
+from core.rows import RowSerializer, choice_labels, fmt_date, fmt_datetime, ref_labels, ref_objects, related_columns
+
+from .models import Referral
+from .serializers import GENDER_LABELS, InterventionTypeSerializer, UrgencyLevelSerializer
+
+PATIENT_FIELDS = (
+    "first_name", "last_name", "birth_date", "gender", "phone", "email", "address", "city", "postal_code",
+)
+INSURANCE_FIELDS = (
+    "insurance_provider", "insurance_policy_number", "coverage_type",
+    "expiration_date", "holder_name", "insurance_notes",
+)
+
+
+class ReferralRows(RowSerializer):
+    columns = (
+        "id", "status", "created_at", "updated_at", "room_number",
+        "intervention_type_id", "urgency_level_id",
+        "consultation_reason", "medical_history", "referring_doctor", "establishment",
+        "physician", "target_specialty", "notes",
+        "patient_id", *related_columns("patient", PATIENT_FIELDS),
+        "insurance_id", *related_columns("insurance", INSURANCE_FIELDS),
+    )
+
+    def prepare(self):
+        self.status_label = choice_labels(Referral, "status")
+        self.intervention = ref_objects("intervention_types", InterventionTypeSerializer)
+        self.urgency = ref_objects("urgency_levels", UrgencyLevelSerializer)
+        self.intervention_label = ref_labels("intervention_types")
+        self.urgency_label = ref_labels("urgency_levels")
+        self.gender_labels = GENDER_LABELS
+
+    def to_row(self, v):
+        patient = None
+        if v["patient_id"] is not None:
+            gender = v["patient__gender"]
+            patient = {
+                "id": v["patient_id"],
+                "first_name": v["patient__first_name"],
+                "last_name": v["patient__last_name"],
+                "birth_date": fmt_date(v["patient__birth_date"]),
+                "gender": gender,
+                "gender_label": None if gender is None else self.gender_labels.get(gender),
+                "phone": v["patient__phone"],
+                "email": v["patient__email"],
+                "address": v["patient__address"],
+                "city": v["patient__city"],
+                "postal_code": v["patient__postal_code"],
+            }
+
+        insurance = None
+        if v["insurance_id"] is not None:
+            insurance = {
+                "id": v["insurance_id"],
+                "insurance_provider": v["insurance__insurance_provider"],
+                "insurance_policy_number": v["insurance__insurance_policy_number"],
+                "coverage_type": v["insurance__coverage_type"],
+                "expiration_date": fmt_date(v["insurance__expiration_date"]),
+                "holder_name": v["insurance__holder_name"],
+                "insurance_notes": v["insurance__insurance_notes"],
+            }
+
+        intervention_id, urgency_id = v["intervention_type_id"], v["urgency_level_id"]
+        return {
+            "id": v["id"],
+            "status": v["status"],
+            "status_label": self.status_label(v["status"]),
+            "created_at": fmt_datetime(v["created_at"]),
+            "updated_at": fmt_datetime(v["updated_at"]),
+            "room_number": v["room_number"],
+            "intervention_type": self.intervention(intervention_id),
+            "intervention_label": self.intervention_label(intervention_id),
+            "urgency_level": self.urgency(urgency_id),
+            "urgency_label": self.urgency_label(urgency_id),
+            "consultation_reason": v["consultation_reason"],
+            "medical_history": v["medical_history"],
+            "referring_doctor": v["referring_doctor"],
+            "establishment": v["establishment"],
+            "physician": v["physician"],
+            "target_specialty": v["target_specialty"],
+            "notes": v["notes"],
+            "patient": patient,
+            "insurance": insurance,
+        }
@@ -1,10 +1,19 @@
 from datetime import datetime, date
 from rest_framework import serializers
-from django.utils import translation
 from django.utils.translation import gettext_lazy as _
+from core.i18n import BilingualField, ChoiceLabelField, LabelTable
+from core.refdata import RefDataField, RefLabelField, get_snapshot
+from core.sparse import SparseFieldsMixin
 from .models import Referral, Patient, Insurance, InterventionType, UrgencyLevel
 
 
+GENDER_LABELS = LabelTable({
+    "male": ("Homme", "Male"),
+    "female": ("Femme", "Female"),
+    "other": ("Autre", "Other"),
+}, default="")
+
+
 # ============================================================
 # 🔹 Champ date tolérant
 # ============================================================
@@ -36,8 +45,8 @@ class FlexibleDateField(serializers.DateField):
 # ============================================================
 # 🔹 SERIALIZERS DE BASE
 # ============================================================
-class PatientSerializer(serializers.ModelSerializer):
-    gender_label = serializers.SerializerMethodField()
+class PatientSerializer(SparseFieldsMixin, serializers.ModelSerializer):
+    gender_label = ChoiceLabelField(GENDER_LABELS, source="gender")
 
     class Meta:
         model = Patient
@@ -46,19 +55,8 @@ class PatientSerializer(serializers.ModelSerializer):
             "gender_label", "phone", "email", "address", "city", "postal_code",
         ]
 
-    def get_gender_label(self, obj):
-        request = self.context.get("request")
-        lang = getattr(request, "LANGUAGE_CODE", None) or request.headers.get("Accept-Language", "fr")
-
-        if str(lang).startswith("en"):
-            mapping = {"male": "Male", "female": "Female", "other": "Other"}
-        else:
-            mapping = {"male": "Homme", "female": "Femme", "other": "Autre"}
-
-        return mapping.get(obj.gender, "")
-
 
-class InsuranceSerializer(serializers.ModelSerializer):
+class InsuranceSerializer(SparseFieldsMixin, serializers.ModelSerializer):
     class Meta:
         model = Insurance
         fields = [
@@ -70,60 +68,36 @@ class InsuranceSerializer(serializers.ModelSerializer):
 # ============================================================
 # 🔹 INTERVENTION TYPE (multi-langue)
 # ============================================================
-class InterventionTypeSerializer(serializers.ModelSerializer):
-    name = serializers.SerializerMethodField()
-    description = serializers.SerializerMethodField()
+class InterventionTypeSerializer(SparseFieldsMixin, serializers.ModelSerializer):
+    name = BilingualField()
+    description = BilingualField(field="description")
 
     class Meta:
         model = InterventionType
         fields = ["id", "name", "description"]
 
-    def get_name(self, obj):
-        request = self.context.get("request")
-        lang = getattr(request, "LANGUAGE_CODE", None) or request.headers.get("Accept-Language", "fr")
-
-        if str(lang).startswith("en"):
-            return obj.name_en or obj.name_fr or ""
-        return obj.name_fr or obj.name_en or ""
-
-    def get_description(self, obj):
-        request = self.context.get("request")
-        lang = getattr(request, "LANGUAGE_CODE", None) or request.headers.get("Accept-Language", "fr")
-
-        if str(lang).startswith("en"):
-            return obj.description_en or obj.description_fr or ""
-        return obj.description_fr or obj.description_en or ""
-
 
 # ============================================================
 # 🔹 URGENCY LEVEL
 # ============================================================
-class UrgencyLevelSerializer(serializers.ModelSerializer):
-    name = serializers.SerializerMethodField()
+class UrgencyLevelSerializer(SparseFieldsMixin, serializers.ModelSerializer):
+    name = BilingualField()
 
     class Meta:
         model = UrgencyLevel
         fields = ["id", "name", "color", "priority"]
 
-    def get_name(self, obj):
-        request = self.context.get("request")
-        lang = getattr(request, "LANGUAGE_CODE", None) or request.headers.get("Accept-Language", "fr")
-
-        if str(lang).startswith("en") and obj.name_en:
-            return obj.name_en
-        return obj.name_fr or obj.name_en or ""
-
 
 # ============================================================
 # 🔹 REFERRAL SERIALIZER (lecture)
 # ============================================================
-class ReferralSerializer(serializers.ModelSerializer):
+class ReferralSerializer(SparseFieldsMixin, serializers.ModelSerializer):
     patient = PatientSerializer()
     insurance = InsuranceSerializer(allow_null=True)
-    intervention_type = InterventionTypeSerializer()
-    urgency_level = UrgencyLevelSerializer()
-    intervention_label = serializers.SerializerMethodField()
-    urgency_label = serializers.SerializerMethodField()
+    intervention_type = RefDataField("intervention_types", InterventionTypeSerializer, source="intervention_type_id")
+    urgency_level = RefDataField("urgency_levels", UrgencyLevelSerializer, source="urgency_level_id")
+    intervention_label = RefLabelField("intervention_types", source="intervention_type_id")
+    urgency_label = RefLabelField("urgency_levels", source="urgency_level_id")
     status_label = serializers.SerializerMethodField()
 
     class Meta:
@@ -137,30 +111,47 @@ class ReferralSerializer(serializers.ModelSerializer):
             "physician", "target_specialty", "notes",
             "patient", "insurance",
         ]
+        # objets rendus en entier seulement avec ?expand= (cf. core/sparse.py)
+        expandable = {
+            "patient": "patient_id",
+            "insurance": "insurance_id",
+            "intervention_type": "intervention_type_id",
+            "urgency_level": "urgency_level_id",
+        }
 
     def get_status_label(self, obj):
         return obj.get_status_display()
 
-    def get_intervention_label(self, obj):
-        if not obj.intervention_type:
-            return ""
-        lang = translation.get_language() or "fr"
-        if lang.startswith("en"):
-            return getattr(obj.intervention_type, "name_en", None) or getattr(obj.intervention_type, "name_fr", "")
-        return getattr(obj.intervention_type, "name_fr", None) or getattr(obj.intervention_type, "name_en", "")
-
-    def get_urgency_label(self, obj):
-        if not obj.urgency_level:
-            return ""
-        lang = translation.get_language() or "fr"
-        if lang.startswith("en"):
-            return getattr(obj.urgency_level, "name_en", None) or getattr(obj.urgency_level, "name_fr", "")
-        return getattr(obj.urgency_level, "name_fr", None) or getattr(obj.urgency_level, "name_en", "")
-
 
 # ============================================================
 # 🔹 REFERRAL SERIALIZER (création)
 # ============================================================
+_REFERENCE_MODELS = {"intervention_types": InterventionType, "urgency_levels": UrgencyLevel}
+
+
+def _resolve_reference(refs, table, value):
+    """
+    Ligne de référence désignée par son id ou son nom (FR/EN, insensible à la casse).
+    Absente du snapshot (copie pas encore rechargée) : relue en base.
+    """
+    if value is None:
+        return None
+    value = str(value)
+    model = _REFERENCE_MODELS[table]
+    if value.isdigit():
+        return refs.get(table, int(value)) or model.objects.filter(pk=int(value)).first()
+    needle = value.lower()
+    for field in ("name_fr", "name_en"):
+        for row in refs.rows(table):
+            if (getattr(row, field) or "").lower() == needle:
+                return row
+    for field in ("name_fr", "name_en"):
+        row = model.objects.filter(**{f"{field}__iexact": value}).first()
+        if row is not None:
+            return row
+    return None
+
+
 class ReferralCreateSerializer(serializers.Serializer):
     first_name = serializers.CharField()
     last_name = serializers.CharField()
@@ -194,33 +185,10 @@ class ReferralCreateSerializer(serializers.Serializer):
         iv_val = validated_data.get("intervention_type")
         ug_val = validated_data.get("urgency_level")
 
-        # ✅ Recherche intervention multi-langue
-        intervention = None
-        for field in ["id", "name_fr", "name_en"]:
-            try:
-                if field == "id" and str(iv_val).isdigit():
-                    intervention = InterventionType.objects.get(id=int(iv_val))
-                    break
-                elif field != "id":
-                    intervention = InterventionType.objects.filter(**{f"{field}__iexact": iv_val}).first()
-                    if intervention:
-                        break
-            except InterventionType.DoesNotExist:
-                pass
-
-        # ✅ Recherche urgence multi-langue
-        urgency = None
-        for field in ["id", "name_fr", "name_en"]:
-            try:
-                if field == "id" and str(ug_val).isdigit():
-                    urgency = UrgencyLevel.objects.get(id=int(ug_val))
-                    break
-                elif field != "id":
-                    urgency = UrgencyLevel.objects.filter(**{f"{field}__iexact": ug_val}).first()
-                    if urgency:
-                        break
-            except UrgencyLevel.DoesNotExist:
-                pass
+        # ✅ Recherche intervention / urgence multi-langue (id, nom FR, nom EN) dans le cache
+        refs = get_snapshot()
+        intervention = _resolve_reference(refs, "intervention_types", iv_val)
+        urgency = _resolve_reference(refs, "urgency_levels", ug_val)
 
         # ✅ Création du patient
         patient, _ = Patient.objects.get_or_create(
@@ -260,8 +228,8 @@ class ReferralCreateSerializer(serializers.Serializer):
             patient=patient,
             insurance=insurance,
             doctor=user if (user and getattr(user, "is_authenticated", False)) else None,
-            intervention_type=intervention,
-            urgency_level=urgency,
+            intervention_type_id=getattr(intervention, "id", None),
+            urgency_level_id=getattr(urgency, "id", None),
             consultation_reason=validated_data.get("consultation_reason", ""),
             medical_history=validated_data.get("medical_history", ""),
             referring_doctor=validated_data.get("referring_doctor", ""),
@@ -1,5 +1,7 @@
 from django.db.models.signals import post_save, post_delete
 from django.dispatch import receiver
+
+from core import archive
 from .models import Referral
 from .models_secretary import SecretaryReferral
 
@@ -128,10 +130,14 @@ def referral_to_secretary(sender, instance: Referral, created, **kwargs):
         ).update(**defaults)
 
 
+def secretary_key(ref: Referral):
+    """``(patient, medecin, date)`` de la ligne SecretaryReferral d'une référence."""
+    return _build_patient_full_name(ref), _build_physician(ref), ref.created_at
+
+
 @receiver(post_delete, sender=Referral)
 def referral_delete_secretary(sender, instance: Referral, **kwargs):
-    SecretaryReferral.objects.filter(
-        patient=_build_patient_full_name(instance),
-        medecin=_build_physician(instance),
-        date=_date_iso(instance),
-    ).delete()
+    if archive.in_progress():
+        return  # ligne secrétariat déjà déplacée avec la référence
+    patient, medecin, _ = secretary_key(instance)
+    SecretaryReferral.objects.filter(patient=patient, medecin=medecin, date=_date_iso(instance)).delete()
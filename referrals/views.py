@@ -1,5 +1,5 @@
-from django.utils import translation
-from django.utils.dateparse import parse_datetime
+import logging
+
 from django.db.models import Count
 from django.db.models.functions import TruncDate
 from django_filters.rest_framework import DjangoFilterBackend
@@ -9,7 +9,7 @@ from rest_framework.response import Response
 from rest_framework.views import APIView
 from rest_framework.permissions import AllowAny
 
-from .models import Referral, InterventionType, UrgencyLevel, Insurance
+from .models import ArchivedReferral, Referral, InterventionType, UrgencyLevel, Insurance
 from .serializers import (
     ReferralSerializer,
     ReferralCreateSerializer,
@@ -18,7 +18,18 @@ from .serializers import (
     UrgencyLevelSerializer,
 )
 from appointments.models import Appointment
-
+from core.archive import ArchiveReadMixin
+from core.asyncviews import AsyncDispatchMixin, snapshot
+from core.conditional import ConditionalGetMixin
+from core.eager import AutoEagerLoadMixin
+from core.partitions import created_range
+from core.refdata import RefDataListMixin
+from core.routing import ReplicaReadMixin
+from core.rows import FastListMixin
+from core.streaming import StreamingListMixin
+from .rows import ReferralRows
+
+logger = logging.getLogger(__name__)
 
 # ======================================================
 #   PERMISSIONS PERSONNALISÉES
@@ -29,7 +40,6 @@ class IsMedecin(permissions.BasePermission):
     def has_permission(self, request, view):
         user = request.user
         role = getattr(user, "role", "").upper()
-        print(f"🩺 [IsMedecin] user={user} role={role}")
         return bool(user and user.is_authenticated and role == "MEDECIN")
 
 
@@ -52,7 +62,7 @@ class IsDirectionOrSecretaire(permissions.BasePermission):
 #   VIEWSET: INSURANCE
 # ======================================================
 
-class InsuranceViewSet(viewsets.ReadOnlyModelViewSet):
+class InsuranceViewSet(StreamingListMixin, viewsets.ReadOnlyModelViewSet):
     queryset = Insurance.objects.all().order_by("id")
     serializer_class = InsuranceSerializer
     permission_classes = [permissions.AllowAny]
@@ -62,28 +72,31 @@ class InsuranceViewSet(viewsets.ReadOnlyModelViewSet):
 #   VIEWSET: REFERRALS
 # ======================================================
 
-class ReferralViewSet(viewsets.ModelViewSet):
+class ReferralViewSet(
+    ReplicaReadMixin, ArchiveReadMixin, ConditionalGetMixin, AutoEagerLoadMixin,
+    StreamingListMixin, FastListMixin, viewsets.ModelViewSet,
+):
     queryset = Referral.objects.all()
+    archive_model = ArchivedReferral
     serializer_class = ReferralSerializer
+    row_serializer_class = ReferralRows
+    validator_relations = ("patient", "insurance")
 
     def get_serializer_class(self):
         return ReferralCreateSerializer if self.action == "create" else ReferralSerializer
 
     def create(self, request, *args, **kwargs):
-        print("🩺 [CREATE] user=", request.user)
         serializer = self.get_serializer(data=request.data, context={"request": request})
         if not serializer.is_valid():
-            print("❌ Erreurs de validation :", serializer.errors)
+            logger.info("Référence refusée (user=%s) : %s", request.user.pk, serializer.errors)
             return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
 
         try:
             instance = serializer.save()
-            print(f"✅ Référence créée ID={instance.id}")
+            logger.info("Référence créée id=%s (user=%s)", instance.id, request.user.pk)
             return Response(ReferralSerializer(instance, context={"request": request}).data, status=201)
         except Exception as e:
-            import traceback
-            print("🔥 ERREUR CREATE REFERRAL:")
-            traceback.print_exc()
+            logger.exception("Échec de création de référence (user=%s)", request.user.pk)
             return Response({"error": str(e)}, status=500)
 
 
@@ -91,22 +104,13 @@ class ReferralViewSet(viewsets.ModelViewSet):
 #   VIEW: REFERRAL STATS
 # ======================================================
 
-class ReferralStatsView(APIView):
+class ReferralStatsView(ReplicaReadMixin, AsyncDispatchMixin, APIView):
+    """Tableau de bord des références, calculé par l'ORM async (vue ASGI)."""
     permission_classes = [AllowAny]
 
-    def get(self, request, *args, **kwargs):
-        from_param = request.GET.get("from")
-        to_param = request.GET.get("to")
-
-        qs = Referral.objects.all()
-        if from_param:
-            start = parse_datetime(from_param)
-            if start:
-                qs = qs.filter(created_at__gte=start)
-        if to_param:
-            end = parse_datetime(to_param)
-            if end:
-                qs = qs.filter(created_at__lte=end)
+    async def get(self, request, *args, **kwargs):
+        # bornes directes sur created_at : index et élagage des partitions mensuelles
+        qs = Referral.objects.filter(**created_range(request.GET))
 
         # Séries temporelles (date, referrals)
         daily = (
@@ -115,45 +119,55 @@ class ReferralStatsView(APIView):
             .annotate(referrals=Count("id"))
             .order_by("day")
         )
-        series = [{"date": d["day"].isoformat(), "referrals": d["referrals"], "confirmed": 0} for d in daily]
+        series = [{"date": d["day"].isoformat(), "referrals": d["referrals"], "confirmed": 0} async for d in daily]
 
         # Par médecin
         by_doctor = [
             {"name": d["doctor__username"] or "—", "value": d["count"]}
-            for d in qs.values("doctor__username").annotate(count=Count("id"))
+            async for d in qs.values("doctor__username").annotate(count=Count("id"))
         ]
 
-        # Par spécialité (intervention)
+        # Par spécialité (intervention) — noms lus dans le cache de référence, sans jointure
+        refs = await snapshot()
+
+        def specialty_name(pk):
+            return getattr(refs.get("intervention_types", pk), "name_fr", None)
+
         by_specialty = [
-            {"name": s["intervention_type__name_fr"] or "Non défini", "value": s["count"]}
-            for s in qs.values("intervention_type__name_fr").annotate(count=Count("id"))
+            {"name": specialty_name(s["intervention_type_id"]) or "Non défini", "value": s["count"]}
+            async for s in qs.values("intervention_type_id").annotate(count=Count("id"))
         ]
 
         # Par assurance
         by_insurance = [
             {"name": s["insurance__insurance_provider"] or "—", "value": s["count"]}
-            for s in qs.values("insurance__insurance_provider").annotate(count=Count("id"))
+            async for s in qs.values("insurance__insurance_provider").annotate(count=Count("id"))
         ]
 
         # Funnel
         funnel = {
-            "referrals": qs.count(),
-            "appointments": Appointment.objects.count(),
-            "arrived": qs.filter(status="arrived").count(),
+            "referrals": await qs.acount(),
+            "appointments": await Appointment.objects.acount(),
+            "arrived": await qs.filter(status="arrived").acount(),
         }
 
         facets = {
-            "doctors": list(qs.exclude(doctor__username=None).values_list("doctor__username", flat=True).distinct()),
-            "specialties": list(
-                qs.exclude(intervention_type__name_fr=None)
-                .values_list("intervention_type__name_fr", flat=True)
+            "doctors": [
+                name async for name in
+                qs.exclude(doctor__username=None).values_list("doctor__username", flat=True).distinct()
+            ],
+            "specialties": [
+                specialty_name(pk)
+                async for pk in qs.exclude(intervention_type=None)
+                .values_list("intervention_type_id", flat=True)
                 .distinct()
-            ),
-            "insurances": list(
+            ],
+            "insurances": [
+                name async for name in
                 qs.exclude(insurance__insurance_provider=None)
                 .values_list("insurance__insurance_provider", flat=True)
                 .distinct()
-            ),
+            ],
         }
 
         return Response({
@@ -168,35 +182,18 @@ class ReferralStatsView(APIView):
 
 # ======================================================
 #   VIEWSETS MULTI-LANGUE
+#   (langue résolue par core.middleware.RequestLanguageMiddleware)
 # ======================================================
 
-from django.utils import translation
-
-class InterventionTypeViewSet(viewsets.ReadOnlyModelViewSet):
+class InterventionTypeViewSet(RefDataListMixin, viewsets.ReadOnlyModelViewSet):
     queryset = InterventionType.objects.all().order_by("name_fr")
     serializer_class = InterventionTypeSerializer
-
-    def list(self, request, *args, **kwargs):
-        lang = request.GET.get("lang") or request.headers.get("Accept-Language") or "fr"
-        translation.activate(lang)
-        # 👇 transmet la langue au serializer
-        serializer = self.get_serializer(self.get_queryset(), many=True, context={"lang": lang})
-        return Response(serializer.data)
-
+    refdata_table = "intervention_types"
 
 
-class UrgencyLevelViewSet(viewsets.ReadOnlyModelViewSet):
+class UrgencyLevelViewSet(RefDataListMixin, viewsets.ReadOnlyModelViewSet):
     """Retourne les niveaux d’urgence traduits."""
     queryset = UrgencyLevel.objects.all().order_by("priority")
     serializer_class = UrgencyLevelSerializer
     permission_classes = [AllowAny]
-
-    def get_serializer_context(self):
-        context = super().get_serializer_context()
-        context["request"] = self.request
-        return context
-
-    def list(self, request, *args, **kwargs):
-        lang = request.headers.get("Accept-Language") or request.GET.get("lang", "fr")
-        translation.activate(lang)
-        return super().list(request, *args, **kwargs)
+    refdata_table = "urgency_levels"
@@ -1,16 +1,20 @@
 # referrals/views_lookup.py
 from rest_framework import generics
+from core.eager import AutoEagerLoadMixin
+from core.refdata import RefDataListMixin
+from core.streaming import StreamingListMixin
 from .models import Patient, InterventionType, Insurance
 from .serializers import PatientSerializer, InterventionTypeSerializer, InsuranceSerializer
 
-class PatientListView(generics.ListAPIView):
+class PatientListView(AutoEagerLoadMixin, StreamingListMixin, generics.ListAPIView):
     queryset = Patient.objects.all()
     serializer_class = PatientSerializer
 
-class InterventionTypeListView(generics.ListAPIView):
-    queryset = InterventionType.objects.all()
+class InterventionTypeListView(RefDataListMixin, generics.ListAPIView):
+    queryset = InterventionType.objects.all().order_by("name_fr")
     serializer_class = InterventionTypeSerializer
+    refdata_table = "intervention_types"
 
-class InsuranceListView(generics.ListAPIView):
+class InsuranceListView(StreamingListMixin, generics.ListAPIView):
     queryset = Insurance.objects.all()
     serializer_class = InsuranceSerializer
